@@ -0,0 +1,54 @@
+"""Benchmark: rendering every Epic chart of a report, serial vs. process pool.
+
+Run with ``python benchmarks/bench_charts.py [epics]``.  The pool is
+started (and warmed) before timing, as it is by the app during the Jira
+fetch.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from epic_report_generator.core import chart_generator
+from epic_report_generator.core.data_models import EpicMetrics
+
+
+def _metrics(days: int) -> EpicMetrics:
+    start = date.today() - timedelta(days=days)
+    return EpicMetrics(
+        dates=[start + timedelta(days=i) for i in range(days)],
+        total_sp_over_time=[float(40 + i // 3) for i in range(days)],
+        completed_sp_over_time=[float(i // 4) for i in range(days)],
+        cumulative_issues=[10 + i // 5 for i in range(days)],
+        cumulative_unestimated=[i // 20 for i in range(days)],
+    )
+
+
+def main(epics: int = 50) -> None:
+    metrics = [_metrics(90 + 7 * i) for i in range(epics)]
+
+    with patch.object(chart_generator, "_POOL_WORKERS", 1):
+        start = time.perf_counter()
+        serial = chart_generator.render_charts(metrics)
+        slow = time.perf_counter() - start
+
+    workers = chart_generator._POOL_WORKERS
+    chart_generator.warm_up_pool()
+    chart_generator.render_charts(metrics[:workers])  # wait for every worker
+    start = time.perf_counter()
+    pooled = chart_generator.render_charts(metrics)
+    fast = time.perf_counter() - start
+    chart_generator.shutdown_pool()
+
+    assert len(serial) == len(pooled) and all(pooled)
+    print(f"{epics} charts on {os.cpu_count()} CPU(s), {workers} worker(s)")
+    print(f"  serial: {slow:7.2f} s")
+    print(f"  pool  : {fast:7.2f} s  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
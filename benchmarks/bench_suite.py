@@ -0,0 +1,211 @@
+"""Benchmark suite: the report pipeline on synthetic Epics of growing size.
+
+Run with ``python benchmarks/bench_suite.py``.  Times fetching an Epic
+from the local :mod:`mock_jira` server with the real ``JiraClient``, child
+decoding, ``calculate_metrics``, ``generate_epic_chart`` and
+``generate_pdf`` for Epics with 10, 1,000 and 10,000 children (see
+``--scales``), measures the memory the decoded children keep alive, and
+writes the results as JSON to ``benchmarks/results/`` (or ``--output``).
+Pass ``--compare`` with an earlier results file to print the change per
+case and exit non-zero if anything got slower or bigger than
+``--threshold``.
+
+The synthetic Epics come from :mod:`synthetic`, seeded so that every run
+times the same data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from mock_jira import MockJiraServer
+from synthetic import EPIC_LINK_FIELD, SP_FIELD, synthetic_epic, synthetic_raw_children
+
+from epic_report_generator.core.chart_generator import generate_epic_chart, shutdown_pool
+from epic_report_generator.core.data_models import ReportConfig, ReportData
+from epic_report_generator.core.jira_client import JiraClient, _IssueDecoder
+from epic_report_generator.core.metrics import calculate_metrics
+from epic_report_generator.core.pdf_generator import generate_pdf
+from epic_report_generator.core.rate_limiter import RateLimiter
+
+_RESULTS_DIR = Path(__file__).parent / "results"
+_DEFAULT_SCALES = (10, 1_000, 10_000)
+_MIN_TIME = 1.0  # keep repeating a case until it has run this long…
+_MAX_RUNS = 1000  # …or this many times
+_YEARS = 3.0
+
+
+def _cases(children: int, stack: ExitStack) -> dict[str, Callable[[], object]]:
+    """Return the timed callables for an Epic with *children* children.
+
+    Resources the callables need (the mock Jira server) are registered
+    with *stack*.
+    """
+    raw = synthetic_raw_children(children, years=_YEARS)
+    epic = synthetic_epic(children, years=_YEARS)
+    metrics = calculate_metrics(epic)
+    decode = _IssueDecoder(SP_FIELD, EPIC_LINK_FIELD)
+    report = ReportData(
+        config=ReportConfig(project_key="BENCH", epic_keys=[epic.key], title="Benchmark"),
+        epics=[epic], metrics=[metrics],
+    )
+    server = stack.enter_context(MockJiraServer({epic.key: children}, seed=0))
+    # Unpaced, so the case times the client rather than the rate limiter
+    client = JiraClient(
+        SimpleNamespace(api_endpoint="instance", cloud_id=None),  # type: ignore[arg-type]
+        limiter=RateLimiter(1e6, burst=1e6, max_rate=1e6),
+    )
+    if not client.connect_basic(server.url, "bench@example.com", "token"):
+        raise RuntimeError(f"could not connect to the mock Jira server at {server.url}")
+    return {
+        "fetch_epic": lambda: client.fetch_epic(epic.key, SP_FIELD, EPIC_LINK_FIELD),
+        "decode_children": lambda: [decode(r) for r in raw],
+        "calculate_metrics": lambda: calculate_metrics(epic),
+        "generate_epic_chart": lambda: generate_epic_chart(metrics),
+        "generate_pdf": lambda: generate_pdf(report),
+    }
+
+
+def _memory_cases(children: int) -> dict[str, Callable[[], object]]:
+    """Return callables whose result's retained memory is measured.
+
+    Children are decoded from a JSON payload, as they arrive from Jira, so
+    that every string in them is a separate object unless deduplicated.
+    """
+    payload = json.dumps(synthetic_raw_children(children, years=_YEARS))
+    decode = _IssueDecoder(SP_FIELD, EPIC_LINK_FIELD)
+    return {
+        "decoded_children": lambda: [decode(r) for r in json.loads(payload)],
+    }
+
+
+def _measure(func: Callable[[], object]) -> dict[str, Any]:
+    func()  # warm-up: imports, font loading, caches
+    times: list[float] = []
+    while len(times) < _MAX_RUNS and (not times or sum(times) < _MIN_TIME):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"runs": len(times), "min": min(times), "median": statistics.median(times)}
+
+
+def _measure_memory(build: Callable[[], object], children: int) -> dict[str, Any]:
+    """Return the bytes still allocated by what *build* returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"bytes": size, "per_issue": size / max(children, 1)}
+
+
+def run(scales: list[int], only: set[str] | None = None) -> dict[str, Any]:
+    """Run every case at every scale and return the results document."""
+    results: dict[str, dict[str, Any]] = {}
+    memory: dict[str, dict[str, Any]] = {}
+    for children in scales:
+        with ExitStack() as stack:
+            for name, func in _cases(children, stack).items():
+                if only and name not in only:
+                    continue
+                stats = _measure(func)
+                results.setdefault(name, {})[str(children)] = stats
+                print(f"{name:>20} {children:>7,} children: "
+                      f"median {stats['median'] * 1000:9.2f} ms  (min {stats['min'] * 1000:9.2f}, {stats['runs']} runs)")
+        for name, build in _memory_cases(children).items():
+            if only and name not in only:
+                continue
+            stats = _measure_memory(build, children)
+            memory.setdefault(name, {})[str(children)] = stats
+            print(f"{name:>20} {children:>7,} children: "
+                  f"{stats['bytes'] / 1024:9.1f} KiB  ({stats['per_issue']:.0f} B per issue)")
+    return {"meta": _meta(), "results": results, "memory": memory}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> bool:
+    """Print the change against *baseline*; return True if nothing regressed.
+
+    Compares the fastest run of each case, the figure least disturbed by
+    other load on the machine, and the retained bytes of each memory case.
+    """
+    ok = True
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'} ({baseline['meta']['timestamp']}):")
+    for section, metric, worse in (("results", "min", "slower"), ("memory", "bytes", "bigger")):
+        for name, by_scale in current.get(section, {}).items():
+            for scale, stats in by_scale.items():
+                before = baseline.get(section, {}).get(name, {}).get(scale)
+                if not before:
+                    continue
+                change = stats[metric] / before[metric] - 1
+                flag = ""
+                if change > threshold:
+                    flag, ok = f"  <-- {worse}", False
+                print(f"{name:>20} {int(scale):>7,} children: {change:+7.1%}{flag}")
+    return ok
+
+
+def _meta() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).parent, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(_DEFAULT_SCALES),
+                        help="Children per Epic (default: %(default)s).")
+    parser.add_argument("--only", nargs="+", help="Run only these cases.")
+    parser.add_argument("--output", type=Path, help="Results file (default: results/<timestamp>.json).")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slow-down reported as a regression (default: %(default)s).")
+    args = parser.parse_args(argv)
+
+    try:
+        current = run(args.scales, set(args.only) if args.only else None)
+    finally:
+        shutdown_pool()
+
+    output = args.output or _RESULTS_DIR / f"{current['meta']['timestamp'].replace(':', '')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        return 0 if compare(current, baseline, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
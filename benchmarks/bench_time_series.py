@@ -0,0 +1,86 @@
+"""Benchmark: trend-chart time series, day-by-day rescan vs. event based.
+
+Run with ``python benchmarks/bench_time_series.py``.  Both builders are
+checked for identical output before timing; the events builder is timed
+including the column frame it reads from.  Issues are created in mixed
+UTC offsets, as on sites whose users sit in different time zones.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from epic_report_generator.core.data_models import EpicMetrics, JiraIssue
+from epic_report_generator.core.metrics import _build_time_series, _IssueFrame
+
+_SIZES = ((365, 300), (365, 3000), (730, 3000), (730, 10000))
+_OFFSETS = tuple(timezone(timedelta(hours=h)) for h in (-5, 0, 2, 5.5))
+
+
+def _legacy_build_time_series(m: EpicMetrics, children: list[JiraIssue]) -> None:
+    """The original O(days x issues) implementation, kept as a reference."""
+    dated = [(c, c.created) for c in children if c.created is not None]
+    if not dated:
+        return
+    min_date = min(dt for _, dt in dated).date()
+    max_date = date.today()
+    if min_date >= max_date:
+        return
+    day = min_date
+    while day <= max_date:
+        day_end = datetime(day.year, day.month, day.day, 23, 59, 59).astimezone()
+        created_by_day = [c for c, dt in dated if dt.date() <= day]
+        done_by_day = [
+            c for c in created_by_day
+            if c.status_category == "Done" and c.resolved and c.resolved <= day_end
+        ]
+        m.dates.append(day)
+        m.total_sp_over_time.append(sum(c.story_points or 0 for c in created_by_day))
+        m.completed_sp_over_time.append(sum(c.story_points or 0 for c in done_by_day))
+        m.cumulative_issues.append(len(created_by_day))
+        m.cumulative_unestimated.append(sum(1 for c in created_by_day if not c.story_points))
+        day += timedelta(days=1)
+
+
+def _children(days: int, count: int) -> list[JiraIssue]:
+    rng = random.Random(days * count)
+    now = datetime.now(timezone.utc)
+    children = []
+    for i in range(count):
+        created = (now - timedelta(seconds=rng.randrange(days * 86400))).astimezone(rng.choice(_OFFSETS))
+        done = rng.random() < 0.6
+        resolved = created + (now - created) * rng.random() if done else None
+        children.append(JiraIssue(
+            key=f"BENCH-{i}", summary="", status="Done" if done else "Open",
+            status_category="Done" if done else "To Do", resolution=None,
+            issue_type="Story", story_points=rng.choice([None, 1.0, 2.0, 3.0, 5.0, 8.0]),
+            created=created, resolved=resolved, assignee=None,
+        ))
+    return children
+
+
+def _events_build_time_series(m: EpicMetrics, children: list[JiraIssue]) -> None:
+    _build_time_series(m, _IssueFrame.build(children))
+
+
+def _run(builder: object, children: list[JiraIssue]) -> tuple[EpicMetrics, float]:
+    m = EpicMetrics()
+    start = time.perf_counter()
+    builder(m, children)  # type: ignore[operator]
+    return m, time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'days':>6} {'issues':>7} {'legacy (s)':>11} {'events (s)':>11} {'speedup':>8}")
+    for days, count in _SIZES:
+        children = _children(days, count)
+        legacy, slow = _run(_legacy_build_time_series, children)
+        events, fast = _run(_events_build_time_series, children)
+        assert legacy == events, "time series differ"
+        print(f"{days:>6} {count:>7} {slow:>11.3f} {fast:>11.4f} {slow / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+"""Local stand-in for the Jira Cloud REST API, serving synthetic Epics.
+
+Implements just the endpoints :class:`JiraClient` talks to, so the real
+client (and the ``jira`` library under it) can be driven end-to-end with
+no network:
+
+* ``GET|POST /rest/api/{2,3}/search/jql`` — ``nextPageToken`` paging over
+  the JQL shapes the client sends (``key = X``, ``key in (...)``,
+  ``"<epic link field>" in (...)``, ``AND updated >= -Nm``, ``ORDER BY``);
+  only the requested ``fields`` are returned and, as on a real site, a key
+  clause naming an unknown issue is answered with 400;
+* ``/rest/api/{2,3}/myself``, ``/field``, ``/project/{key}`` and
+  ``/serverInfo``;
+* ``/_edge/tenant_info``.
+
+Every path is also served under ``/ex/jira/{cloudId}``, the API gateway
+prefix.  Knobs for load testing: a fixed *latency* per request plus
+*latency_per_issue* per returned issue, a *max_page_size* that trims
+``maxResults`` as Jira does, and *throttle_every* to answer every n-th
+search with a 429 and a ``Retry-After`` of *retry_after* seconds.
+
+Use it from Python::
+
+    with MockJiraServer({"MOCK-1": 1_000}, latency=0.05) as server:
+        client.connect_basic(server.url, "user@example.com", "token")
+
+or run ``python benchmarks/mock_jira.py --epics MOCK-1=1000`` and point the
+app at the printed URL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from synthetic import EPIC_LINK_FIELD, SP_FIELD, synthetic_raw_children
+
+logger = logging.getLogger(__name__)
+
+_NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+_GATEWAY = re.compile(r"^/ex/jira/[^/]+")
+_API = re.compile(r"^/rest/api/[23]/(?P<path>.+)$")
+_IN_CLAUSE = re.compile(r'^(?P<field>key|"[^"]+"|\w+)\s+in\s+\((?P<values>[^)]*)\)$', re.IGNORECASE)
+_EQ_CLAUSE = re.compile(r"^key\s*=\s*(?P<value>[\w-]+)$", re.IGNORECASE)
+_UPDATED_CLAUSE = re.compile(r"^updated\s*>=\s*-(?P<minutes>\d+)m$", re.IGNORECASE)
+_ORDER_BY = re.compile(r"\s+ORDER\s+BY\s+.*$", re.IGNORECASE)
+_EPIC_LINK_NAMES = {EPIC_LINK_FIELD, "epic link", "parent", "cf[10014]"}
+
+_FIELDS = [
+    {"id": "summary", "name": "Summary", "custom": False, "clauseNames": ["summary"]},
+    {"id": "status", "name": "Status", "custom": False, "clauseNames": ["status"]},
+    {"id": "created", "name": "Created", "custom": False, "clauseNames": ["created", "createdDate"]},
+    {"id": "updated", "name": "Updated", "custom": False, "clauseNames": ["updated", "updatedDate"]},
+    {"id": SP_FIELD, "name": "Story Points", "custom": True,
+     "clauseNames": ["cf[10016]", "Story Points", "Story Points[Number]"]},
+    {"id": EPIC_LINK_FIELD, "name": "Epic Link", "custom": True, "clauseNames": ["cf[10014]", "Epic Link"]},
+]
+
+
+class _JqlError(ValueError):
+    """Raised for JQL outside the subset the mock understands (answered with 400)."""
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """A threaded HTTP server answering like a Jira Cloud site.
+
+    *epics* maps each Epic key to its number of children; the children are
+    generated by :func:`synthetic.synthetic_raw_children` with *seed*.
+    Pass ``port=0`` (the default) to pick a free port; :attr:`url` is the
+    site URL to connect to.  :attr:`requests` counts the requests served
+    per endpoint and :attr:`throttled` the 429s sent.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        epics: Mapping[str, int],
+        *,
+        port: int = 0,
+        seed: int = 0,
+        latency: float = 0.0,
+        latency_per_issue: float = 0.0,
+        max_page_size: int = 100,
+        throttle_every: int = 0,
+        retry_after: float = 1.0,
+        cloud_id: str = "00000000-0000-4000-8000-000000000000",
+    ) -> None:
+        super().__init__(("127.0.0.1", port), _MockJiraHandler)
+        self.latency = latency
+        self.latency_per_issue = latency_per_issue
+        self.max_page_size = max_page_size
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.cloud_id = cloud_id
+        self.now = _NOW
+        self.requests: Counter[str] = Counter()
+        self.throttled = 0
+        self._searches = 0
+        self._lock = threading.Lock()
+        self._matches: dict[str, list[dict[str, Any]]] = {}
+        self._thread: threading.Thread | None = None
+        self.epics, self.issues = _build_site(epics, seed, self.now)
+        self.keys = frozenset(raw["key"] for raw in self.issues)
+
+    @property
+    def url(self) -> str:
+        """Return the site URL, e.g. ``http://127.0.0.1:41234``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> MockJiraServer:
+        """Serve on a daemon thread until :meth:`stop`."""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-jira", daemon=True)
+        self._thread.start()
+        logger.debug("Mock Jira serving %d issue(s) at %s", len(self.issues), self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> MockJiraServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # -- request accounting ---------------------------------------------------
+
+    def count(self, endpoint: str) -> bool:
+        """Record a request to *endpoint*; return True if it must be throttled."""
+        with self._lock:
+            self.requests[endpoint] += 1
+            if endpoint != "search" or not self.throttle_every:
+                return False
+            self._searches += 1
+            if self._searches % self.throttle_every:
+                return False
+            self.throttled += 1
+            return True
+
+    # -- search ---------------------------------------------------------------
+
+    def search(self, jql: str, fields: list[str], token: str | None, max_results: int) -> dict[str, Any]:
+        """Return one ``/search/jql`` page for *jql*, starting at *token*."""
+        matches = self._matches.get(jql)
+        if matches is None:
+            # The site never changes, so each query is only evaluated once
+            clauses = _parse_jql(jql, self.keys)
+            matches = [raw for raw in self.issues if _matches(raw, clauses, self.now)]
+            with self._lock:
+                self._matches[jql] = matches
+        start = int(token) if token else 0
+        size = max(1, min(max_results, self.max_page_size))
+        page = matches[start:start + size]
+        result: dict[str, Any] = {
+            "issues": [_project(raw, fields) for raw in page],
+            "isLast": start + size >= len(matches),
+        }
+        if not result["isLast"]:
+            result["nextPageToken"] = str(start + size)
+        return result
+
+
+class _MockJiraHandler(BaseHTTPRequestHandler):
+    """Route requests to the :class:`MockJiraServer` they arrived at."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    server: MockJiraServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        parsed = urlparse(self.path)
+        params = {k: v if k == "fields" else v[-1] for k, v in parse_qs(parsed.query).items()}
+        self._dispatch(parsed.path, params)
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"errorMessages": ["Request body is not valid JSON."]})
+            return
+        self._dispatch(urlparse(self.path).path, params)
+
+    def _dispatch(self, path: str, params: dict[str, Any]) -> None:
+        server = self.server
+        path = _GATEWAY.sub("", path)
+        if path == "/_edge/tenant_info":
+            self._finish("tenant_info", 200, {"cloudId": server.cloud_id})
+            return
+        match = _API.match(path)
+        if not match:
+            self._finish("unknown", 404, {"errorMessages": [f"No route for {path}"]})
+            return
+
+        route = match.group("path").rstrip("/")
+        if route == "search/jql":
+            self._search(params)
+        elif route == "myself":
+            self._finish("myself", 200, {
+                "accountId": "mock-account", "displayName": "Mock User",
+                "emailAddress": "mock@example.com", "active": True, "timeZone": "UTC",
+                "avatarUrls": {"48x48": f"{server.url}/avatar.png"},
+            })
+        elif route == "field":
+            self._finish("field", 200, _FIELDS)
+        elif route == "serverInfo":
+            self._finish("serverInfo", 200, {
+                "baseUrl": server.url, "version": "1001.0.0-SNAPSHOT",
+                "versionNumbers": [1001, 0, 0], "deploymentType": "Cloud",
+                "serverTitle": "Mock Jira",
+            })
+        elif route.startswith("project/"):
+            key = route.split("/", 1)[1].upper()
+            if any(k.rsplit("-", 1)[0] == key for k in server.epics):
+                self._finish("project", 200, {
+                    "id": "10000", "key": key, "name": f"{key.title()} Project",
+                    "self": f"{server.url}/rest/api/2/project/{key}",
+                })
+            else:
+                self._finish("project", 404, {"errorMessages": [f"No project could be found with key '{key}'."]})
+        else:
+            self._finish("unknown", 404, {"errorMessages": [f"No route for {path}"]})
+
+    def _search(self, params: dict[str, Any]) -> None:
+        server = self.server
+        if server.count("search"):
+            time.sleep(server.latency)
+            self._send(429, {"errorMessages": ["Rate limit exceeded."]},
+                       {"Retry-After": f"{server.retry_after:g}"})
+            return
+        fields = params.get("fields") or ["*all"]
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        try:
+            page = server.search(
+                params.get("jql", ""), fields, params.get("nextPageToken"),
+                int(params.get("maxResults") or 50),
+            )
+        except _JqlError as exc:
+            self._send(400, {"errorMessages": [str(exc)]})
+            return
+        time.sleep(server.latency + server.latency_per_issue * len(page["issues"]))
+        self._send(200, page)
+
+    def _finish(self, endpoint: str, status: int, body: Any) -> None:
+        self.server.count(endpoint)
+        time.sleep(self.server.latency)
+        self._send(status, body)
+
+    def _send(self, status: int, body: Any, headers: Mapping[str, str] | None = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Route access logs to the debug log instead of stderr."""
+        logger.debug("Mock Jira: %s", format % args)
+
+
+# ---------------------------------------------------------------------------
+# synthetic site
+# ---------------------------------------------------------------------------
+
+
+def _build_site(
+    epics: Mapping[str, int], seed: int, now: datetime
+) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    """Return the Epic headers by key and every issue on the site, oldest first."""
+    headers: dict[str, dict[str, Any]] = {}
+    issues: list[dict[str, Any]] = []
+    next_number: Counter[str] = Counter()
+    for key in epics:
+        project, number = key.upper().rsplit("-", 1)
+        next_number[project] = max(next_number[project], int(number))
+
+    for i, (key, count) in enumerate(epics.items()):
+        key = key.upper()
+        project = key.rsplit("-", 1)[0]
+        children = synthetic_raw_children(count, seed=seed + i, epic_key=key, now=now)
+        for child in children:
+            next_number[project] += 1
+            child["key"] = f"{project}-{next_number[project]}"
+        created = min(
+            (c["fields"]["created"] for c in children),
+            key=_parse_timestamp, default=_timestamp(now - timedelta(days=30)),
+        )
+        headers[key] = {
+            "key": key,
+            "fields": {
+                "summary": f"Synthetic Epic with {count} children",
+                "status": {"name": "In Progress", "statusCategory": {"name": "In Progress"}},
+                "priority": {"name": "High"},
+                "assignee": {"displayName": "Owner"},
+                "reporter": {"displayName": "Reporter"},
+                "created": created,
+                "updated": _timestamp(now),
+                "labels": ["synthetic"],
+                "fixVersions": [],
+                "issuetype": {"name": "Epic"},
+            },
+        }
+        issues.append(headers[key])
+        issues.extend(children)
+
+    for n, raw in enumerate(issues, start=10_000):
+        raw["id"] = str(n)
+    issues.sort(key=lambda raw: _parse_timestamp(raw["fields"]["created"]))
+    return headers, issues
+
+
+def _parse_jql(jql: str, keys: frozenset[str]) -> list[tuple[str, Any]]:
+    """Split *jql* into ``(kind, value)`` filters, all of which must match.
+
+    Like Jira, a key clause naming an issue that is not among *keys*
+    rejects the whole query.
+    """
+    clauses = []
+    for clause in re.split(r"\s+AND\s+", _ORDER_BY.sub("", jql.strip()), flags=re.IGNORECASE):
+        clause = clause.strip()
+        if match := _EQ_CLAUSE.match(clause):
+            clauses.append(("key", _known_keys({match.group("value").upper()}, keys)))
+        elif match := _IN_CLAUSE.match(clause):
+            field = match.group("field").strip('"').lower()
+            values = {v.strip().strip('"').upper() for v in match.group("values").split(",") if v.strip()}
+            if field == "key":
+                clauses.append(("key", _known_keys(values, keys)))
+            elif field in _EPIC_LINK_NAMES:
+                clauses.append(("epic", values))
+            else:
+                raise _JqlError(f"Field '{field}' is not supported by the mock server.")
+        elif match := _UPDATED_CLAUSE.match(clause):
+            clauses.append(("updated", timedelta(minutes=int(match.group("minutes")))))
+        else:
+            raise _JqlError(f"Error in the JQL Query: unsupported clause '{clause}'.")
+    return clauses
+
+
+def _known_keys(values: set[str], keys: frozenset[str]) -> set[str]:
+    unknown = sorted(values - keys)
+    if unknown:
+        raise _JqlError(f"An issue with key '{unknown[0]}' does not exist for field 'key'.")
+    return values
+
+
+def _matches(raw: dict[str, Any], clauses: list[tuple[str, Any]], now: datetime) -> bool:
+    fields = raw["fields"]
+    for kind, value in clauses:
+        if kind == "key" and raw["key"] not in value:
+            return False
+        if kind == "epic" and (fields.get(EPIC_LINK_FIELD) or "").upper() not in value:
+            return False
+        if kind == "updated" and _parse_timestamp(fields["updated"]) < now - value:
+            return False
+    return True
+
+
+def _project(raw: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """Return *raw* with only the requested *fields*, as Jira does."""
+    wanted = raw["fields"] if "*all" in fields else {
+        name: raw["fields"].get(name) for name in fields if name != "key"
+    }
+    return {"id": raw["id"], "key": raw["key"], "fields": wanted}
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%f")[:23] + "+0000"
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def _epic_spec(value: str) -> tuple[str, int]:
+    key, _, count = value.partition("=")
+    return key.upper(), int(count or 100)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--epics", type=_epic_spec, nargs="+", default=[("MOCK-1", 100)],
+                        metavar="KEY=CHILDREN", help="Epics to serve (default: MOCK-1=100).")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request.")
+    parser.add_argument("--latency-per-issue", type=float, default=0.0,
+                        help="Seconds added per issue in a search page.")
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--throttle-every", type=int, default=0,
+                        help="Answer every n-th search with 429 (default: never).")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG, format="%(asctime)s %(message)s")
+    server = MockJiraServer(
+        dict(args.epics), port=args.port, seed=args.seed, latency=args.latency,
+        latency_per_issue=args.latency_per_issue, max_page_size=args.max_page_size,
+        throttle_every=args.throttle_every, retry_after=args.retry_after,
+    )
+    print(f"Mock Jira at {server.url} — any email and API token will do; Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
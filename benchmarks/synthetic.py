@@ -0,0 +1,140 @@
+"""Seeded synthetic Jira data for benchmarks.
+
+Children are generated as raw ``/search/jql`` JSON so the decoder can be
+timed too; :func:`synthetic_epic` decodes them into an :class:`EpicData`.
+
+The shape follows what real Epics look like rather than uniform noise:
+
+* creation dates span several years, with the backlog growing over time,
+  bursts of new issues at fortnightly sprint planning and nothing created
+  at weekends;
+* older issues are more likely to be done, and resolution lead times are
+  log-normal (most close within days, a long tail takes months);
+* story points follow a Fibonacci mix with some unestimated issues;
+* timestamps carry a mix of UTC offsets, as teams in several time zones do.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from epic_report_generator.core.data_models import EpicData
+from epic_report_generator.core.jira_client import _IssueDecoder
+
+SP_FIELD = "customfield_10016"
+EPIC_LINK_FIELD = "customfield_10014"
+
+# (value, weight); None = unestimated
+_STORY_POINTS = ((None, 15), (0.5, 2), (1.0, 14), (2.0, 20), (3.0, 24), (5.0, 14), (8.0, 8), (13.0, 3))
+_ISSUE_TYPES = (("Story", 60), ("Task", 20), ("Bug", 15), ("Spike", 5))
+_OPEN_STATUSES = (("To Do", "To Do", 55), ("In Progress", "In Progress", 30), ("In Review", "In Progress", 15))
+_RESOLUTIONS = (("Done", 85), ("Won't Do", 10), ("Duplicate", 5))
+_OFFSETS = (("+0000", 40), ("+0100", 25), ("+0200", 15), ("-0500", 15), ("+0530", 5))
+_ASSIGNEES = tuple(f"Developer {i}" for i in range(12))
+
+_SPRINT_DAYS = 14
+_SPRINT_BURST = 0.4  # share of issues created on sprint planning day
+_LEAD_TIME_MEDIAN_DAYS = 6.0
+_LEAD_TIME_SIGMA = 1.1
+
+
+def synthetic_raw_children(
+    count: int,
+    *,
+    seed: int = 0,
+    years: float = 2.0,
+    epic_key: str = "BENCH-1",
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Return *count* raw child issues created over the last *years* years."""
+    rng = random.Random(seed)
+    now = now or datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    start = now - timedelta(days=365.25 * years)
+    span = (now - start).total_seconds()
+    project = epic_key.rsplit("-", 1)[0]
+
+    children = []
+    for i in range(count):
+        # sqrt of a uniform variate: creation rate grows linearly over time
+        created = start + timedelta(seconds=span * math.sqrt(rng.random()))
+        if rng.random() < _SPRINT_BURST:
+            sprint = (created - start).days // _SPRINT_DAYS * _SPRINT_DAYS
+            created = start + timedelta(days=sprint, hours=rng.uniform(9, 12))
+        created = _weekday(created)
+
+        age = (now - created).total_seconds() / span
+        resolved = None
+        if rng.random() < 0.25 + 0.7 * age:
+            lead = rng.lognormvariate(math.log(_LEAD_TIME_MEDIAN_DAYS), _LEAD_TIME_SIGMA)
+            resolved = _weekday(created + timedelta(days=lead))
+            if resolved >= now:
+                resolved = None
+
+        if resolved is None:
+            status, category = _pick(rng, _OPEN_STATUSES, 2)
+            resolution = None
+        else:
+            status, category, resolution = "Done", "Done", {"name": _pick(rng, _RESOLUTIONS)}
+
+        offset = _pick(rng, _OFFSETS)
+        points = _pick(rng, _STORY_POINTS)
+        children.append({
+            "key": f"{project}-{i + 2}",
+            "fields": {
+                "summary": f"Synthetic issue {i}",
+                "status": {"name": status, "statusCategory": {"name": category}},
+                "resolution": resolution,
+                "issuetype": {"name": _pick(rng, _ISSUE_TYPES)},
+                "assignee": {"displayName": rng.choice(_ASSIGNEES)} if rng.random() < 0.85 else None,
+                "created": _jira_timestamp(created, offset),
+                "updated": _jira_timestamp(resolved or created, offset),
+                "resolutiondate": _jira_timestamp(resolved, offset) if resolved else None,
+                SP_FIELD: points,
+                EPIC_LINK_FIELD: epic_key,
+            },
+        })
+    return children
+
+
+def synthetic_epic(
+    count: int,
+    *,
+    seed: int = 0,
+    years: float = 2.0,
+    epic_key: str = "BENCH-1",
+    now: datetime | None = None,
+) -> EpicData:
+    """Return an Epic with *count* decoded synthetic children."""
+    raw = synthetic_raw_children(count, seed=seed, years=years, epic_key=epic_key, now=now)
+    decode = _IssueDecoder(SP_FIELD, EPIC_LINK_FIELD)
+    children = [decode(r) for r in raw]
+    created = min((c.created for c in children if c.created), default=None)
+    return EpicData(
+        key=epic_key, summary=f"Synthetic Epic with {count} children", status="In Progress",
+        priority="High", assignee="Owner", reporter="Reporter",
+        created=created, updated=now or datetime(2026, 1, 1, 12, tzinfo=timezone.utc),
+        labels=["synthetic"], children=children,
+    )
+
+
+def _pick(rng: random.Random, choices: tuple[tuple[Any, ...], ...], width: int = 1) -> Any:
+    """Weighted choice; each entry is ``(*values, weight)``."""
+    entry = rng.choices(choices, weights=[c[-1] for c in choices])[0]
+    return entry[0] if width == 1 else entry[:width]
+
+
+def _weekday(moment: datetime) -> datetime:
+    """Move a weekend *moment* to the following Monday morning."""
+    if moment.weekday() >= 5:
+        moment = (moment + timedelta(days=7 - moment.weekday())).replace(hour=9)
+    return moment
+
+
+def _jira_timestamp(moment: datetime, offset: str) -> str:
+    """Format *moment* like Jira: ``2024-03-05T10:15:30.123+0100``."""
+    sign = 1 if offset[0] == "+" else -1
+    tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:])))
+    return moment.astimezone(tz).strftime("%Y-%m-%dT%H:%M:%S.%f")[:23] + offset
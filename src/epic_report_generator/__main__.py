@@ -4,14 +4,22 @@ from __future__ import annotations
 
 import argparse
 import logging
+import multiprocessing
 import sys
 
 
 def main() -> int:
     """Launch the Epic Report Generator application."""
+    # Dispatched by hand: Qt's own arguments would confuse argparse subparsers
+    if sys.argv[1:2] == ["generate"]:
+        from epic_report_generator.cli import generate
+
+        return generate(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         prog="epic-report-generator",
         description="Generate PDF Epic progress reports from Jira Cloud.",
+        epilog="Run 'epic-report-generator generate --help' to build a report without the GUI.",
     )
     parser.add_argument(
         "--install-desktop",
@@ -45,4 +53,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Chart rendering spawns worker processes; needed for frozen builds
+    multiprocessing.freeze_support()
     raise SystemExit(main())
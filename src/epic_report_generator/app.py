@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 import signal
 import sys
+import threading
 
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
@@ -13,6 +15,7 @@ from PySide6.QtWidgets import QApplication
 from epic_report_generator.core.jira_client import JiraClient
 from epic_report_generator.services.auth_manager import AuthManager
 from epic_report_generator.services.config_manager import ConfigManager
+from epic_report_generator.services.issue_cache import IssueCache
 from epic_report_generator.ui.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
@@ -39,19 +42,52 @@ def run_app(argv: list[str] | None = None) -> int:
         logger.warning("logo.png not found; running without a window icon")
 
     _install_signal_handlers(app)
+    app.aboutToQuit.connect(_shutdown_chart_pool)
 
     # Shared services
     config = ConfigManager()
     auth = AuthManager(config)
-    jira = JiraClient(auth)
+    jira = JiraClient(auth, cache=IssueCache())
 
     logger.debug("Services initialised, launching main window")
     window = MainWindow(config, auth, jira)
     window.show()
+    # Once the window is up, load what report generation needs in the background
+    QTimer.singleShot(0, _start_import_warm_up)
 
     return app.exec()
 
 
+# Heavy modules kept off the startup path; imported on first use or by the
+# warm-up thread.  matplotlib is left to the chart worker processes.
+_WARM_UP_MODULES = (
+    "jira",
+    "epic_report_generator.core.report_builder",
+    "epic_report_generator.core.pdf_generator",
+)
+
+
+def _start_import_warm_up() -> None:
+    threading.Thread(target=_warm_up_imports, name="import-warm-up", daemon=True).start()
+
+
+def _warm_up_imports() -> None:
+    for name in _WARM_UP_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logger.exception("Warm-up import of %s failed", name)
+    logger.debug("Warm-up imports done")
+
+
+def _shutdown_chart_pool() -> None:
+    # Imported here to keep reportlab off the startup path; by quit time
+    # the warm-up thread has normally loaded it already
+    from epic_report_generator.core.pdf_generator import shutdown_chart_pool
+
+    shutdown_chart_pool()
+
+
 def _install_signal_handlers(app: QApplication) -> None:
     """Allow SIGINT/SIGTERM to gracefully quit the Qt event loop.
 
@@ -0,0 +1,176 @@
+"""Headless report generation: ``epic-report-generator generate``.
+
+Runs the same fetch → metrics → PDF pipeline as the Preview panel, with
+the credentials and settings saved by the desktop app, but never imports
+Qt — suitable for cron jobs on servers without a display.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from epic_report_generator.core import timing
+from epic_report_generator.core.data_models import RE_EPIC_KEY, ReportConfig
+from epic_report_generator.core.jira_client import JiraClient
+from epic_report_generator.core.pdf_generator import generate_pdf, shutdown_chart_pool
+from epic_report_generator.core.report_builder import build_report
+from epic_report_generator.services.auth_manager import AuthManager
+from epic_report_generator.services.chart_cache import ChartCache
+from epic_report_generator.services.config_manager import ConfigManager
+from epic_report_generator.services.issue_cache import IssueCache
+
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1  # nothing to report, or some Epics could not be fetched
+EXIT_USAGE = 2  # argparse's own code for invalid arguments
+EXIT_NOT_CONNECTED = 3
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the ``generate`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="epic-report-generator generate",
+        description=(
+            "Generate a PDF report without starting the GUI, using the Jira "
+            "credentials saved by the desktop app."
+        ),
+        epilog=(
+            "Exit status: 0 on success, 1 if no report could be built or some "
+            "Epics were not found (the PDF is still written), 2 on invalid "
+            "arguments, 3 if Jira could not be reached with the saved credentials."
+        ),
+    )
+    parser.add_argument(
+        "--epics", required=True,
+        help="Comma- or space-separated Epic keys from one project, e.g. PROJ-1,PROJ-2.",
+    )
+    parser.add_argument("--out", required=True, type=Path, help="Path of the PDF to write.")
+    parser.add_argument("--title", help="Report title (default: the app's default title).")
+    parser.add_argument("--author", help="Report author (default: the app's default author).")
+    parser.add_argument("--project-name", help="Project display name (default: looked up in Jira).")
+    parser.add_argument(
+        "--date", type=date.fromisoformat, default=None, metavar="YYYY-MM-DD",
+        help="Report date (default: today).",
+    )
+    parser.add_argument(
+        "--confidential", action="store_true", help="Include the confidentiality notice.",
+    )
+    parser.add_argument("--company", help="Company name used in the confidentiality notice.")
+    parser.add_argument(
+        "--charts", choices=("raster", "vector"), default=None,
+        help="Chart backend (default: the one selected in the app).",
+    )
+    parser.add_argument("--dark", action="store_true", help="Use the dark colour theme.")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not use the local issue cache.",
+    )
+    parser.add_argument(
+        "--trace", type=Path, metavar="FILE",
+        help="Also write the per-stage timing breakdown of the run to FILE as JSON.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log debug output.")
+    return parser
+
+
+def generate(argv: list[str] | None = None) -> int:
+    """Run the ``generate`` subcommand and return the process exit code."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    epic_keys = parse_epic_keys(args.epics)
+    if not epic_keys:
+        parser.error("--epics: enter at least one Epic key")
+    invalid = [k for k in epic_keys if not RE_EPIC_KEY.match(k)]
+    if invalid:
+        parser.error(f"--epics: these keys are invalid: {', '.join(invalid)}")
+    prefixes = {k.rsplit("-", 1)[0] for k in epic_keys}
+    if len(prefixes) != 1:
+        parser.error(f"--epics: all keys must share one project prefix, found {', '.join(sorted(prefixes))}")
+    project_key = prefixes.pop()
+
+    config = ConfigManager()
+    auth = AuthManager(config)
+    jira = JiraClient(auth, cache=None if args.no_cache else IssueCache())
+    if not _connect(jira, auth):
+        print(
+            "error: could not connect to Jira with the saved credentials; "
+            "log in once with the desktop app first",
+            file=sys.stderr,
+        )
+        return EXIT_NOT_CONNECTED
+
+    report_config = ReportConfig(
+        project_key=project_key,
+        epic_keys=epic_keys,
+        title=args.title or config.get("default_title", "Epic Progress Report"),
+        author=args.author if args.author is not None else config.get("default_author", ""),
+        project_display_name=(
+            args.project_name or jira.get_project_name(project_key) or project_key
+        ),
+        report_date=args.date or date.today(),
+        confidential=args.confidential,
+        company_name=args.company if args.company is not None else config.get("default_company", ""),
+        story_points_field=config.get("story_points_field", "story_points"),
+        epic_link_field=config.get("epic_link_field", "customfield_10014"),
+        dark_mode=args.dark,
+        chart_backend=args.charts or config.get("chart_backend", "raster"),
+    )
+
+    trace = timing.Trace()
+    try:
+        with timing.recording(trace):
+            report = build_report(jira, report_config)
+            for error in report.errors:
+                print(f"warning: {error}", file=sys.stderr)
+            if not report.epics:
+                print("error: no data to generate a report", file=sys.stderr)
+                return EXIT_FAILED
+            pdf = generate_pdf(report, chart_cache=ChartCache())
+    finally:
+        shutdown_chart_pool()
+        trace.finish()
+        logger.info("%s", trace.report())
+        if args.trace:
+            try:
+                trace.write(args.trace)
+            except OSError as exc:
+                print(f"warning: could not write the timing trace: {exc}", file=sys.stderr)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_bytes(pdf)
+    logger.info("Report written to %s (%s bytes)", args.out, f"{len(pdf):,}")
+    return EXIT_FAILED if report.errors else EXIT_OK
+
+
+def parse_epic_keys(raw: str) -> list[str]:
+    """Split *raw* on commas/whitespace into upper-cased, de-duplicated keys."""
+    keys: list[str] = []
+    for part in re.split(r"[,\s]+", raw.strip()):
+        key = part.upper()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _connect(jira: JiraClient, auth: AuthManager) -> bool:
+    """Restore the session saved by the desktop app's login panel."""
+    if auth.auth_method == "api_token":
+        token = auth.get_api_token()
+        return bool(token) and jira.connect_basic(auth.jira_url, auth.jira_email, token)
+    if auth.auth_method == "oauth":
+        return auth.is_configured and jira.connect()
+    logger.error("No saved Jira login found")
+    return False
+
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date
 
+import numpy as np
+
+from epic_report_generator.core import timing
+from epic_report_generator.core.chart_style import DARK, LIGHT, format_tick_date, weekend_spans
 from epic_report_generator.core.data_models import EpicMetrics
+from epic_report_generator.services.chart_cache import ChartCache
 
 import matplotlib  # isort: skip
 
@@ -18,10 +31,11 @@ import matplotlib.ticker as mticker  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
-_MONTHS_ABBR = [
-    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
-]
+# Bump whenever the drawing code changes, so cached charts are not reused
+CHART_VERSION = 1
+
+_POOL_WORKERS = min(8, os.cpu_count() or 1)
+_MIN_PARALLEL_CHARTS = 2  # below this, spawning workers costs more than it saves
 
 
 class _EnglishDateFormatter(mticker.Formatter):
@@ -33,36 +47,7 @@ class _EnglishDateFormatter(mticker.Formatter):
     """
 
     def __call__(self, x: float, pos: int | None = None) -> str:
-        dt = mdates.num2date(x)
-        return f"{_MONTHS_ABBR[dt.month - 1]} {dt.day:02d}"
-
-# -- Light theme colour palette ------------------------------------------------
-_LIGHT = {
-    "total_sp": "#e0e0e0",
-    "done_sp": "#4c9aff",
-    "cum_issues": "#0747a6",
-    "cum_unest": "#8b6914",
-    "weekend": "#f4f5f7",
-    "label_color": "#505f79",
-    "grid": "#dfe1e6",
-    "bg": "#ffffff",
-    "face": "#ffffff",
-    "legend_face": "#ffffff",
-}
-
-# -- Dark theme colour palette -------------------------------------------------
-_DARK = {
-    "total_sp": "#455a64",
-    "done_sp": "#2979ff",
-    "cum_issues": "#82b1ff",
-    "cum_unest": "#ffb74d",
-    "weekend": "#263238",
-    "label_color": "#b0bec5",
-    "grid": "#37474f",
-    "bg": "#1e1e1e",
-    "face": "#1e1e1e",
-    "legend_face": "#263238",
-}
+        return format_tick_date(mdates.num2date(x))
 
 
 def generate_epic_chart(
@@ -77,7 +62,7 @@ def generate_epic_chart(
         return None
 
     logger.debug("Rendering chart: %d data points, dark=%s, dpi=%d", len(metrics.dates), dark, dpi)
-    pal = _DARK if dark else _LIGHT
+    pal = DARK if dark else LIGHT
 
     fig, ax1 = plt.subplots(figsize=(7.2, 3.6), dpi=dpi)
     fig.patch.set_facecolor(pal["face"])
@@ -180,20 +165,176 @@ def _draw_weekend_bands(ax: plt.Axes, dates: list[date], color: str) -> None:
     """Draw light gray vertical bands for weekends."""
     if not dates:
         return
+    for start, end in weekend_spans(dates):
+        ax.axvspan(start, end, color=color, zorder=0)
+
+
+# -- parallel rendering -------------------------------------------------------
+
+# Compact, cheaply pickled form of the chart series: date ordinals plus the
+# four value arrays.
+_Series = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def render_charts(
+    metrics: Sequence[EpicMetrics],
+    *,
+    dpi: int = 150,
+    dark: bool = False,
+    on_progress: Callable[[int, int], None] | None = None,
+    cache: ChartCache | None = None,
+    epic_keys: Sequence[str] | None = None,
+) -> list[bytes | None]:
+    """Render the trend chart of every Epic, in parallel where it pays off.
+
+    Charts found in *cache* (by :func:`chart_key`) are reused without
+    touching matplotlib; newly rendered ones are added to it.
+
+    Charts are rendered in a warm pool of spawned worker processes (pyplot
+    is neither thread-safe nor able to use more than one core per process).
+    Falls back to rendering in this process for small batches, on
+    single-core machines, or if the pool breaks.  Returns PNG bytes (or
+    ``None`` for Epics without time-series data) in input order;
+    *on_progress* is called as ``on_progress(done, total)``.
+
+    Each rendered chart is timed as the ``charts.render`` stage of the
+    current :mod:`timing` trace, attributed to the Epic in *epic_keys*.
+    """
+    total = len(metrics)
+    results: list[bytes | None] = [None] * total
+    packed = {i: _pack(m) for i, m in enumerate(metrics) if m.dates}
+    keys: dict[int, str] = {}
+    if cache is not None:
+        for i in list(packed):
+            keys[i] = chart_key(packed[i], dpi=dpi, dark=dark)
+            results[i] = cache.get(keys[i])
+            if results[i] is not None:
+                del packed[i]
+        logger.debug("Chart cache: %d hit(s), %d miss(es)", len(keys) - len(packed), len(packed))
+    done = total - len(packed)
+    labels: Sequence[str | None] = epic_keys if epic_keys is not None else [None] * total
+
+    if _POOL_WORKERS > 1 and len(packed) >= _MIN_PARALLEL_CHARTS:
+        try:
+            futures: dict[Future[tuple[bytes | None, float]], int] = {
+                _get_pool().submit(_render_timed, series, dpi, dark): i
+                for i, series in packed.items()
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i], seconds = future.result()
+                timing.record("charts.render", seconds, epic=labels[i])
+                del packed[i]
+                _store(cache, keys, i, results[i])
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("Chart pool failed (%s) — rendering in-process", exc)
+            shutdown_pool()
+
+    for i in list(packed):
+        with timing.span("charts.render", epic=labels[i]):
+            results[i] = generate_epic_chart(metrics[i], dpi=dpi, dark=dark)
+        _store(cache, keys, i, results[i])
+        done += 1
+        if on_progress:
+            on_progress(done, total)
+    return results
+
+
+def chart_key(series: _Series | EpicMetrics, *, dpi: int, dark: bool) -> str:
+    """Return a content hash identifying the chart drawn from *series*.
+
+    Covers the time-series arrays, theme, DPI and :data:`CHART_VERSION`.
+    """
+    if isinstance(series, EpicMetrics):
+        series = _pack(series)
+    digest = hashlib.sha256(f"v{CHART_VERSION}|dpi={dpi}|dark={int(dark)}".encode())
+    for array in series:
+        digest.update(str(array.dtype).encode())
+        digest.update(len(array).to_bytes(8, "little"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def warm_up_pool() -> None:
+    """Start the chart workers in the background so the first report is fast.
+
+    Does nothing where :func:`render_charts` would not use the pool.
+    """
+    if _POOL_WORKERS <= 1:
+        return
+    try:
+        pool = _get_pool()
+        for _ in range(_POOL_WORKERS):
+            pool.submit(int)
+    except (BrokenProcessPool, OSError) as exc:
+        logger.warning("Could not start chart pool: %s", exc)
+
+
+def shutdown_pool() -> None:
+    """Stop the chart worker processes (a new pool starts on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            logger.debug("Starting chart pool with %d worker(s)", _POOL_WORKERS)
+            # spawn: forking a process that runs Qt threads is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _init_worker() -> None:
+    """Prime a worker: draw a throwaway chart so fonts and caches are loaded."""
+    today = date.today().toordinal()
+    series = (np.array([today - 1, today]), *([np.zeros(2)] * 4))
+    _render_packed(series, 50, False)  # type: ignore[arg-type]
+
+
+def _store(cache: ChartCache | None, keys: dict[int, str], i: int, png: bytes | None) -> None:
+    if cache is not None and png is not None:
+        cache.put(keys[i], png)
+
+
+def _pack(metrics: EpicMetrics) -> _Series:
+    return (
+        np.fromiter((d.toordinal() for d in metrics.dates), dtype=np.int32, count=len(metrics.dates)),
+        np.asarray(metrics.total_sp_over_time, dtype=np.float64),
+        np.asarray(metrics.completed_sp_over_time, dtype=np.float64),
+        np.asarray(metrics.cumulative_issues, dtype=np.int64),
+        np.asarray(metrics.cumulative_unestimated, dtype=np.int64),
+    )
+
+
+def _render_packed(series: _Series, dpi: int, dark: bool) -> bytes | None:
+    ordinals, total_sp, completed_sp, issues, unestimated = series
+    metrics = EpicMetrics(
+        dates=[date.fromordinal(int(o)) for o in ordinals],
+        total_sp_over_time=total_sp.tolist(),
+        completed_sp_over_time=completed_sp.tolist(),
+        cumulative_issues=issues.tolist(),
+        cumulative_unestimated=unestimated.tolist(),
+    )
+    return generate_epic_chart(metrics, dpi=dpi, dark=dark)
+
 
-    in_weekend = False
-    start: date | None = None
-
-    for d in dates:
-        if d.weekday() >= 5:  # Saturday=5, Sunday=6
-            if not in_weekend:
-                start = d
-                in_weekend = True
-        else:
-            if in_weekend and start is not None:
-                ax.axvspan(start, d, color=color, zorder=0)
-                in_weekend = False
-
-    # Close trailing weekend
-    if in_weekend and start is not None:
-        ax.axvspan(start, dates[-1], color=color, zorder=0)
+def _render_timed(series: _Series, dpi: int, dark: bool) -> tuple[bytes | None, float]:
+    """Render in a worker and also return the seconds it took, for the parent's trace."""
+    start = time.perf_counter()
+    png = _render_packed(series, dpi, dark)
+    return png, time.perf_counter() - start
@@ -0,0 +1,66 @@
+"""Colours and helpers shared by the raster and vector trend-chart backends."""
+
+from __future__ import annotations
+
+from datetime import date
+
+MONTHS_ABBR = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+]
+
+# -- Light theme colour palette ------------------------------------------------
+LIGHT = {
+    "total_sp": "#e0e0e0",
+    "done_sp": "#4c9aff",
+    "cum_issues": "#0747a6",
+    "cum_unest": "#8b6914",
+    "weekend": "#f4f5f7",
+    "label_color": "#505f79",
+    "grid": "#dfe1e6",
+    "bg": "#ffffff",
+    "face": "#ffffff",
+    "legend_face": "#ffffff",
+}
+
+# -- Dark theme colour palette -------------------------------------------------
+DARK = {
+    "total_sp": "#455a64",
+    "done_sp": "#2979ff",
+    "cum_issues": "#82b1ff",
+    "cum_unest": "#ffb74d",
+    "weekend": "#263238",
+    "label_color": "#b0bec5",
+    "grid": "#37474f",
+    "bg": "#1e1e1e",
+    "face": "#1e1e1e",
+    "legend_face": "#263238",
+}
+
+
+def format_tick_date(d: date) -> str:
+    """Format an axis date with English month names (e.g. ``Mar 05``)."""
+    return f"{MONTHS_ABBR[d.month - 1]} {d.day:02d}"
+
+
+def weekend_spans(dates: list[date]) -> list[tuple[date, date]]:
+    """Return ``(start, end)`` pairs covering each weekend in *dates*.
+
+    A span runs from the Saturday (or first weekend day seen) to the next
+    weekday, or to the last date when the series ends on a weekend.
+    """
+    spans: list[tuple[date, date]] = []
+    start: date | None = None
+
+    for d in dates:
+        if d.weekday() >= 5:  # Saturday=5, Sunday=6
+            if start is None:
+                start = d
+        elif start is not None:
+            spans.append((start, d))
+            start = None
+
+    # Close trailing weekend
+    if start is not None:
+        spans.append((start, dates[-1]))
+    return spans
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
 
+RE_EPIC_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
 
-@dataclass
+
+@dataclass(slots=True)
 class JiraIssue:
-    """A single Jira issue (child of an Epic)."""
+    """A single Jira issue (child of an Epic).
+
+    Slotted, as an Epic can have tens of thousands of them; the decoder
+    interns the low-cardinality strings (status, category, resolution,
+    issue type, assignee) so that equal values share one object.
+    """
 
     key: str
     summary: str
@@ -22,7 +30,7 @@ class JiraIssue:
     assignee: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class EpicData:
     """Full data for a single Jira Epic, including its child issues."""
 
@@ -39,7 +47,7 @@ class EpicData:
     children: list[JiraIssue] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EpicMetrics:
     """Calculated metrics for a single Epic."""
 
@@ -65,7 +73,7 @@ class EpicMetrics:
     cumulative_unestimated: list[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportConfig:
     """Configuration for a report generation run."""
 
@@ -80,9 +88,10 @@ class ReportConfig:
     story_points_field: str = "story_points"
     epic_link_field: str = "customfield_10014"
     dark_mode: bool = False
+    chart_backend: str = "raster"  # "raster" (matplotlib PNG) or "vector" (reportlab.graphics)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """All data needed to render the final PDF report."""
 
@@ -3,28 +3,82 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
+import sys
 import time
-from typing import Any
-
-import requests as _requests
-from jira import JIRA, JIRAError
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
+from epic_report_generator.core import timing
 from epic_report_generator.core.data_models import EpicData, JiraIssue
+from epic_report_generator.core.rate_limiter import (
+    RETRY_STATUSES,
+    RateLimiter,
+    retry_after_seconds,
+)
 from epic_report_generator.services.auth_manager import AuthManager
+from epic_report_generator.services.issue_cache import IssueCache, minutes_since
+
+if TYPE_CHECKING:
+    from jira import JIRA
 
 logger = logging.getLogger(__name__)
 
-_MAX_RESULTS = 100
+_T = TypeVar("_T")
+
+_MAX_RESULTS = 5000  # largest page /search/jql serves; Jira trims it for wide projections
 _MAX_RETRIES = 4
-_BACKOFF_BASE = 1.0  # seconds
+_MAX_WORKERS = 6
+_MAX_JQL_KEYS = 100  # issue keys per ``in (...)`` clause
+_MAX_JQL_IN_CHARS = 2000  # keeps each JQL well below URL/JQL length limits
+
+# Field projections sent with every search.  Jira returns every field
+# (including hundreds of custom fields) unless told otherwise, so anything
+# read from a raw issue's ``fields`` must be listed here first.
+EPIC_FIELDS: tuple[str, ...] = (
+    "summary", "status", "priority", "assignee", "reporter",
+    "created", "updated", "labels", "fixVersions",
+)
+CHILD_FIELDS: tuple[str, ...] = (
+    "summary", "status", "resolution", "issuetype", "assignee",
+    "created", "updated", "resolutiondate", "parent",
+    "customfield_10016",  # common story-points fallback
+)
+_KEY_ONLY: tuple[str, ...] = ("key",)
+
+
+def _jira_error() -> type[Exception]:
+    """Return ``jira.JIRAError``, for ``except`` clauses.
+
+    The ``jira`` package is imported on first connect rather than with this
+    module; by the time one of its errors can be raised it is loaded, so
+    this is a dictionary lookup.
+    """
+    from jira import JIRAError
+
+    return JIRAError
 
 
 class JiraClient:
     """High-level wrapper around the ``jira`` library for Epic data."""
 
-    def __init__(self, auth: AuthManager) -> None:
+    def __init__(
+        self,
+        auth: AuthManager,
+        *,
+        cache: IssueCache | None = None,
+        limiter: RateLimiter | None = None,
+        prefetch_pages: bool = True,
+    ) -> None:
         self._auth = auth
         self._jira: JIRA | None = None
+        self._myself: dict[str, Any] | None = None
+        self._cache = cache
+        # One limiter paces every thread that shares this client
+        self._limiter = limiter or RateLimiter()
+        self._prefetch_pages = prefetch_pages
 
     # -- connection -----------------------------------------------------------
 
@@ -40,77 +94,97 @@ class JiraClient:
         server = f"https://api.atlassian.com/ex/jira/{self._auth.cloud_id}"
         logger.debug("Connecting to Jira at %s", server)
         try:
-            self._jira = JIRA(
-                server=server,
-                options={"headers": {"Authorization": f"Bearer {token}"}},
-            )
+            self._open(server, options={"headers": {"Authorization": f"Bearer {token}"}})
             logger.info("Connected to Jira (cloud_id=%s)", self._auth.cloud_id)
             return True
         except Exception as exc:
             logger.error("Failed to connect to Jira: %s", exc)
+            self._jira = None
             return False
 
     def connect_basic(self, url: str, email: str, token: str) -> bool:
         """Connect to Jira using an API token.
 
-        Tries basic auth against the instance URL first (classic unscoped
-        tokens).  If that returns 401, resolves the site's ``cloudId`` and
-        retries against ``https://api.atlassian.com/ex/jira/{cloudId}``
-        which is required for scoped API keys.
+        Classic unscoped tokens work with basic auth against the instance
+        URL; scoped API keys need ``https://api.atlassian.com/ex/jira/{cloudId}``.
+        The variant that worked last time is tried first, so a reconnect
+        costs a single ``myself()`` round-trip.  A 401 falls back to the
+        other variant, resolving the site's ``cloudId`` if it is not known.
 
-        A lightweight ``myself()`` call validates each attempt.
         Returns True on success.
         """
-        # 1) Classic token — basic auth against instance URL
-        logger.debug("Connecting to Jira at %s (basic auth)", url)
-        try:
-            jira = JIRA(server=url, basic_auth=(email, token))
-            jira.myself()
-            self._jira = jira
-            logger.info("Connected to Jira via basic auth (%s)", url)
-            return True
-        except JIRAError as exc:
-            if exc.status_code == 401:
-                logger.debug("Basic auth returned 401, trying scoped token via cloud API")
+        endpoints = ["instance", "cloud"]
+        if self._auth.api_endpoint == "cloud" and self._auth.cloud_id:
+            endpoints.reverse()
+
+        for endpoint in endpoints:
+            if endpoint == "cloud":
+                cloud_id = self._auth.cloud_id or self._resolve_cloud_id(url)
+                if not cloud_id:
+                    logger.error("Could not resolve cloudId for %s", url)
+                    break
+                server = f"https://api.atlassian.com/ex/jira/{cloud_id}"
             else:
+                server = url
+            logger.debug("Connecting to Jira at %s (%s endpoint)", server, endpoint)
+            try:
+                self._open(server, basic_auth=(email, token))
+            except _jira_error() as exc:
+                if exc.status_code == 401:
+                    logger.debug("%s endpoint returned 401", endpoint.capitalize())
+                    continue
                 logger.error("Failed to connect to Jira: %s", exc)
-                self._jira = None
-                return False
-        except Exception as exc:
-            logger.error("Failed to connect to Jira: %s", exc)
-            self._jira = None
-            return False
-
-        # 2) Scoped API key — resolve cloudId and use cloud API URL
-        cloud_id = self._auth.cloud_id or self._resolve_cloud_id(url)
-        if not cloud_id:
-            logger.error("Could not resolve cloudId for %s", url)
-            self._jira = None
-            return False
+                break
+            except Exception as exc:
+                logger.error("Failed to connect to Jira: %s", exc)
+                break
 
-        cloud_url = f"https://api.atlassian.com/ex/jira/{cloud_id}"
-        logger.debug("Retrying with cloud API URL %s", cloud_url)
-        try:
-            jira = JIRA(server=cloud_url, basic_auth=(email, token))
-            jira.myself()
-            self._jira = jira
-            # Cache cloud_id so subsequent reconnects skip the lookup
-            if not self._auth.cloud_id:
+            # Cache what worked so subsequent reconnects skip the probing
+            if endpoint == "cloud" and not self._auth.cloud_id:
                 self._auth.set_cloud_id(cloud_id)
-            logger.info("Connected to Jira via scoped API key (cloud_id=%s)", cloud_id)
+            if self._auth.api_endpoint != endpoint:
+                self._auth.set_api_endpoint(endpoint)
+            logger.info("Connected to Jira via API token (%s)", server)
             return True
-        except Exception as exc:
-            logger.error("Failed to connect to Jira (scoped token): %s", exc)
-            self._jira = None
-            return False
+
+        self._jira = None
+        return False
+
+    def _open(self, server: str, **kwargs: Any) -> None:
+        """Create a client for *server* and validate it with one ``myself()`` call.
+
+        The response is kept for :meth:`get_myself`, so logging in does not
+        ask Jira for the same user twice.
+        """
+        jira = self._new_jira(server, **kwargs)
+        myself = self._call_with_retry(jira.myself)
+        self._jira = jira
+        self._myself = myself
+
+    def _new_jira(self, server: str, **kwargs: Any) -> JIRA:
+        """Create a ``JIRA`` client whose responses feed the rate limiter.
+
+        The ``serverInfo`` probe is skipped: every supported site is Jira
+        Cloud, which the search API requires.  The library's own retries
+        are disabled: every call goes through :meth:`_call_with_retry`, so
+        the shared limiter decides when to retry.
+        """
+        from jira import JIRA  # slow to import, so loaded on first connect
+
+        jira = JIRA(server=server, get_server_info=False, max_retries=0, **kwargs)
+        jira.deploymentType = "Cloud"
+        jira._session.hooks["response"].extend((self._limiter.observe, timing.observe_response))
+        return jira
 
     @staticmethod
     def _resolve_cloud_id(instance_url: str) -> str | None:
         """Fetch the cloudId from the instance's ``_edge/tenant_info`` endpoint."""
+        import requests
+
         tenant_url = f"{instance_url.rstrip('/')}/_edge/tenant_info"
         logger.debug("Resolving cloudId from %s", tenant_url)
         try:
-            resp = _requests.get(tenant_url, timeout=10)
+            resp = requests.get(tenant_url, timeout=10)
             resp.raise_for_status()
             cloud_id = resp.json().get("cloudId", "")
             if cloud_id:
@@ -152,7 +226,7 @@ class JiraClient:
         if not self._jira:
             return None
         try:
-            me = self._jira.myself()
+            me = self._myself or self._call_with_retry(self._jira.myself)
             name = me.get("displayName", "")
             logger.info("Authenticated as %s", name)
             return {
@@ -160,7 +234,7 @@ class JiraClient:
                 "avatarUrl": me.get("avatarUrls", {}).get("48x48", ""),
                 "emailAddress": me.get("emailAddress", ""),
             }
-        except JIRAError as exc:
+        except _jira_error() as exc:
             logger.error("myself() failed: %s", exc)
             return None
 
@@ -178,31 +252,18 @@ class JiraClient:
 
         logger.info("Fetching epic %s", epic_key)
         try:
-            issue = self._search_with_retry(f"key = {epic_key}", max_results=1)
-            if not issue:
+            page = self._search_with_retry(
+                f"key = {epic_key}", max_results=1, fields=EPIC_FIELDS,
+            )
+            if not page.get("issues"):
                 logger.warning("Epic %s not found", epic_key)
                 return None
-            raw = issue[0]
-        except JIRAError as exc:
+            raw = page["issues"][0]
+        except _jira_error() as exc:
             logger.error("Failed to fetch epic %s: %s", epic_key, exc)
             return None
 
-        fields: Any = raw.fields
-        epic = EpicData(
-            key=raw.key,
-            summary=getattr(fields, "summary", ""),
-            status=str(getattr(fields, "status", "")),
-            priority=str(getattr(fields, "priority", "")) or None,
-            assignee=self._name(getattr(fields, "assignee", None)),
-            reporter=self._name(getattr(fields, "reporter", None)),
-            created=self._parse_dt(getattr(fields, "created", None)),
-            updated=self._parse_dt(getattr(fields, "updated", None)),
-            labels=getattr(fields, "labels", []) or [],
-            fix_versions=[
-                v.name
-                for v in (getattr(fields, "fixVersions", []) or [])
-            ],
-        )
+        epic = self._epic_from_raw(raw)
 
         # Fetch children with pagination
         epic.children = self._fetch_children(epic_key, sp_field, epic_link_field)
@@ -212,17 +273,116 @@ class JiraClient:
         )
         return epic
 
+    def fetch_epics(
+        self,
+        epic_keys: Sequence[str],
+        sp_field: str = "story_points",
+        epic_link_field: str = "customfield_10014",
+        *,
+        max_workers: int = _MAX_WORKERS,
+        on_progress: Callable[[str, int, int], None] | None = None,
+    ) -> list[EpicData | None]:
+        """Fetch several Epics with batched JQL on a bounded thread pool.
+
+        Epic headers come from ``key in (...)`` searches and children from
+        ``"<epic_link_field>" in (...)`` searches, chunked to stay within
+        JQL length limits and partitioned by epic link locally.  Chunks are
+        fetched concurrently.
+
+        Results are returned in the order of *epic_keys*; missing Epics,
+        and Epics whose chunk failed to fetch, are ``None``.  *on_progress*
+        is called as ``(epic_key, done, total)`` each time an Epic finishes,
+        always from the calling thread; an Epic listed more than once (in
+        any case) counts once in *total*.
+        """
+        if not self._jira or not epic_keys:
+            return [None] * len(epic_keys)
+
+        # Each Epic is fetched (and reported) once, however often it is listed
+        first_seen: dict[str, str] = {}
+        for key in epic_keys:
+            first_seen.setdefault(key.upper(), key)
+        unique = list(first_seen.values())
+        total = len(unique)
+        workers = max(1, min(max_workers, total))
+        logger.info("Fetching %d epic(s) with %d worker(s)", total, workers)
+        headers: dict[str, EpicData] = {}
+        done = 0
+
+        def _report(key: str) -> None:
+            nonlocal done
+            done += 1
+            if on_progress is not None:
+                on_progress(key, done, total)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-fetch") as pool:
+            # A chunk that fails (after retries) only fails its own Epics
+            failed: set[str] = set()
+            header_futures = {
+                pool.submit(self._fetch_epic_headers, chunk): chunk
+                for chunk in _chunk_keys(unique, _MAX_JQL_KEYS)
+            }
+            for future, chunk in header_futures.items():
+                try:
+                    headers.update(future.result())
+                except _jira_error() as exc:
+                    logger.error("Failed to fetch epics %s: %s", ", ".join(chunk), exc)
+                    failed.update(k.upper() for k in chunk)
+                except Exception:
+                    logger.exception("Failed to fetch epics %s", ", ".join(chunk))
+                    failed.update(k.upper() for k in chunk)
+
+            found = [headers[k.upper()].key for k in unique if k.upper() in headers]
+            for key in unique:
+                if key.upper() in failed:
+                    _report(key)
+                elif key.upper() not in headers:
+                    logger.warning("Epic %s not found", key)
+                    _report(key)
+
+            # Spread the epics over the workers so chunks still run in parallel
+            per_chunk = min(_MAX_JQL_KEYS, -(-len(found) // workers)) if found else 1
+            futures = {
+                pool.submit(self._fetch_children_batch, chunk, sp_field, epic_link_field): chunk
+                for chunk in _chunk_keys(found, per_chunk)
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    children = future.result()
+                except _jira_error() as exc:
+                    logger.error("Failed to fetch children of %s: %s", ", ".join(chunk), exc)
+                    children = {}
+                except Exception:
+                    logger.exception("Failed to fetch children of %s", ", ".join(chunk))
+                    children = {}
+                for key in chunk:
+                    epic = headers[key.upper()]
+                    if key in children:
+                        epic.children = children[key]
+                        logger.info(
+                            "Fetched epic %s: %d children, status=%s",
+                            key, len(epic.children), epic.status,
+                        )
+                    else:
+                        del headers[key.upper()]
+                    _report(key)
+
+        return [headers.get(key.upper()) for key in epic_keys]
+
     def validate_epic_key(self, epic_key: str) -> bool:
         """Return True if the Epic key exists in Jira."""
         if not self._jira:
             return False
         logger.debug("Validating epic key %s", epic_key)
         try:
-            results = self._search_with_retry(f"key = {epic_key}", max_results=1)
-            valid = bool(results)
+            page = self._search_with_retry(
+                f"key = {epic_key}", max_results=1, fields=_KEY_ONLY,
+            )
+            valid = bool(page.get("issues"))
             logger.debug("Epic key %s valid=%s", epic_key, valid)
             return valid
-        except JIRAError:
+        except _jira_error():
             logger.debug("Epic key %s validation failed", epic_key)
             return False
 
@@ -234,11 +394,11 @@ class JiraClient:
         try:
             result = [
                 {"id": f["id"], "name": f["name"], "custom": f.get("custom", False)}
-                for f in self._jira.fields()
+                for f in self._call_with_retry(self._jira.fields)
             ]
             logger.info("Fetched %d Jira fields", len(result))
             return result
-        except JIRAError as exc:
+        except _jira_error() as exc:
             logger.error("Failed to fetch fields: %s", exc)
             return []
 
@@ -248,100 +408,383 @@ class JiraClient:
             return None
         logger.debug("Looking up project name for %s", project_key)
         try:
-            proj = self._jira.project(project_key)
+            proj = self._call_with_retry(self._jira.project, project_key)
             logger.debug("Project %s → %s", project_key, proj.name)
             return proj.name
-        except JIRAError:
+        except _jira_error():
             logger.warning("Could not resolve project name for %s", project_key)
             return None
 
+    @staticmethod
+    def child_fields(sp_field: str, epic_link_field: str) -> list[str]:
+        """Return the field projection used when searching for child issues.
+
+        This is :data:`CHILD_FIELDS` plus the configured story-points and
+        epic-link fields.  Extend :data:`CHILD_FIELDS` when reading a new
+        field from child issues.
+        """
+        return list(dict.fromkeys((*CHILD_FIELDS, sp_field, epic_link_field)))
+
     # -- internals ------------------------------------------------------------
 
     def _fetch_children(
         self, epic_key: str, sp_field: str, epic_link_field: str
     ) -> list[JiraIssue]:
-        jql = f'"{epic_link_field}" = {epic_key} ORDER BY created ASC'
-        logger.debug("Fetching children for %s (field=%s)", epic_key, epic_link_field)
-        children: list[JiraIssue] = []
-        start = 0
-
-        while True:
-            results = self._search_with_retry(jql, start_at=start, max_results=_MAX_RESULTS)
-            if not results:
-                break
-            for raw in results:
-                fields: Any = raw.fields
-                sp_val = getattr(fields, sp_field, None)
-                if sp_val is None:
-                    # Try common custom field names
-                    sp_val = getattr(fields, "customfield_10016", None)
-
-                children.append(
-                    JiraIssue(
-                        key=raw.key,
-                        summary=getattr(fields, "summary", ""),
-                        status=str(getattr(fields, "status", "")),
-                        status_category=self._status_category(fields),
-                        resolution=str(getattr(fields, "resolution", "")) or None,
-                        issue_type=str(getattr(fields, "issuetype", "")),
-                        story_points=float(sp_val) if sp_val is not None else None,
-                        created=self._parse_dt(getattr(fields, "created", None)),
-                        resolved=self._parse_dt(getattr(fields, "resolutiondate", None)),
-                        assignee=self._name(getattr(fields, "assignee", None)),
-                    )
-                )
-            if len(results) < _MAX_RESULTS:
-                break
-            start += _MAX_RESULTS
+        return self._fetch_children_batch([epic_key], sp_field, epic_link_field)[epic_key]
+
+    def _fetch_epic_headers(self, epic_keys: list[str]) -> dict[str, EpicData]:
+        """Fetch Epic header issues with one ``key in (...)`` search.
+
+        The result is keyed by upper-cased key; keys that do not exist are
+        left out.  Jira rejects the whole query with a 400 if any one key
+        does not exist, so a rejected chunk is split in half and retried
+        until only the bad keys remain.  Other errors are raised.
+        """
+        jql = f"key in ({', '.join(epic_keys)})"
+        logger.debug("Fetching %d epic header(s)", len(epic_keys))
+        try:
+            return {
+                raw["key"].upper(): self._epic_from_raw(raw)
+                for raw in self._iter_search(jql, EPIC_FIELDS)
+            }
+        except _jira_error() as exc:
+            if exc.status_code != 400:
+                raise
+            if len(epic_keys) == 1:
+                logger.debug("Epic key %s rejected: %s", epic_keys[0], exc)
+                return {}
+        half = len(epic_keys) // 2
+        headers = self._fetch_epic_headers(epic_keys[:half])
+        headers.update(self._fetch_epic_headers(epic_keys[half:]))
+        return headers
+
+    def _fetch_children_batch(
+        self, epic_keys: list[str], sp_field: str, epic_link_field: str
+    ) -> dict[str, list[JiraIssue]]:
+        """Fetch the children of several Epics, keyed by the given Epic keys.
+
+        With an :class:`IssueCache`, only issues updated since the last sync
+        are downloaded and merged into the cached ones.
+        """
+        logger.debug("Fetching children for %d epic(s) (field=%s)", len(epic_keys), epic_link_field)
+        fields = self.child_fields(sp_field, epic_link_field)
+        decode = _IssueDecoder(sp_field, epic_link_field)
+
+        if self._cache is not None:
+            try:
+                raw_children = self._sync_children(epic_keys, fields, decode)
+            except sqlite3.Error as exc:
+                logger.warning("Issue cache unavailable, fetching live: %s", exc)
+            else:
+                return {
+                    key: [decode(raw) for raw in issues]
+                    for key, issues in raw_children.items()
+                }
+
+        return self._search_children(epic_keys, fields, decode)
+
+    def _sync_children(
+        self, epic_keys: list[str], fields: list[str], decode: _IssueDecoder
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Bring the cached children of *epic_keys* up to date and return them."""
+        assert self._cache is not None and self._jira is not None
+        site = self._jira.server_url
+        field_sig = ",".join(fields)
+        now = time.time()
+
+        full: list[str] = []
+        delta: list[str] = []
+        last_sync = now
+        for key in epic_keys:
+            state = self._cache.sync_state(site, key)
+            if self._cache.needs_full_sync(state, field_sig, now):
+                full.append(key)
+            else:
+                delta.append(key)
+                last_sync = min(last_sync, state.last_sync)
+
+        if full:
+            logger.info("Full sync of %d epic(s): %s", len(full), ", ".join(full))
+            raw = self._search_children(full, fields, decode, keep_raw=True)
+            self._cache.store(site, raw, field_sig, now, full=True)
+        if delta:
+            since = minutes_since(last_sync)
+            logger.info("Delta sync of %d epic(s) (updated in last %dm)", len(delta), since)
+            raw = self._search_children(
+                delta, fields, decode, keep_raw=True, updated_within=since,
+            )
+            self._cache.store(site, raw, field_sig, now, full=False)
+            logger.debug("Delta sync returned %d issue(s)", sum(len(v) for v in raw.values()))
+
+        return {key: self._cache.load_children(site, key) for key in epic_keys}
+
+    def _search_children(
+        self,
+        epic_keys: list[str],
+        fields: list[str],
+        decode: _IssueDecoder,
+        *,
+        keep_raw: bool = False,
+        updated_within: int | None = None,
+    ) -> dict[str, list[Any]]:
+        """Search the children of several Epics and partition them by epic link.
+
+        Issues are decoded page by page unless *keep_raw* asks for the raw
+        JSON.  *updated_within* (minutes) restricts the search to recently
+        updated issues for a delta sync.
+        """
+        clause = f'"{decode.epic_link_field}" in ({", ".join(epic_keys)})'
+        if updated_within is not None:
+            clause += f" AND updated >= -{updated_within}m"
+        jql = f"{clause} ORDER BY created ASC"
+        children: dict[str, list[Any]] = {key: [] for key in epic_keys}
+        by_upper = {key.upper(): children[key] for key in epic_keys}
+
+        if len(epic_keys) == 1:
+            # The JQL already selects a single Epic — nothing to partition
+            issues = self._iter_search(jql, fields)
+            children[epic_keys[0]].extend(issues if keep_raw else map(decode, issues))
+            return children
+
+        for raw in self._iter_search(jql, fields):
+            link = decode.epic_link(raw)
+            bucket = by_upper.get(link.upper()) if link else None
+            if bucket is None:
+                logger.debug("Skipping %s: epic link %r is not in this batch", raw["key"], link)
+                continue
+            bucket.append(raw if keep_raw else decode(raw))
 
         return children
 
+    def _iter_search(self, jql: str, fields: Sequence[str]) -> Iterator[dict[str, Any]]:
+        """Run a JQL search and yield raw issue JSON, following ``nextPageToken``.
+
+        Pages are fetched lazily so only one page of raw JSON is alive while
+        the caller decodes it.  With page prefetching enabled, the next page
+        is requested on a helper thread while the current one is decoded.
+        """
+        prefetcher: ThreadPoolExecutor | None = None
+        page = self._search_with_retry(jql, fields=fields)
+        try:
+            while True:
+                token = None if page.get("isLast") else page.get("nextPageToken")
+                pending = None
+                if token and self._prefetch_pages:
+                    if prefetcher is None:
+                        prefetcher = ThreadPoolExecutor(1, thread_name_prefix="jira-prefetch")
+                    pending = prefetcher.submit(
+                        self._search_with_retry, jql, fields=fields, next_page_token=token,
+                    )
+                yield from page.get("issues", [])
+                if not token:
+                    break
+                if pending is not None:
+                    page = pending.result()
+                else:
+                    page = self._search_with_retry(jql, fields=fields, next_page_token=token)
+        finally:
+            if prefetcher is not None:
+                prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def _epic_from_raw(self, raw: dict[str, Any]) -> EpicData:
+        fields = raw.get("fields") or {}
+        return EpicData(
+            key=raw["key"],
+            summary=fields.get("summary") or "",
+            status=self._name(fields.get("status")) or "",
+            priority=self._name(fields.get("priority")),
+            assignee=self._name(fields.get("assignee")),
+            reporter=self._name(fields.get("reporter")),
+            created=self._parse_dt(fields.get("created")),
+            updated=self._parse_dt(fields.get("updated")),
+            labels=fields.get("labels") or [],
+            fix_versions=[v["name"] for v in fields.get("fixVersions") or []],
+        )
+
     def _search_with_retry(
-        self, jql: str, *, start_at: int = 0, max_results: int = _MAX_RESULTS
-    ) -> list[Any]:
-        """Execute a JQL search with exponential backoff on 429."""
+        self,
+        jql: str,
+        *,
+        next_page_token: str | None = None,
+        max_results: int = _MAX_RESULTS,
+        fields: Sequence[str] = _KEY_ONLY,
+    ) -> dict[str, Any]:
+        """Fetch one page from ``/search/jql``, paced by the shared rate limiter.
+
+        Returns the raw JSON page (``issues``, ``nextPageToken``, ``isLast``);
+        no ``jira`` Resource objects are built.  Retries as
+        :meth:`_call_with_retry` does; the page, retries included, is timed
+        as the ``fetch.page`` stage of the current :mod:`timing` trace.
+        """
         assert self._jira is not None, "call connect() first"
+        with timing.span("fetch.page"):
+            return self._call_with_retry(
+                self._jira.enhanced_search_issues,
+                jql,
+                nextPageToken=next_page_token,
+                maxResults=max_results,
+                fields=list(fields),
+                json_result=True,
+            )
+
+    def _call_with_retry(self, call: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Make one Jira API call, paced by the shared rate limiter.
+
+        A 429 or 503 pauses every thread for the ``Retry-After`` delay (or a
+        jittered backoff) before the call is retried; a dropped connection
+        or a timeout is retried after a jittered backoff.  Other errors, and
+        the last failure, are raised.
+        """
+        import requests
+
         for attempt in range(_MAX_RETRIES):
+            self._limiter.acquire()
             try:
-                return self._jira.search_issues(
-                    jql, startAt=start_at, maxResults=max_results
+                return call(*args, **kwargs)
+            except _jira_error() as exc:
+                if exc.status_code not in RETRY_STATUSES or attempt == _MAX_RETRIES - 1:
+                    raise
+                response = getattr(exc, "response", None)
+                delay = self._limiter.backoff(
+                    attempt, retry_after_seconds(getattr(response, "headers", None)),
                 )
-            except JIRAError as exc:
-                if exc.status_code == 429 and attempt < _MAX_RETRIES - 1:
-                    delay = _BACKOFF_BASE * (2**attempt)
-                    logger.warning("Rate limited, retrying in %.1fs", delay)
-                    time.sleep(delay)
-                    continue
-                raise
+                logger.warning("Jira returned %s, retrying in %.1fs", exc.status_code, delay)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == _MAX_RETRIES - 1:
+                    raise
+                delay = self._limiter.backoff(attempt)
+                logger.warning("Jira request failed (%s), retrying in %.1fs", exc, delay)
+            timing.count("retries")
 
-        return []  # unreachable, but satisfies type checker
+        raise AssertionError("unreachable")
 
     @staticmethod
-    def _status_category(fields: Any) -> str:
-        status = getattr(fields, "status", None)
-        if status is None:
-            return "To Do"
-        cat = getattr(status, "statusCategory", None)
-        if cat is None:
-            return "To Do"
-        name = getattr(cat, "name", None)
-        return str(name) if name else "To Do"
-
-    @staticmethod
-    def _name(obj: Any) -> str | None:
+    def _name(obj: dict[str, Any] | str | None) -> str | None:
+        """Return the display name of a user or the name of a named field."""
         if obj is None:
             return None
         if isinstance(obj, str):
             return obj
-        return getattr(obj, "displayName", None) or str(obj)
+        return obj.get("displayName") or obj.get("name")
 
     @staticmethod
-    def _parse_dt(value: Any) -> "datetime | None":
+    def _parse_dt(value: Any) -> datetime | None:
+        """Parse a Jira timestamp such as ``2024-01-15T10:30:00.000+0000``.
+
+        Jira always sends this fixed-width layout, so the common case is a
+        ``fromisoformat`` on the first 23 characters plus a cached offset
+        lookup; anything else goes through ``dateutil``.
+        """
         if value is None:
             return None
+        if type(value) is str and len(value) == 28 and value[10] == "T":
+            tz = _TZ_OFFSETS.get(value[23:]) or _offset_tz(value[23:])
+            if tz is not None:
+                try:
+                    return datetime.fromisoformat(value[:23]).replace(tzinfo=tz)
+                except ValueError:
+                    pass
         from dateutil.parser import parse as dt_parse
 
         try:
             return dt_parse(str(value))
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return None
+
+
+# Jira's ``+HHMM`` offsets → tzinfo; a site only ever uses a handful
+_TZ_OFFSETS: dict[str, tzinfo] = {"+0000": timezone.utc}
+
+
+def _offset_tz(offset: str) -> tzinfo | None:
+    """Return (and cache) the tzinfo for a ``+HHMM``/``-HHMM`` offset."""
+    if len(offset) != 5 or offset[0] not in "+-" or not offset[1:].isdigit():
+        return None
+    minutes = int(offset[1:3]) * 60 + int(offset[3:])
+    if minutes >= 24 * 60:
+        return None
+    tz = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+    _TZ_OFFSETS[offset] = tz
+    return tz
+
+
+@overload
+def _interned(value: str) -> str: ...
+
+
+@overload
+def _interned(value: str | None) -> str | None: ...
+
+
+def _interned(value: str | None) -> str | None:
+    """Return the shared copy of a categorical string (``None`` passes through)."""
+    return None if value is None else sys.intern(value)
+
+
+def _chunk_keys(keys: Sequence[str], size: int) -> list[list[str]]:
+    """Split *keys* into chunks of at most *size* keys for ``in (...)`` clauses.
+
+    Chunks are also capped at ``_MAX_JQL_IN_CHARS`` characters.
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    length = 0
+    for key in keys:
+        if current and (len(current) >= size or length + len(key) + 2 > _MAX_JQL_IN_CHARS):
+            chunks.append(current)
+            current, length = [], 0
+        current.append(key)
+        length += len(key) + 2
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _IssueDecoder:
+    """Map raw child-issue JSON straight to :class:`JiraIssue`.
+
+    Built once per search with the configured field ids, so decoding an
+    issue is a fixed sequence of dict lookups.  Categorical strings are
+    interned: every issue would otherwise keep its own copy, parsed from
+    JSON, of the same handful of statuses, types and assignees.
+    """
+
+    __slots__ = ("_sp_fields", "epic_link_field")
+
+    def __init__(self, sp_field: str, epic_link_field: str) -> None:
+        # Fall back to the common story-points custom field
+        self._sp_fields = tuple(dict.fromkeys((sp_field, "customfield_10016")))
+        self.epic_link_field = epic_link_field
+
+    def __call__(self, raw: dict[str, Any]) -> JiraIssue:
+        fields = raw.get("fields") or {}
+        sp_val = None
+        for field_id in self._sp_fields:
+            sp_val = fields.get(field_id)
+            if sp_val is not None:
+                break
+        status = fields.get("status") or {}
+        category = (status.get("statusCategory") or {}).get("name")
+        return JiraIssue(
+            key=raw["key"],
+            summary=fields.get("summary") or "",
+            status=_interned(status.get("name") or ""),
+            status_category=_interned(category or "To Do"),
+            resolution=_interned(JiraClient._name(fields.get("resolution"))),
+            issue_type=_interned(JiraClient._name(fields.get("issuetype")) or ""),
+            story_points=float(sp_val) if sp_val is not None else None,
+            created=JiraClient._parse_dt(fields.get("created")),
+            resolved=JiraClient._parse_dt(fields.get("resolutiondate")),
+            assignee=_interned(JiraClient._name(fields.get("assignee"))),
+        )
+
+    def epic_link(self, raw: dict[str, Any]) -> str | None:
+        """Return the key of the Epic a raw child issue belongs to."""
+        fields = raw.get("fields") or {}
+        link = fields.get(self.epic_link_field)
+        if link is None:
+            # Team-managed projects link children through ``parent``
+            link = fields.get("parent")
+        if link is None or isinstance(link, str):
+            return link
+        return link.get("key")
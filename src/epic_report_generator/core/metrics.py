@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
 
 from epic_report_generator.core.data_models import EpicData, EpicMetrics, JiraIssue
 
@@ -11,7 +14,11 @@ logger = logging.getLogger(__name__)
 
 
 def calculate_metrics(epic: EpicData) -> EpicMetrics:
-    """Compute all metrics for a single Epic from its child issues."""
+    """Compute all metrics for a single Epic from its child issues.
+
+    The children are read once into an :class:`_IssueFrame`; every metric
+    is then a vectorised reduction over its columns.
+    """
     children = epic.children
     m = EpicMetrics()
 
@@ -19,26 +26,24 @@ def calculate_metrics(epic: EpicData) -> EpicMetrics:
         logger.debug("Epic %s has no children — returning empty metrics", epic.key)
         return m
 
+    frame = _IssueFrame.build(children)
+
     m.total_issues = len(children)
-    m.completed_issues = sum(1 for c in children if c.status_category == "Done")
+    m.completed_issues = int(np.count_nonzero(frame.done))
     m.open_issues = m.total_issues - m.completed_issues
-    m.unestimated_issues = sum(1 for c in children if not c.story_points)
-    m.total_sp = sum(c.story_points for c in children if c.story_points)
-    m.completed_sp = sum(
-        c.story_points for c in children if c.story_points and c.status_category == "Done"
-    )
+    m.unestimated_issues = m.total_issues - int(np.count_nonzero(frame.sp))
+    m.total_sp = float(frame.sp.sum())
+    m.completed_sp = float(frame.sp[frame.done].sum())
     m.remaining_sp = m.total_sp - m.completed_sp
     m.progress = _progress(m.completed_sp, m.total_sp, m.completed_issues, m.total_issues)
-    m.avg_cycle_time_days = _avg_cycle_time(children)
-    m.velocity_sp_per_week = _velocity(children, weeks=4)
-    m.scope_change_pct = _scope_change(children)
-    m.blocked_issues = sum(
-        1 for c in children if "blocked" in c.status.lower() and c.status_category != "Done"
-    )
+    m.avg_cycle_time_days = _avg_cycle_time(frame)
+    m.velocity_sp_per_week = _velocity(frame, weeks=4)
+    m.scope_change_pct = _scope_change(frame)
+    m.blocked_issues = int(np.count_nonzero(frame.blocked & ~frame.done))
     m.forecast_date = _forecast(m.remaining_sp, m.velocity_sp_per_week)
 
     # Build time-series
-    _build_time_series(m, children)
+    _build_time_series(m, frame)
 
     logger.debug(
         "Metrics for %s: progress=%.1f%%, %d/%d issues done, %.0f/%.0f SP",
@@ -48,6 +53,83 @@ def calculate_metrics(epic: EpicData) -> EpicMetrics:
     return m
 
 
+_DAY_US = 86_400 * 1_000_000
+_NO_DAY = date.max.toordinal() + 1  # day of issues that are never done
+
+
+class _IssueFrame(NamedTuple):
+    """The child issues of an Epic as columns, built in one pass.
+
+    Timestamps are POSIX microseconds (exact, so comparisons match the
+    ``datetime`` ones); days are proleptic ordinals.
+    """
+
+    done: np.ndarray  # bool: status category is Done
+    sp: np.ndarray  # float64 story points, 0 where unestimated
+    blocked: np.ndarray  # bool: status name mentions "blocked"
+    has_created: np.ndarray  # bool
+    created: np.ndarray  # int64 µs, 0 where unknown
+    created_day: np.ndarray  # int64: creation date in the issue's own zone
+    has_resolved: np.ndarray  # bool
+    resolved: np.ndarray  # int64 µs, 0 where unknown
+    done_day: np.ndarray  # int64: local day a done issue counts as done, else _NO_DAY
+
+    @classmethod
+    def build(cls, children: list[JiraIssue]) -> _IssueFrame:
+        blocked_status: dict[str, bool] = {}  # statuses are few (and interned)
+        done, sp, blocked = [], [], []
+        created, created_day, resolved, done_day = [], [], [], []
+        for c in children:
+            is_done = c.status_category == "Done"
+            done.append(is_done)
+            sp.append(c.story_points or 0.0)
+            flag = blocked_status.get(c.status)
+            if flag is None:
+                flag = blocked_status[c.status] = "blocked" in c.status.lower()
+            blocked.append(flag)
+            if c.created is not None:
+                created.append(c.created.timestamp())
+                created_day.append(c.created.toordinal())
+            else:
+                created.append(np.nan)
+                created_day.append(0)
+            if c.resolved is not None:
+                resolved.append(c.resolved.timestamp())
+                done_day.append(_resolved_day(c.resolved).toordinal() if is_done else _NO_DAY)
+            else:
+                resolved.append(np.nan)
+                done_day.append(_NO_DAY)
+
+        created_s = np.array(created, dtype=np.float64)
+        resolved_s = np.array(resolved, dtype=np.float64)
+        has_created = ~np.isnan(created_s)
+        has_resolved = ~np.isnan(resolved_s)
+        return cls(
+            done=np.array(done, dtype=bool),
+            sp=np.array(sp, dtype=np.float64),
+            blocked=np.array(blocked, dtype=bool),
+            has_created=has_created,
+            created=_microseconds(created_s, has_created),
+            created_day=np.array(created_day, dtype=np.int64),
+            has_resolved=has_resolved,
+            resolved=_microseconds(resolved_s, has_resolved),
+            done_day=np.array(done_day, dtype=np.int64),
+        )
+
+
+def _microseconds(seconds: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Round POSIX seconds to whole microseconds, ``datetime``'s resolution.
+
+    ``timestamp()`` is within a fraction of a microsecond of the exact
+    value, so rounding recovers it; invalid entries become 0.
+    """
+    return np.rint(np.where(valid, seconds, 0.0) * 1e6).astype(np.int64)
+
+
+def _to_microseconds(moment: datetime) -> int:
+    return round(moment.timestamp() * 1e6)
+
+
 # -- helpers ------------------------------------------------------------------
 
 
@@ -62,41 +144,33 @@ def _progress(
     return max(0.0, min(100.0, value))
 
 
-def _avg_cycle_time(children: list[JiraIssue]) -> float | None:
-    durations: list[float] = []
-    for c in children:
-        if c.status_category == "Done" and c.created and c.resolved:
-            delta = c.resolved - c.created
-            durations.append(delta.total_seconds() / 86400)
-    return sum(durations) / len(durations) if durations else None
+def _avg_cycle_time(frame: _IssueFrame) -> float | None:
+    closed = frame.done & frame.has_created & frame.has_resolved
+    if not closed.any():
+        return None
+    durations = (frame.resolved[closed] - frame.created[closed]) / _DAY_US
+    return float(durations.mean())
 
 
-def _velocity(children: list[JiraIssue], weeks: int = 4) -> float | None:
+def _velocity(frame: _IssueFrame, weeks: int = 4) -> float | None:
     """SP completed per week over the last *weeks* weeks."""
     cutoff = datetime.now().astimezone() - timedelta(weeks=weeks)
-    sp = sum(
-        c.story_points
-        for c in children
-        if c.story_points
-        and c.status_category == "Done"
-        and c.resolved
-        and c.resolved >= cutoff
-    )
+    recent = frame.done & frame.has_resolved & (frame.resolved >= _to_microseconds(cutoff))
+    sp = float(frame.sp[recent].sum())
     return sp / weeks if sp else None
 
 
-def _scope_change(children: list[JiraIssue]) -> float | None:
+def _scope_change(frame: _IssueFrame) -> float | None:
     """Percentage of issues added after the earliest issue."""
-    if len(children) < 2:
+    total = len(frame.done)
+    if total < 2:
         return None
-    dated = [(c, c.created) for c in children if c.created is not None]
-    dated.sort(key=lambda pair: pair[1])
-    if len(dated) < 2:
+    created = frame.created[frame.has_created]
+    if len(created) < 2:
         return None
-    first_created = dated[0][1]
-    threshold = first_created + timedelta(days=7)
-    added_later = sum(1 for _, dt in dated if dt > threshold)
-    return (added_later / len(children)) * 100
+    threshold = created.min() + 7 * _DAY_US
+    added_later = int(np.count_nonzero(created > threshold))
+    return (added_later / total) * 100
 
 
 def _forecast(remaining_sp: float, velocity: float | None) -> date | None:
@@ -106,46 +180,54 @@ def _forecast(remaining_sp: float, velocity: float | None) -> date | None:
     return date.today() + timedelta(weeks=weeks_remaining)
 
 
-def _build_time_series(m: EpicMetrics, children: list[JiraIssue]) -> None:
-    """Build daily time-series arrays for the trend chart."""
-    dated = [(c, c.created) for c in children if c.created is not None]
-    if not dated:
+def _build_time_series(m: EpicMetrics, frame: _IssueFrame) -> None:
+    """Build daily time-series arrays for the trend chart.
+
+    Each child contributes one "created" event and, when done, one
+    "resolved" event; the events are bucketed per day and summed
+    cumulatively, so the cost is O(issues + days).
+    """
+    dated = frame.has_created
+    if not dated.any():
         return
 
-    min_date = min(dt for _, dt in dated).date()
+    created_day = frame.created_day[dated]
+    # The series starts on the day of the earliest creation instant, which
+    # with mixed UTC offsets is not necessarily the earliest local date
+    min_date = date.fromordinal(int(created_day[np.argmin(frame.created[dated])]))
     max_date = date.today()
     if min_date >= max_date:
         return
-
-    day = min_date
-    dates: list[date] = []
-    total_sp_ts: list[float] = []
-    completed_sp_ts: list[float] = []
-    cum_issues: list[int] = []
-    cum_unest: list[int] = []
-
-    while day <= max_date:
-        day_end = datetime(day.year, day.month, day.day, 23, 59, 59)
-        day_end = day_end.astimezone()
-
-        created_by_day = [
-            c for c, dt in dated if dt.date() <= day
-        ]
-        done_by_day = [
-            c for c in created_by_day
-            if c.status_category == "Done" and c.resolved and c.resolved <= day_end
-        ]
-
-        dates.append(day)
-        total_sp_ts.append(sum(c.story_points or 0 for c in created_by_day))
-        completed_sp_ts.append(sum(c.story_points or 0 for c in done_by_day))
-        cum_issues.append(len(created_by_day))
-        cum_unest.append(sum(1 for c in created_by_day if not c.story_points))
-
-        day += timedelta(days=1)
-
-    m.dates = dates
-    m.total_sp_over_time = total_sp_ts
-    m.completed_sp_over_time = completed_sp_ts
-    m.cumulative_issues = cum_issues
-    m.cumulative_unestimated = cum_unest
+    n_days = (max_date - min_date).days + 1
+
+    # Day index on which each child starts counting.  An issue only counts
+    # as done once it has been created, so its done day is the later of both.
+    created_idx = np.maximum(created_day - min_date.toordinal(), 0)
+    done_idx = np.maximum(np.minimum(frame.done_day[dated] - min_date.toordinal(), n_days), created_idx)
+    sp = frame.sp[dated]
+    unestimated = sp == 0
+
+    m.dates = [min_date + timedelta(days=i) for i in range(n_days)]
+    m.total_sp_over_time = _cumulative(created_idx, n_days, sp)
+    m.completed_sp_over_time = _cumulative(done_idx, n_days, sp)
+    m.cumulative_issues = _cumulative(created_idx, n_days)
+    m.cumulative_unestimated = _cumulative(created_idx[unestimated], n_days)
+
+
+def _resolved_day(resolved: datetime) -> date:
+    """Return the first local day whose 23:59:59 end is at or after *resolved*."""
+    local = resolved.astimezone()
+    if local.microsecond and (local.hour, local.minute, local.second) == (23, 59, 59):
+        return local.date() + timedelta(days=1)
+    return local.date()
+
+
+def _cumulative(
+    day_idx: np.ndarray, n_days: int, weights: np.ndarray | None = None,
+) -> list:
+    """Running total per day of events at *day_idx* (ignoring days ≥ *n_days*)."""
+    keep = day_idx < n_days
+    per_day = np.bincount(
+        day_idx[keep], weights=None if weights is None else weights[keep], minlength=n_days,
+    )
+    return np.cumsum(per_day).tolist()
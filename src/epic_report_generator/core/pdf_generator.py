@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import io
 import logging
+import sys
+from collections.abc import Callable
 from datetime import date
 from typing import Any
 
@@ -14,6 +16,7 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
 from reportlab.platypus import (
     BaseDocTemplate,
+    Flowable,
     Frame,
     Image,
     PageBreak,
@@ -24,8 +27,10 @@ from reportlab.platypus import (
     TableStyle,
 )
 
-from epic_report_generator.core.chart_generator import generate_epic_chart
+from epic_report_generator.core import timing
 from epic_report_generator.core.data_models import EpicData, EpicMetrics, ReportConfig, ReportData
+from epic_report_generator.core.vector_chart import build_epic_drawing
+from epic_report_generator.services.chart_cache import ChartCache
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,8 @@ def _fmt_date(d: date, fmt: str) -> str:
 PAGE_W = 406 * mm  # ~1152 pt
 PAGE_H = 228.4 * mm  # ~648 pt
 MARGIN = 18 * mm
+_CHART_DPI = 150
+_CHART_W = (PAGE_W - 2 * MARGIN) * 0.62  # chart column of an Epic page
 
 # ---------------------------------------------------------------------------
 # Colour palettes
@@ -88,40 +95,71 @@ _DARK_PALETTE = {
 }
 
 
-def generate_pdf(report: ReportData) -> bytes:
-    """Build the full PDF report and return it as bytes."""
+def generate_pdf(
+    report: ReportData,
+    *,
+    on_progress: Callable[[str, int, int], None] | None = None,
+    chart_cache: ChartCache | None = None,
+) -> bytes:
+    """Build the full PDF report and return it as bytes.
+
+    *on_progress*, if given, is called as ``on_progress(stage, done, total)``
+    while the report is built: stage ``"charts"`` once per rendered Epic
+    chart, then stage ``"pages"`` once per laid-out page
+    (*total* is an estimate that grows if the summary spans several pages).
+    Charts already in *chart_cache* are not re-rendered.
+    Building the story, the charts and the layout (``doc.build``) are timed
+    as the ``story``, ``charts`` and ``layout`` stages of the current
+    :mod:`timing` trace.  Safe to call from a worker thread.
+    """
     dark = report.config.dark_mode
     pal = _DARK_PALETTE if dark else _LIGHT_PALETTE
+    n_epics = len(report.epics)
 
     logger.info(
         "Generating PDF: %d epic(s), dark_mode=%s, title=%r",
-        len(report.epics), dark, report.config.title,
+        n_epics, dark, report.config.title,
     )
 
     buf = io.BytesIO()
-    doc = _create_doc(buf, pal)
-    styles = _build_styles(pal)
-
     story: list[Any] = []
 
-    # Page 1 — Title
-    logger.debug("Building title page")
-    _add_title_page(story, report.config, styles, pal)
+    with timing.span("story"):
+        doc = _create_doc(buf, pal)
+        styles = _build_styles(pal)
 
-    # Page 2+ — Summary table
-    logger.debug("Building summary table for %d epic(s)", len(report.epics))
-    story.append(PageBreak())
-    _add_summary_table(story, report, styles, pal)
+        # Page 1 — Title
+        logger.debug("Building title page")
+        _add_title_page(story, report.config, styles, pal)
 
-    # Pages 3+ — Individual Epic pages
-    for i, (epic, metrics) in enumerate(zip(report.epics, report.metrics), 1):
-        logger.debug("Building epic page %d/%d: %s", i, len(report.epics), epic.key)
+        # Page 2+ — Summary table
+        logger.debug("Building summary table for %d epic(s)", n_epics)
         story.append(PageBreak())
-        _add_epic_page(story, epic, metrics, styles, pal, dark)
+        _add_summary_table(story, report, styles, pal)
+
+    with timing.span("charts"):
+        charts = _build_charts(report, on_progress, chart_cache)
+
+    # Pages 3+ — Individual Epic pages
+    with timing.span("story"):
+        for i, (epic, metrics, chart) in enumerate(zip(report.epics, report.metrics, charts), 1):
+            logger.debug("Building epic page %d/%d: %s", i, n_epics, epic.key)
+            story.append(PageBreak())
+            _add_epic_page(story, epic, metrics, chart, styles, pal)
+
+    if on_progress:
+        expected_pages = 2 + n_epics
+
+        def _on_build(kind: str, value: int) -> None:
+            if kind == "PAGE":
+                on_progress("pages", value, max(value, expected_pages))
+
+        doc.setProgressCallBack(_on_build)
 
-    doc.build(story)
+    with timing.span("layout"):
+        doc.build(story)
     result = buf.getvalue()
-    logger.info("PDF built: %d bytes, %d pages", len(result), 2 + len(report.epics))
+    logger.info("PDF built: %d bytes, %d pages", len(result), doc.page)
     return result
 
 
@@ -335,9 +373,9 @@ def _add_epic_page(
     story: list[Any],
     epic: EpicData,
     metrics: EpicMetrics,
+    chart: Flowable | None,
     styles: dict[str, ParagraphStyle],
     pal: dict[str, Any],
-    dark: bool,
 ) -> None:
     accent_hex = pal["accent"].hexval() if hasattr(pal["accent"], "hexval") else "#0052CC"
     # Header
@@ -353,7 +391,6 @@ def _add_epic_page(
     story.append(Spacer(1, 4 * mm))
 
     # Two-column layout: chart on left, summary on right
-    chart_img = _build_chart_image(metrics, dark)
     summary_tbl = _build_summary_box(metrics, styles, pal)
 
     avail_w = PAGE_W - 2 * MARGIN
@@ -362,8 +399,8 @@ def _add_epic_page(
     gap = avail_w * 0.03
 
     cols = []
-    if chart_img:
-        cols.append(chart_img)
+    if chart:
+        cols.append(chart)
     else:
         cols.append(Paragraph("<i>No chart data available</i>", styles["small"]))
     cols.append("")  # gap
@@ -379,8 +416,49 @@ def _add_epic_page(
     story.append(layout)
 
 
-def _build_chart_image(metrics: EpicMetrics, dark: bool) -> Image | None:
-    png = generate_epic_chart(metrics, dpi=150, dark=dark)
+def _build_charts(
+    report: ReportData,
+    on_progress: Callable[[str, int, int], None] | None,
+    chart_cache: ChartCache | None,
+) -> list[Flowable | None]:
+    """Build every Epic's trend chart with the backend chosen in the config."""
+    dark = report.config.dark_mode
+    total = len(report.metrics)
+
+    if report.config.chart_backend == "vector":
+        charts: list[Flowable | None] = []
+        for i, (epic, metrics) in enumerate(zip(report.epics, report.metrics), 1):
+            with timing.span("charts.render", epic=epic.key):
+                charts.append(build_epic_drawing(
+                    metrics, width=_CHART_W, height=_CHART_W / 2, dark=dark,
+                ))
+            if on_progress:
+                on_progress("charts", i, total)
+        return charts
+
+    # matplotlib is only imported (and its worker pool used) for raster charts
+    from epic_report_generator.core.chart_generator import render_charts
+
+    pngs = render_charts(
+        report.metrics, dpi=_CHART_DPI, dark=dark, cache=chart_cache,
+        epic_keys=[epic.key for epic in report.epics],
+        on_progress=(lambda done, n: on_progress("charts", done, n)) if on_progress else None,
+    )
+    return [_build_chart_image(png) for png in pngs]
+
+
+def shutdown_chart_pool() -> None:
+    """Stop the raster chart worker processes, if any were started.
+
+    The chart module is looked up rather than imported, so stopping a pool
+    that was never used does not load matplotlib.
+    """
+    chart_generator = sys.modules.get("epic_report_generator.core.chart_generator")
+    if chart_generator is not None:
+        chart_generator.shutdown_pool()
+
+
+def _build_chart_image(png: bytes | None) -> Image | None:
     if not png:
         return None
     buf = io.BytesIO(png)
@@ -0,0 +1,150 @@
+"""Adaptive token-bucket rate limiter for Jira Cloud requests."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 503})
+
+_INITIAL_RATE = 10.0  # requests per second
+_MIN_RATE = 0.5
+_MAX_RATE = 50.0
+_BURST = 10.0
+_RATE_STEP = 0.5  # additive increase per successful response
+_NEAR_LIMIT_FACTOR = 0.8
+_THROTTLED_FACTOR = 0.5
+_BACKOFF_BASE = 1.0  # seconds
+_MAX_BACKOFF = 60.0
+
+
+class RateLimiter:
+    """Pace requests from every thread of a :class:`JiraClient`.
+
+    Each request takes a token from a bucket refilled at ``rate`` tokens per
+    second.  The rate adapts to Jira's responses: it grows slowly while
+    requests succeed, drops when Jira reports it is near its limit, halves on
+    429/503, and is capped by ``X-RateLimit-Remaining`` over the time left
+    until ``X-RateLimit-Reset``.  A throttled response also pauses all
+    threads until its ``Retry-After`` (or a jittered exponential delay) has
+    passed.
+    """
+
+    def __init__(
+        self,
+        rate: float = _INITIAL_RATE,
+        *,
+        burst: float = _BURST,
+        min_rate: float = _MIN_RATE,
+        max_rate: float = _MAX_RATE,
+    ) -> None:
+        self.rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._tokens = burst
+        self._stamp = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    # -- pacing ---------------------------------------------------------------
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then take a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Pause every thread after a throttled request and return the delay.
+
+        Honours *retry_after* when Jira sent one, otherwise backs off
+        exponentially on *attempt* with full jitter.
+        """
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, _BACKOFF_BASE)
+        else:
+            delay = random.uniform(0, min(_MAX_BACKOFF, _BACKOFF_BASE * 2 ** (attempt + 1)))
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    # -- learning -------------------------------------------------------------
+
+    def observe(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """Adapt the rate to one HTTP response (usable as a ``requests`` hook)."""
+        status = getattr(response, "status_code", 0)
+        headers: Mapping[str, str] = getattr(response, "headers", None) or {}
+        with self._lock:
+            if status in RETRY_STATUSES:
+                self._set_rate(self.rate * _THROTTLED_FACTOR)
+            elif headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+                self._set_rate(self.rate * _NEAR_LIMIT_FACTOR)
+            elif 200 <= status < 300:
+                self._set_rate(self.rate + _RATE_STEP)
+
+            ceiling = _quota_rate(headers)
+            if ceiling is not None and ceiling < self.rate:
+                self._set_rate(ceiling)
+
+    # -- internals ------------------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def _set_rate(self, rate: float) -> None:
+        rate = max(self._min_rate, min(self._max_rate, rate))
+        if abs(rate - self.rate) >= 1:
+            logger.debug("Jira request rate %.1f/s -> %.1f/s", self.rate, rate)
+        self.rate = rate
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _quota_rate(headers: Mapping[str, str]) -> float | None:
+    """Return remaining requests per second until the rate-limit window resets."""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or not reset:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+        left = float(remaining)
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    seconds = (reset_at - datetime.now(timezone.utc)).total_seconds()
+    if seconds <= 0:
+        return None
+    return left / seconds
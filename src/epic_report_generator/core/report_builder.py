@@ -0,0 +1,50 @@
+"""Fetch Epics and compute their metrics for a report run."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from epic_report_generator.core import timing
+from epic_report_generator.core.data_models import ReportConfig, ReportData
+from epic_report_generator.core.jira_client import JiraClient
+from epic_report_generator.core.metrics import calculate_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def build_report(
+    jira: JiraClient,
+    config: ReportConfig,
+    *,
+    on_epic_fetched: Callable[[str, int, int], None] | None = None,
+) -> ReportData:
+    """Fetch every Epic in *config* and return the data the PDF is built from.
+
+    Epics that cannot be found are recorded in ``ReportData.errors``.
+    *on_epic_fetched* is passed through to :meth:`JiraClient.fetch_epics`.
+    The fetch and each Epic's metrics are timed as the ``fetch`` and
+    ``metrics`` stages of the current :mod:`timing` trace.
+    """
+    report = ReportData(config=config)
+    with timing.span("fetch"):
+        epics = jira.fetch_epics(
+            config.epic_keys,
+            sp_field=config.story_points_field,
+            epic_link_field=config.epic_link_field,
+            on_progress=on_epic_fetched,
+        )
+
+    for key, epic in zip(config.epic_keys, epics):
+        if epic is None:
+            logger.warning("Epic %s not found or inaccessible", key)
+            report.errors.append(f"Epic {key} not found. Check the key and try again.")
+            continue
+        with timing.span("metrics", epic=epic.key):
+            metrics = calculate_metrics(epic)
+        report.epics.append(epic)
+        report.metrics.append(metrics)
+        logger.debug("Epic %s: %d children, progress=%.1f%%", key, metrics.total_issues, metrics.progress)
+
+    logger.info("Fetched %d epic(s), %d error(s)", len(report.epics), len(report.errors))
+    return report
@@ -0,0 +1,233 @@
+"""Per-stage timing of a report run.
+
+A :class:`Trace` collects *spans* — timed sections of work, optionally tied
+to one Epic — and counters such as HTTP requests and bytes received.
+Instrumented code calls the module-level :func:`span`, :func:`record` and
+:func:`count`, which feed the trace made current by :func:`recording` and
+cost one global lookup when nothing is being recorded.
+
+The current trace is process-wide rather than per-thread because a run fans
+out over thread pools (Jira fetches, page prefetching); only one report is
+generated at a time.
+
+Stage names containing a dot (``fetch.request``) are nested inside another
+stage and may overlap each other when work runs concurrently; the
+remaining top-level stages are what :meth:`Trace.summary` shows.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from epic_report_generator import __version__
+
+logger = logging.getLogger(__name__)
+
+_active: Trace | None = None
+
+
+@dataclass
+class Span:
+    """One timed section of work."""
+
+    stage: str
+    start: float  # seconds since the trace started
+    seconds: float
+    epic: str | None = None
+    thread: str = ""
+
+
+class Trace:
+    """Spans and counters collected during one report run (thread-safe)."""
+
+    def __init__(self, name: str = "report") -> None:
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.elapsed: float | None = None
+        self.spans: list[Span] = []
+        self.counters: Counter[str] = Counter()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, start: float, seconds: float, epic: str | None = None) -> None:
+        """Record a span that began at *start* (a ``perf_counter`` value)."""
+        span = Span(stage, start - self._t0, seconds, epic, threading.current_thread().name)
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def finish(self) -> None:
+        """Stop the run's wall clock; later spans are still recorded."""
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self._t0
+
+    # -- breakdown ------------------------------------------------------------
+
+    def stages(self) -> dict[str, dict[str, float]]:
+        """Return ``{stage: {"calls", "seconds"}}`` in order of first use."""
+        totals: dict[str, dict[str, float]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span.stage, {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += span.seconds
+        return totals
+
+    def epics(self) -> dict[str, dict[str, float]]:
+        """Return ``{epic: {stage: seconds}}`` for spans tied to an Epic."""
+        totals: dict[str, dict[str, float]] = {}
+        with self._lock:
+            spans = [s for s in self.spans if s.epic]
+        for span in spans:
+            stages = totals.setdefault(span.epic, {})  # type: ignore[arg-type]
+            stages[span.stage] = stages.get(span.stage, 0.0) + span.seconds
+        return totals
+
+    def summary(self) -> str:
+        """One line for a status bar, e.g. ``2.41 s: fetch 1.20 s, … ; 14 requests, 1.2 MB``."""
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self._t0
+        parts = [
+            f"{stage} {entry['seconds']:.2f} s"
+            for stage, entry in self.stages().items() if "." not in stage
+        ]
+        text = f"{elapsed:.2f} s"
+        if parts:
+            text += ": " + ", ".join(parts)
+        counters = self._format_counters()
+        return f"{text}; {counters}" if counters else text
+
+    def report(self) -> str:
+        """Multi-line breakdown per stage and per Epic, for the log."""
+        lines = [f"Timing of {self.name}: {self.summary()}"]
+        for stage, entry in self.stages().items():
+            lines.append(f"  {stage:<16} {entry['seconds']:8.3f} s  {int(entry['calls']):>5} call(s)")
+        for epic, stages in self.epics().items():
+            detail = ", ".join(f"{stage} {seconds:.3f} s" for stage, seconds in stages.items())
+            lines.append(f"  {epic:<16} {detail}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the trace as JSON-serialisable data."""
+        with self._lock:
+            spans = [asdict(s) for s in self.spans]
+            counters = dict(self.counters)
+        return {
+            "name": self.name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "elapsed": self.elapsed,
+            "machine": {
+                "app": __version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+            },
+            "counters": counters,
+            "stages": self.stages(),
+            "epics": self.epics(),
+            "spans": spans,
+        }
+
+    @property
+    def filename(self) -> str:
+        """Return a default file name for the trace, e.g. ``trace-20260101T120000Z.json``."""
+        return f"trace-{self.started_at:%Y%m%dT%H%M%SZ}.json"
+
+    def write(self, path: Path) -> None:
+        """Write the trace as JSON to *path*, creating its directory."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+        logger.info("Timing trace written to %s", path)
+
+    def _format_counters(self) -> str:
+        with self._lock:
+            counters = dict(self.counters)
+        parts = []
+        if "requests" in counters:
+            parts.append(f"{counters['requests']} request(s)")
+        if "bytes" in counters:
+            parts.append(_format_bytes(counters["bytes"]))
+        retries = counters.get("retries", 0)
+        if retries:
+            parts.append(f"{retries} {'retry' if retries == 1 else 'retries'}")
+        return ", ".join(parts)
+
+
+@contextmanager
+def recording(trace: Trace) -> Iterator[Trace]:
+    """Make *trace* the current trace for the duration of the block."""
+    global _active
+    previous, _active = _active, trace
+    try:
+        yield trace
+    finally:
+        _active = previous
+
+
+@contextmanager
+def span(stage: str, epic: str | None = None) -> Iterator[None]:
+    """Time the block as *stage* of the current trace, if one is recording."""
+    trace = _active
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(stage, start, time.perf_counter() - start, epic)
+
+
+def record(stage: str, seconds: float, epic: str | None = None) -> None:
+    """Add a span timed elsewhere (e.g. in a worker process) that ended now."""
+    trace = _active
+    if trace is not None:
+        trace.add(stage, time.perf_counter() - seconds, seconds, epic)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Increment a counter of the current trace, if one is recording."""
+    trace = _active
+    if trace is not None:
+        trace.count(name, n)
+
+
+def observe_response(response: Any, *args: Any, **kwargs: Any) -> None:
+    """Count one HTTP response and its size (usable as a ``requests`` hook).
+
+    The body size is taken from ``Content-Length`` — the bytes on the wire
+    for compressed responses — and falls back to the decoded body.
+    """
+    trace = _active
+    if trace is None:
+        return
+    trace.count("requests")
+    length = response.headers.get("Content-Length")
+    trace.count("bytes", int(length) if length and length.isdigit() else len(response.content))
+    elapsed = getattr(response, "elapsed", None)
+    if elapsed is not None:
+        seconds = elapsed.total_seconds()
+        trace.add("fetch.request", time.perf_counter() - seconds, seconds)
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
@@ -0,0 +1,211 @@
+"""ReportLab vector version of the Jira-style Epic trend chart.
+
+Draws the same chart as :func:`chart_generator.generate_epic_chart` with
+``reportlab.graphics`` shapes, so it goes straight into the PDF story: no
+matplotlib, no PNG encode/decode, and it stays sharp at any zoom level.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable
+from datetime import date
+
+from reportlab.graphics.shapes import Drawing, Group, Line, PolyLine, Polygon, Rect, String
+from reportlab.lib import colors
+
+from epic_report_generator.core.chart_style import DARK, LIGHT, format_tick_date, weekend_spans
+from epic_report_generator.core.data_models import EpicMetrics
+
+logger = logging.getLogger(__name__)
+
+_FONT = "Helvetica"
+_TICK_FONT_SIZE = 9
+_LABEL_FONT_SIZE = 10
+_LEGEND_FONT_SIZE = 8
+
+# Plot-area insets (points) leaving room for tick labels and axis titles
+_PAD_LEFT = 48
+_PAD_RIGHT = 44
+_PAD_TOP = 8
+_PAD_BOTTOM = 40
+
+_DATE_STEPS = (1, 2, 3, 7, 14, 30, 61, 91, 182, 365)  # candidate x-tick spacing, days
+_MAX_DATE_TICKS = 10
+
+
+def build_epic_drawing(
+    metrics: EpicMetrics, *, width: float, height: float, dark: bool = False,
+) -> Drawing | None:
+    """Build the trend chart as a *width* × *height* point Drawing.
+
+    Returns ``None`` if there is no time-series data to plot.
+    """
+    dates = metrics.dates
+    if not dates:
+        logger.debug("No time-series data — skipping chart")
+        return None
+
+    logger.debug("Drawing vector chart: %d data points, dark=%s", len(dates), dark)
+    pal = {name: colors.HexColor(value) for name, value in (DARK if dark else LIGHT).items()}
+
+    drawing = Drawing(width, height)
+    drawing.add(Rect(0, 0, width, height, fillColor=pal["face"], strokeColor=None))
+
+    x0, x1 = _PAD_LEFT, width - _PAD_RIGHT
+    y0, y1 = _PAD_BOTTOM, height - _PAD_TOP
+    drawing.add(Rect(x0, y0, x1 - x0, y1 - y0, fillColor=pal["bg"], strokeColor=None))
+
+    first, span = dates[0].toordinal(), max(1, dates[-1].toordinal() - dates[0].toordinal())
+
+    def sx(d: date) -> float:
+        return x0 + (d.toordinal() - first) / span * (x1 - x0)
+
+    sp_ticks = _nice_ticks(max(max(metrics.total_sp_over_time, default=0),
+                               max(metrics.completed_sp_over_time, default=0)))
+    issue_ticks = _nice_ticks(max(max(metrics.cumulative_issues, default=0),
+                                  max(metrics.cumulative_unestimated, default=0)), integer=True)
+
+    def sy_left(v: float) -> float:
+        return y0 + v / sp_ticks[-1] * (y1 - y0)
+
+    def sy_right(v: float) -> float:
+        return y0 + v / issue_ticks[-1] * (y1 - y0)
+
+    # Weekend bands
+    for start, end in weekend_spans(dates):
+        drawing.add(Rect(sx(start), y0, sx(end) - sx(start), y1 - y0,
+                         fillColor=pal["weekend"], strokeColor=None))
+
+    # Horizontal grid behind the data
+    for v in sp_ticks[1:]:
+        drawing.add(Line(x0, sy_left(v), x1, sy_left(v), strokeColor=pal["grid"], strokeWidth=0.3))
+
+    # Total / completed SP areas (left axis)
+    xs = [sx(d) for d in dates]
+    for values, colour in (
+        (metrics.total_sp_over_time, pal["total_sp"]),
+        (metrics.completed_sp_over_time, pal["done_sp"]),
+    ):
+        points = [xs[0], y0, *_step_points(xs, [sy_left(v) for v in values]), xs[-1], y0]
+        drawing.add(Polygon(points, fillColor=colour, fillOpacity=0.7, strokeColor=None))
+
+    # Cumulative issues / unestimated step lines (right axis)
+    drawing.add(PolyLine(
+        _step_points(xs, [sy_right(v) for v in metrics.cumulative_issues]),
+        strokeColor=pal["cum_issues"], strokeWidth=1.5,
+    ))
+    drawing.add(PolyLine(
+        _step_points(xs, [sy_right(v) for v in metrics.cumulative_unestimated]),
+        strokeColor=pal["cum_unest"], strokeWidth=1.5, strokeDashArray=[4, 2],
+    ))
+
+    # Frame
+    drawing.add(Rect(x0, y0, x1 - x0, y1 - y0, fillColor=None, strokeColor=pal["grid"], strokeWidth=0.8))
+
+    _draw_axes(drawing, pal, (x0, y0, x1, y1), dates, sx, sp_ticks, sy_left, issue_ticks, sy_right)
+    _draw_legend(drawing, pal, x0 + 6, y1 - 6)
+    return drawing
+
+
+# -- helpers ------------------------------------------------------------------
+
+
+def _step_points(xs: list[float], ys: list[float]) -> list[float]:
+    """Flatten a "post" step curve: each value holds until the next x."""
+    points: list[float] = []
+    for i in range(len(xs) - 1):
+        points += [xs[i], ys[i], xs[i + 1], ys[i]]
+    points += [xs[-1], ys[-1]]
+    return points
+
+
+def _nice_ticks(vmax: float, *, count: int = 6, integer: bool = False) -> list[float]:
+    """Return evenly spaced ticks from 0 covering *vmax* with round steps."""
+    if vmax <= 0:
+        return [0, 1]
+    raw = vmax / (count - 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    if integer:
+        step = max(1, math.ceil(step))
+    return [i * step for i in range(math.ceil(vmax / step) + 1)]
+
+
+def _fmt_tick(value: float) -> str:
+    return f"{value:g}"
+
+
+def _draw_axes(
+    drawing: Drawing,
+    pal: dict[str, colors.Color],
+    box: tuple[float, float, float, float],
+    dates: list[date],
+    sx: Callable[[date], float],
+    sp_ticks: list[float],
+    sy_left: Callable[[float], float],
+    issue_ticks: list[float],
+    sy_right: Callable[[float], float],
+) -> None:
+    x0, y0, x1, y1 = box
+    label = pal["label_color"]
+    tick = {"fontName": _FONT, "fontSize": _TICK_FONT_SIZE, "fillColor": label}
+
+    for v in sp_ticks:
+        y = sy_left(v)
+        drawing.add(Line(x0 - 3, y, x0, y, strokeColor=pal["grid"], strokeWidth=0.8))
+        drawing.add(String(x0 - 5, y - 3, _fmt_tick(v), textAnchor="end", **tick))
+    for v in issue_ticks:
+        y = sy_right(v)
+        drawing.add(Line(x1, y, x1 + 3, y, strokeColor=pal["grid"], strokeWidth=0.8))
+        drawing.add(String(x1 + 5, y - 3, _fmt_tick(v), textAnchor="start", **tick))
+
+    # Date ticks, rotated like matplotlib's autofmt_xdate(rotation=30, ha="right")
+    days = dates[-1].toordinal() - dates[0].toordinal()
+    step = next((s for s in _DATE_STEPS if days / s < _MAX_DATE_TICKS), _DATE_STEPS[-1])
+    for d in dates[::step]:
+        x = sx(d)
+        drawing.add(Line(x, y0 - 3, x, y0, strokeColor=pal["grid"], strokeWidth=0.8))
+        g = Group(String(0, 0, format_tick_date(d), textAnchor="end", **tick))
+        g.translate(x + 3, y0 - 11)
+        g.rotate(30)
+        drawing.add(g)
+
+    axis_title = {"fontName": _FONT, "fontSize": _LABEL_FONT_SIZE, "fillColor": label,
+                  "textAnchor": "middle"}
+    left = Group(String(0, 0, "Story Points", **axis_title))
+    left.translate(12, (y0 + y1) / 2)
+    left.rotate(90)
+    right = Group(String(0, 0, "Issues", **axis_title))
+    right.translate(drawing.width - 6, (y0 + y1) / 2)
+    right.rotate(90)
+    drawing.add(left)
+    drawing.add(right)
+
+
+def _draw_legend(drawing: Drawing, pal: dict[str, colors.Color], x: float, top: float) -> None:
+    entries = (
+        ("Total Story Points", "area", pal["total_sp"]),
+        ("Completed Story Points", "area", pal["done_sp"]),
+        ("Cumulative Issues", "line", pal["cum_issues"]),
+        ("Unestimated Issues", "dash", pal["cum_unest"]),
+    )
+    row_h, pad, swatch = 11, 5, 16
+    width = pad * 3 + swatch + max(
+        len(text) for text, _, _ in entries
+    ) * _LEGEND_FONT_SIZE * 0.5
+    height = pad * 2 + row_h * len(entries)
+    drawing.add(Rect(x, top - height, width, height, rx=2, ry=2,
+                     fillColor=pal["legend_face"], fillOpacity=0.9,
+                     strokeColor=pal["grid"], strokeWidth=0.5))
+    for i, (text, kind, colour) in enumerate(entries):
+        cy = top - pad - row_h * i - row_h / 2
+        sx = x + pad
+        if kind == "area":
+            drawing.add(Rect(sx, cy - 3.5, swatch, 7, fillColor=colour, fillOpacity=0.7, strokeColor=None))
+        else:
+            drawing.add(Line(sx, cy, sx + swatch, cy, strokeColor=colour, strokeWidth=1.5,
+                             strokeDashArray=[4, 2] if kind == "dash" else None))
+        drawing.add(String(sx + swatch + pad, cy - 3, text, fontName=_FONT,
+                           fontSize=_LEGEND_FONT_SIZE, fillColor=pal["label_color"]))
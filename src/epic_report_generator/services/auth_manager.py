@@ -11,7 +11,6 @@ from typing import Any
 from urllib.parse import urlencode
 
 import keyring
-import requests
 
 from epic_report_generator.services.config_manager import ConfigManager
 from epic_report_generator.services.oauth_server import wait_for_callback
@@ -71,10 +70,19 @@ class AuthManager:
         """Return the stored Jira email (API-token auth)."""
         return str(self._config.get("jira_email", ""))
 
+    @property
+    def api_endpoint(self) -> str:
+        """Return the API-token endpoint that last worked: ``"instance"``, ``"cloud"``, or ``""``."""
+        return str(self._config.get("api_endpoint", ""))
+
     def set_cloud_id(self, cloud_id: str) -> None:
         """Persist a cloud_id discovered during connection."""
         self._config.set("cloud_id", cloud_id)
 
+    def set_api_endpoint(self, endpoint: str) -> None:
+        """Persist which API-token endpoint accepted the credentials."""
+        self._config.set("api_endpoint", endpoint)
+
     # -- API-token auth -------------------------------------------------------
 
     def login_api_token(self, url: str, email: str, token: str) -> None:
@@ -94,6 +102,7 @@ class AuthManager:
             "jira_url": url.rstrip("/"),
             "jira_email": email,
             "site_name": site_name,
+            "api_endpoint": "",
         })
         logger.info("API-token credentials stored (site=%s)", site_name)
 
@@ -214,12 +223,15 @@ class AuthManager:
             "jira_url": "",
             "jira_email": "",
             "cloud_id": "",
+            "api_endpoint": "",
             "site_name": "",
         })
 
     # -- internals ------------------------------------------------------------
 
     def _exchange_code(self, code: str, redirect_uri: str) -> dict[str, Any] | None:
+        import requests  # slow to import; only needed for OAuth
+
         logger.debug("Exchanging authorization code for tokens")
         try:
             resp = requests.post(
@@ -245,6 +257,8 @@ class AuthManager:
             return None
 
     def _refresh_token(self, refresh_token: str) -> str | None:
+        import requests
+
         logger.debug("Refreshing access token")
         try:
             resp = requests.post(
@@ -276,6 +290,8 @@ class AuthManager:
     def _fetch_accessible_resources(
         self, access_token: str
     ) -> list[dict[str, str]] | None:
+        import requests
+
         try:
             resp = requests.get(
                 _RESOURCES_URL,
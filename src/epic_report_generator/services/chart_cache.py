@@ -0,0 +1,99 @@
+"""Disk LRU cache of rendered chart PNGs, keyed by content hash."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+
+from epic_report_generator.services.config_manager import APP_NAME
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "charts"
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class ChartCache:
+    """Store chart images as ``<key>.png`` files under the user cache dir.
+
+    Keys are content hashes (see :func:`chart_generator.chart_key`), so an
+    entry never goes stale; it just stops being asked for.  Reading an entry
+    refreshes its modification time, and once the directory grows beyond
+    *max_bytes* the least recently used files are deleted.
+    """
+
+    def __init__(self, path: Path | None = None, *, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self._dir = path or Path(user_cache_dir(APP_NAME, appauthor=False)) / CACHE_DIRNAME
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: int | None = None  # bytes on disk, scanned on first write
+
+    # -- public API -----------------------------------------------------------
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached PNG for *key*, or ``None`` on a miss."""
+        path = self._dir / f"{key}.png"
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, png: bytes) -> None:
+        """Store *png* under *key*, evicting old entries if over the size cap."""
+        path = self._dir / f"{key}.png"
+        with self._lock:
+            try:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                if self._size is None:
+                    self._size = sum(size for _, size, _ in self._entries())
+                existing = path.stat().st_size if path.exists() else 0
+                # Write-then-rename so a concurrent reader never sees half a file
+                fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(png)
+                os.replace(tmp, path)
+            except OSError as exc:
+                logger.warning("Could not cache chart %s: %s", key[:12], exc)
+                return
+            self._size += len(png) - existing
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        """Delete every cached chart."""
+        logger.info("Clearing chart cache at %s", self._dir)
+        with self._lock:
+            for path, _, _ in self._entries():
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    # -- internals ------------------------------------------------------------
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        entries = []
+        for path in self._dir.glob("*.png"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        self._size = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+            removed += 1
+        logger.debug("Evicted %d chart(s); cache now %d bytes", removed, self._size)
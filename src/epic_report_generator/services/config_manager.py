@@ -22,6 +22,7 @@ _DEFAULTS: dict[str, Any] = {
     "client_secret": "",
     "callback_port": 18492,
     "cloud_id": "",
+    "api_endpoint": "",       # "instance" or "cloud" — API-token URL that last worked
     "site_name": "",
     "theme": "light",
     "default_title": "Epic Progress Report",
@@ -30,6 +31,8 @@ _DEFAULTS: dict[str, Any] = {
     "last_epic_keys": [],
     "story_points_field": "story_points",
     "epic_link_field": "customfield_10014",
+    "chart_backend": "raster",  # "raster" (matplotlib image) or "vector" (reportlab)
+    "timing_trace_dir": "",   # write a JSON timing trace of every report here; empty = off
 }
 
 
@@ -0,0 +1,203 @@
+"""SQLite store of Jira child issues for incremental Epic syncs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_data_dir
+
+from epic_report_generator.services.config_manager import APP_NAME
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "issues.sqlite3"
+FULL_SYNC_INTERVAL = 24 * 3600  # seconds between full reconciliations
+
+# Bumped when the tables change; an older cache is dropped and re-synced
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    site TEXT NOT NULL,
+    key TEXT NOT NULL,
+    epic_key TEXT NOT NULL,
+    created REAL,  -- UTC epoch seconds, so issues sort across offsets
+    updated TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (site, key)
+);
+CREATE INDEX IF NOT EXISTS issues_by_epic ON issues (site, epic_key);
+CREATE TABLE IF NOT EXISTS epics (
+    site TEXT NOT NULL,
+    epic_key TEXT NOT NULL,
+    field_sig TEXT NOT NULL,
+    last_sync REAL NOT NULL,
+    last_full_sync REAL NOT NULL,
+    PRIMARY KEY (site, epic_key)
+);
+"""
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """When an Epic's children were last synced, and with which fields."""
+
+    field_sig: str
+    last_sync: float
+    last_full_sync: float
+
+
+class IssueCache:
+    """Persist raw child-issue JSON per Jira site, keyed by issue key.
+
+    Each Epic records when it was last synced so the next fetch only asks
+    Jira for issues updated since then.  A full re-download replaces the
+    Epic's rows every *full_sync_interval* seconds, which drops deleted
+    issues and issues moved to another Epic.
+    """
+
+    def __init__(
+        self, path: Path | None = None, *, full_sync_interval: float = FULL_SYNC_INTERVAL,
+    ) -> None:
+        self._path = path or Path(user_data_dir(APP_NAME, appauthor=False)) / CACHE_FILENAME
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    # -- public API -----------------------------------------------------------
+
+    def sync_state(self, site: str, epic_key: str) -> SyncState | None:
+        """Return the last sync of *epic_key*, or ``None`` if never synced."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT field_sig, last_sync, last_full_sync FROM epics"
+                " WHERE site = ? AND epic_key = ?",
+                (site, epic_key),
+            ).fetchone()
+        return SyncState(*row) if row else None
+
+    def needs_full_sync(self, state: SyncState | None, field_sig: str, now: float) -> bool:
+        """Return True when an Epic must be re-downloaded instead of delta-synced."""
+        return (
+            state is None
+            or state.field_sig != field_sig
+            or now - state.last_full_sync >= self.full_sync_interval
+        )
+
+    def load_children(self, site: str, epic_key: str) -> list[dict[str, Any]]:
+        """Return the cached raw JSON of an Epic's children, oldest first."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT payload FROM issues WHERE site = ? AND epic_key = ?"
+                " ORDER BY created, key",
+                (site, epic_key),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def store(
+        self,
+        site: str,
+        children: dict[str, list[dict[str, Any]]],
+        field_sig: str,
+        synced_at: float,
+        *,
+        full: bool,
+    ) -> None:
+        """Record a sync of the Epics in *children* (epic key → raw issues).
+
+        A *full* sync replaces each Epic's rows; otherwise the issues are
+        merged in, moving re-parented issues to their new Epic.
+        """
+        with self._lock, self._db() as conn:
+            for epic_key, issues in children.items():
+                if full:
+                    conn.execute(
+                        "DELETE FROM issues WHERE site = ? AND epic_key = ?", (site, epic_key),
+                    )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO issues"
+                    " (site, key, epic_key, created, updated, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            site, raw["key"], epic_key,
+                            _epoch(raw.get("fields", {}).get("created")),
+                            raw.get("fields", {}).get("updated"),
+                            json.dumps(raw, separators=(",", ":")),
+                        )
+                        for raw in issues
+                    ],
+                )
+                if full:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO epics VALUES (?, ?, ?, ?, ?)",
+                        (site, epic_key, field_sig, synced_at, synced_at),
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE epics SET last_sync = ? WHERE site = ? AND epic_key = ?",
+                        (synced_at, site, epic_key),
+                    )
+        logger.debug(
+            "Cached %d issue(s) for %d epic(s) (full=%s)",
+            sum(len(v) for v in children.values()), len(children), full,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached issue and sync record."""
+        logger.info("Clearing issue cache at %s", self._path)
+        with self._lock, self._db() as conn:
+            conn.execute("DELETE FROM issues")
+            conn.execute("DELETE FROM epics")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- internals ------------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                logger.debug("Creating issue cache schema %d (found %d)", _SCHEMA_VERSION, version)
+                conn.executescript(
+                    "DROP TABLE IF EXISTS issues; DROP TABLE IF EXISTS epics;"
+                    f"{_SCHEMA} PRAGMA user_version = {_SCHEMA_VERSION};"
+                )
+            self._conn = conn
+            logger.debug("Issue cache opened at %s", self._path)
+        return self._conn
+
+
+def _epoch(value: Any) -> float | None:
+    """Return a Jira timestamp (``2024-01-15T10:30:00.000+0300``) as epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except (TypeError, ValueError):
+        logger.debug("Unparseable created timestamp %r", value)
+        return None
+
+
+def minutes_since(timestamp: float, *, margin: int = 5) -> int:
+    """Return whole minutes elapsed since *timestamp*, plus a safety *margin*.
+
+    Used for relative JQL (``updated >= -Nm``), which avoids depending on
+    the Jira user's time zone.
+    """
+    return int((time.time() - timestamp) // 60) + 1 + margin
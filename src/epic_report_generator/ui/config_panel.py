@@ -164,6 +164,18 @@ class ConfigPanel(QWidget):
         self._date_edit.setToolTip("Date shown on the title page")
         meta.addWidget(self._date_edit)
 
+        chart_lbl = QLabel("Chart Style")
+        chart_lbl.setProperty("subheading", "true")
+        meta.addWidget(chart_lbl)
+        self._chart_combo = QComboBox()
+        self._chart_combo.addItem("Image", "raster")
+        self._chart_combo.addItem("Vector (sharper, smaller PDF)", "vector")
+        self._chart_combo.setToolTip(
+            "Image charts are rendered with matplotlib; vector charts are drawn "
+            "directly into the PDF and stay sharp when zoomed"
+        )
+        meta.addWidget(self._chart_combo)
+
         root.addWidget(self._meta_section)
 
         # Confidentiality Notice (collapsible)
@@ -214,10 +226,12 @@ class ConfigPanel(QWidget):
         self._company_field.text = self._config.get("default_company", "")
         self._sp_field.text = self._config.get("story_points_field", "story_points")
         self._epic_link_field.text = self._config.get("epic_link_field", "customfield_10014")
+        self._set_chart_backend(self._config.get("chart_backend", "raster"))
 
     def _persist_values(self) -> None:
         self._config.update({
             "last_epic_keys": self._epic_tag_input.get_keys(),
+            "chart_backend": self._chart_combo.currentData(),
             "story_points_field": self._sp_field.text.strip() or "story_points",
             "epic_link_field": self._epic_link_field.text.strip() or "customfield_10014",
         })
@@ -272,6 +286,7 @@ class ConfigPanel(QWidget):
             company_name=self._company_field.text.strip(),
             story_points_field=self._sp_field.text.strip() or "story_points",
             epic_link_field=self._epic_link_field.text.strip() or "customfield_10014",
+            chart_backend=self._chart_combo.currentData(),
         )
 
         self._persist_values()
@@ -286,6 +301,7 @@ class ConfigPanel(QWidget):
         self._project_name_field.text = ""
         self._date_edit.setDate(QDate.currentDate())
         self._conf_check.setChecked(False)
+        self._set_chart_backend(self._config.get("chart_backend", "raster"))
         self._company_field.text = self._config.get("default_company", "")
         self._sp_field.text = self._config.get("story_points_field", "story_points")
         self._epic_link_field.text = self._config.get("epic_link_field", "customfield_10014")
@@ -297,6 +313,10 @@ class ConfigPanel(QWidget):
 
     # -- helpers --------------------------------------------------------------
 
+    def _set_chart_backend(self, backend: str) -> None:
+        index = self._chart_combo.findData(backend)
+        self._chart_combo.setCurrentIndex(max(0, index))
+
     def _validate_epics(self) -> None:
         if not self._jira.connected:
             QMessageBox.information(self, "Not Connected", "Connect to Jira first.")
@@ -3,45 +3,59 @@
 from __future__ import annotations
 
 import logging
+import sys
 from collections import deque
+from itertools import chain
+from typing import Any
 
-from PySide6.QtCore import QObject, Signal, Qt
-from PySide6.QtGui import QTextCharFormat, QColor, QFont
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QTimer, Qt
+from PySide6.QtGui import QColor, QFont, QGuiApplication, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
-    QPlainTextEdit,
+    QLineEdit,
+    QListView,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 
-class _QtLogHandler(logging.Handler, QObject):
-    """Logging handler that emits a Qt signal for each log record.
+class _QtLogHandler(logging.Handler):
+    """Logging handler that queues formatted lines for the log panel.
 
-    Inherits from both ``logging.Handler`` and ``QObject`` so it can
-    live in the logging system while emitting cross-thread signals.
+    ``emit`` formats the record on the logging thread — so its arguments
+    are rendered before the caller can mutate them and no traceback is
+    kept alive in the queue — and appends the line to a bounded deque
+    (atomic in CPython, so no lock and no cross-thread Qt signal per
+    line); the panel drains it in batches from the GUI thread.
     """
 
-    message_logged = Signal(str, int)  # formatted message, log level
-
-    def __init__(self) -> None:
-        logging.Handler.__init__(self)
-        QObject.__init__(self)
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self._lines: deque[tuple[str, int]] = deque(maxlen=capacity)
         self.setFormatter(
             logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s",
                               datefmt="%H:%M:%S")
         )
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Format the record and emit via the Qt signal."""
+        """Format the record and queue it with its level."""
         try:
-            msg = self.format(record)
-            self.message_logged.emit(msg, record.levelno)
+            self._lines.append((self.format(record), record.levelno))
         except Exception:
             self.handleError(record)
 
+    def drain(self) -> list[tuple[str, int]]:
+        """Remove every queued line and return ``(formatted, level)`` pairs."""
+        lines: list[tuple[str, int]] = []
+        while True:
+            try:
+                lines.append(self._lines.popleft())
+            except IndexError:
+                return lines
+
 
 # Colours per log level
 _LEVEL_COLORS: dict[int, str] = {
@@ -68,7 +82,157 @@ _FILTER_ACCENTS: dict[int, str] = {
     logging.ERROR: "#DE350B",
 }
 
-_MAX_BUFFER = 5000
+_MAX_BUFFER = 200_000  # lines kept for the viewer
+_FLUSH_INTERVAL_MS = 100
+_SEARCH_DEBOUNCE_MS = 200
+
+
+class _LogModel(QAbstractListModel):
+    """Read-only list model over a ring buffer of formatted log lines.
+
+    Lines are stored once, in arrival order, in a bounded deque and are
+    identified by a running sequence number.  Per-level deques of sequence
+    numbers let a level filter be applied by merging the active levels'
+    lists instead of rebuilding a document; a text search only scans the
+    rows that pass the level filter.  With nothing filtered out, rows map
+    straight onto the buffer.
+    """
+
+    def __init__(self, capacity: int, font: QFont, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._capacity = capacity
+        self._lines: deque[tuple[str, int]] = deque()
+        self._first_seq = 0  # sequence number of self._lines[0]
+        self._by_level: dict[int, deque[int]] = {}
+        self._levels: set[int] = set(_LEVEL_COLORS)
+        self._needle = ""
+        self._rows: deque[int] | None = None  # matching sequence numbers; None = every line
+        self._bold = QFont(font)
+        self._bold.setWeight(QFont.Weight.Bold)
+        self._colors: dict[int, QColor] = {}
+        self.set_dark(False)
+
+    # -- Qt model interface ---------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        if parent.isValid():
+            return 0
+        return len(self._lines) if self._rows is None else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        text, level = self.line(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors.get(level, self._colors[logging.INFO])
+        if role == Qt.ItemDataRole.FontRole and level >= logging.WARNING:
+            return self._bold
+        return None
+
+    # -- public API -----------------------------------------------------------
+
+    def line(self, row: int) -> tuple[str, int]:
+        """Return the ``(text, level)`` shown at *row*."""
+        if self._rows is None:
+            return self._lines[row]
+        return self._lines[self._rows[row] - self._first_seq]
+
+    def append(self, lines: list[tuple[str, int]]) -> None:
+        """Add lines at the end, dropping the oldest beyond capacity."""
+        lines = lines[-self._capacity:]
+        if not lines:
+            return
+        overflow = len(self._lines) + len(lines) - self._capacity
+        if overflow > 0:
+            self._evict(overflow)
+        if self._rows is None and any(level not in self._levels for _, level in lines):
+            # First line of a hidden level: start tracking rows explicitly
+            self._rows = deque(range(self._first_seq, self._first_seq + len(self._lines)))
+
+        seq = self._first_seq + len(self._lines)
+        matching: list[int] = []
+        for offset, (text, level) in enumerate(lines):
+            self._by_level.setdefault(level, deque()).append(seq + offset)
+            if self._rows is not None and self._matches(text, level):
+                matching.append(seq + offset)
+
+        first = self.rowCount()
+        count = len(lines) if self._rows is None else len(matching)
+        if count:
+            self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._lines.extend(lines)
+        if self._rows is not None:
+            self._rows.extend(matching)
+        if count:
+            self.endInsertRows()
+
+    def set_filter(self, levels: set[int], search: str = "") -> None:
+        """Show only lines of *levels* containing *search* (case-insensitive)."""
+        self.beginResetModel()
+        self._levels = set(levels)
+        self._needle = search.casefold()
+        present = set(self._by_level)
+        if self._needle:
+            # One sequential pass; indexing into the middle of a deque is O(n)
+            self._rows = deque(
+                seq for seq, (text, level) in enumerate(self._lines, self._first_seq)
+                if self._matches(text, level)
+            )
+        elif present <= self._levels:
+            self._rows = None
+        else:
+            # Each level's list is sorted, so this is a linear merge of runs
+            self._rows = deque(sorted(chain.from_iterable(
+                self._by_level[lvl] for lvl in present & self._levels
+            )))
+        self.endResetModel()
+
+    def set_dark(self, dark: bool) -> None:
+        palette = _LEVEL_COLORS_DARK if dark else _LEVEL_COLORS
+        self._colors = {level: QColor(color) for level, color in palette.items()}
+        if self.rowCount():
+            self.dataChanged.emit(
+                self.index(0), self.index(self.rowCount() - 1), [Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._first_seq += len(self._lines)
+        self._lines.clear()
+        self._by_level.clear()
+        if self._rows is not None:
+            self._rows.clear()
+        self.endResetModel()
+
+    # -- internals ------------------------------------------------------------
+
+    def _matches(self, text: str, level: int) -> bool:
+        return level in self._levels and (not self._needle or self._needle in text.casefold())
+
+    def _evict(self, count: int) -> None:
+        """Drop the *count* oldest lines."""
+        first_seq = self._first_seq + count
+        if self._rows is None:
+            removed = count
+        else:
+            removed = 0
+            while removed < len(self._rows) and self._rows[removed] < first_seq:
+                removed += 1
+        if removed:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+        for _ in range(count):
+            self._lines.popleft()
+        if self._rows is not None:
+            for _ in range(removed):
+                self._rows.popleft()
+        self._first_seq = first_seq
+        if removed:
+            self.endRemoveRows()
+        for seqs in self._by_level.values():
+            while seqs and seqs[0] < first_seq:
+                seqs.popleft()
 
 
 class LogPanel(QWidget):
@@ -76,19 +240,22 @@ class LogPanel(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._dark = False
-        self._buffer: deque[tuple[str, int]] = deque(maxlen=_MAX_BUFFER)
         self._active_levels: set[int] = {
             logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL,
         }
         self._build_ui()
 
         # Install the Qt log handler on the root logger
-        self._handler = _QtLogHandler()
+        self._handler = _QtLogHandler(_MAX_BUFFER)
         self._handler.setLevel(logging.DEBUG)
-        self._handler.message_logged.connect(self._on_message)
         logging.getLogger().addHandler(self._handler)
 
+        # Pick up queued lines in batches rather than one signal per line
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start()
+
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
         root.setContentsMargins(32, 32, 32, 32)
@@ -130,29 +297,50 @@ class LogPanel(QWidget):
             filter_row.addWidget(btn)
 
         filter_row.addStretch()
+
+        self._search = QLineEdit()
+        self._search.setPlaceholderText("Search\u2026")
+        self._search.setClearButtonEnabled(True)
+        filter_row.addWidget(self._search)
+        # Searching scans the whole history, so wait until typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self._search.textChanged.connect(self._search_timer.start)
         root.addLayout(filter_row)
 
-        # Log output
-        self._log_view = QPlainTextEdit()
-        self._log_view.setReadOnly(True)
-        self._log_view.setMaximumBlockCount(_MAX_BUFFER)
-        self._log_view.setFont(QFont("Consolas", 10) if __import__("sys").platform == "win32"
-                               else QFont("Monospace", 10))
-        self._log_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        # Log output — a list view only lays out and paints the visible rows
+        font = QFont("Consolas", 10) if sys.platform == "win32" else QFont("Monospace", 10)
+        self._model = _LogModel(_MAX_BUFFER, font, self)
+        self._log_view = QListView()
+        self._log_view.setObjectName("logView")
+        self._log_view.setFont(font)
+        self._log_view.setModel(self._model)
+        self._log_view.setUniformItemSizes(True)
+        self._log_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        copy = QShortcut(QKeySequence.StandardKey.Copy, self._log_view)
+        copy.setContext(Qt.ShortcutContext.WidgetShortcut)
+        copy.activated.connect(self._copy_selection)
         root.addWidget(self._log_view)
 
     def set_dark(self, dark: bool) -> None:
         """Switch between light/dark colour palettes for log text."""
-        self._dark = dark
-
-    def _on_message(self, text: str, level: int) -> None:
-        """Store the message and display it if its level is active."""
-        self._buffer.append((text, level))
-        if self._is_visible(level):
-            self._append_line(text, level)
+        self._model.set_dark(dark)
+
+    def _flush(self) -> None:
+        """Move queued lines into the model, following the tail if at the bottom."""
+        lines = self._handler.drain()
+        if not lines:
+            return
+        bar = self._log_view.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        self._model.append(lines)
+        if at_bottom:
+            self._log_view.scrollToBottom()
 
     def _on_filter_toggled(self, level: int, checked: bool) -> None:
-        """Update active levels and rebuild the visible log."""
+        """Update active levels and re-filter the view."""
         # CRITICAL follows ERROR
         if checked:
             self._active_levels.add(level)
@@ -162,34 +350,17 @@ class LogPanel(QWidget):
             self._active_levels.discard(level)
             if level == logging.ERROR:
                 self._active_levels.discard(logging.CRITICAL)
-        self._rebuild_view()
-
-    def _is_visible(self, level: int) -> bool:
-        return level in self._active_levels
-
-    def _rebuild_view(self) -> None:
-        """Re-render all buffered messages with the current filter."""
-        self._log_view.clear()
-        for text, level in self._buffer:
-            if self._is_visible(level):
-                self._append_line(text, level)
-
-    def _append_line(self, text: str, level: int) -> None:
-        """Append a coloured log line to the view."""
-        palette = _LEVEL_COLORS_DARK if self._dark else _LEVEL_COLORS
-        color = palette.get(level, palette[logging.INFO])
-
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        if level >= logging.WARNING:
-            fmt.setFontWeight(QFont.Weight.Bold)
-
-        cursor = self._log_view.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(text + "\n", fmt)
-        self._log_view.setTextCursor(cursor)
-        self._log_view.ensureCursorVisible()
+        self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        self._model.set_filter(self._active_levels, self._search.text())
+        self._log_view.scrollToBottom()
+
+    def _copy_selection(self) -> None:
+        rows = sorted(index.row() for index in self._log_view.selectedIndexes())
+        if rows:
+            QGuiApplication.clipboard().setText("\n".join(self._model.line(row)[0] for row in rows))
 
     def _clear(self) -> None:
-        self._buffer.clear()
-        self._log_view.clear()
+        self._handler.drain()
+        self._model.clear()
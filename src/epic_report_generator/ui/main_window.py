@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QKeySequence, QPixmap, QShortcut
 from PySide6.QtWidgets import (
     QButtonGroup,
@@ -136,8 +136,9 @@ class MainWindow(QMainWindow):
         self._settings_panel.logged_out.connect(self._on_logout)
         self._sidebar_user_info.logout_requested.connect(self._on_sidebar_logout)
 
-        # Restore session AFTER signals are wired so login_state_changed is caught
-        self._login_panel.try_restore_session()
+        # Restore session AFTER signals are wired so login_state_changed is caught,
+        # and once the event loop runs, so the window shows before Jira is contacted
+        QTimer.singleShot(0, self._login_panel.try_restore_session)
 
     # -- shortcuts ------------------------------------------------------------
 
@@ -0,0 +1,371 @@
+"""Virtualized PDF page view for the report preview."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from PySide6.QtCore import (
+    QBuffer,
+    QCoreApplication,
+    QIODevice,
+    QObject,
+    QRect,
+    QSize,
+    QThread,
+    QTimer,
+    Qt,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtPdf import QPdfDocument
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget
+
+logger = logging.getLogger(__name__)
+
+_SPACING = 8  # gap between pages, logical pixels
+_SIDE_MARGIN = 8
+_MIN_SCALE, _MAX_SCALE = 0.5, 3.0
+_PREFETCH_PAGES = 1  # pages rendered ahead of/behind the viewport
+_RESIZE_DEBOUNCE_MS = 150
+_CACHE_BYTES = 128 * 1024 * 1024
+_PREVIEW_DIVISOR = 4  # placeholder pages are rendered at 1/4 resolution
+
+
+class _PixmapCache:
+    """LRU of rendered pages, bounded by the pixmaps' total size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[int, QPixmap] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, page: int) -> QPixmap | None:
+        pixmap = self._items.get(page)
+        if pixmap is not None:
+            self._items.move_to_end(page)
+        return pixmap
+
+    def put(self, page: int, pixmap: QPixmap) -> None:
+        old = self._items.pop(page, None)
+        if old is not None:
+            self._bytes -= _pixmap_bytes(old)
+        self._items[page] = pixmap
+        self._bytes += _pixmap_bytes(pixmap)
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            _, evicted = self._items.popitem(last=False)
+            self._bytes -= _pixmap_bytes(evicted)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, page: int) -> bool:
+        return page in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+
+class _Job(NamedTuple):
+    generation: int
+    page: int
+    size: QSize
+    preview: bool
+
+
+class _RenderWorker(QObject):
+    """Rasterises pages in a background thread from its own QPdfDocument.
+
+    The GUI thread replaces the whole job list with :meth:`schedule` (most
+    urgent first), so pages scrolled out of view are never rendered.
+    """
+
+    rendered = Signal(int, int, QImage, bool)  # generation, page, image, preview
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._doc: QPdfDocument | None = None
+        self._buffer: QBuffer | None = None
+        self._generation = -1
+        self._jobs: list[_Job] = []
+        self._lock = threading.Lock()
+
+    def schedule(self, jobs: list[_Job]) -> None:
+        """Replace the pending jobs (thread-safe)."""
+        with self._lock:
+            self._jobs = jobs
+
+    @Slot(int, object)
+    def load(self, generation: int, pdf: bytes | None) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc.deleteLater()
+            self._buffer.deleteLater()  # type: ignore[union-attr]
+            self._doc = self._buffer = None
+        self._generation = generation
+        if pdf:
+            self._buffer = QBuffer(self)
+            self._buffer.setData(pdf)
+            self._buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            self._doc = QPdfDocument(self)
+            self._doc.load(self._buffer)
+
+    @Slot()
+    def drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    return
+                job = self._jobs.pop(0)
+            if job.generation != self._generation or self._doc is None:
+                continue
+            image = self._doc.render(job.page, job.size)
+            if not image.isNull():
+                self.rendered.emit(job.generation, job.page, image, job.preview)
+
+
+def _stop_render_thread(thread: QThread, worker: _RenderWorker) -> None:
+    if thread.isRunning():
+        worker.schedule([])
+        thread.quit()
+        thread.wait()
+
+
+class PdfPageView(QAbstractScrollArea):
+    """Scrollable, width-fitted view of a PDF that only renders what is seen.
+
+    Page geometry comes from the document's page sizes, so laying out a
+    long report is cheap and the first page shows up just as fast for 60
+    pages as for 3.  Pages in (or next to) the viewport are rasterised on
+    a background thread, visible ones first: a quick low-resolution
+    placeholder, then the sharp image.  Rendered pages are kept in an LRU
+    bounded by memory.  While the view is being resized, cached pages are
+    scaled to the new size and only re-rendered once resizing settles.
+
+    :attr:`first_page_shown` is emitted once per document, when the first
+    visible page has been drawn at full resolution.
+    """
+
+    first_page_shown = Signal()
+    _load_requested = Signal(int, object)  # generation, PDF bytes | None
+    _jobs_ready = Signal()
+
+    def __init__(self, parent: QWidget | None = None, *, cache_bytes: int = _CACHE_BYTES) -> None:
+        super().__init__(parent)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(40)
+        self._buffer: QBuffer | None = None
+        self._doc: QPdfDocument | None = None
+        self._page_rects: list[QRect] = []
+        self._page_tops: list[int] = []
+        self._cache = _PixmapCache(cache_bytes)
+        self._generation = 0
+        self._dark = False
+        self._resizing = False
+        self._shown_first = False
+
+        self._thread = QThread(self)
+        self._worker = _RenderWorker()
+        self._worker.moveToThread(self._thread)
+        self._worker.rendered.connect(self._on_rendered)
+        self._load_requested.connect(self._worker.load)
+        self._jobs_ready.connect(self._worker.drain)
+        self._thread.start()
+        # The thread must be stopped before Qt deletes it along with the view
+        self.destroyed.connect(functools.partial(_stop_render_thread, self._thread, self._worker))
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_renderer)
+
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(_RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+
+        self._schedule_timer = QTimer(self)
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.setInterval(0)
+        self._schedule_timer.timeout.connect(self._schedule_renders)
+
+    # -- public API -----------------------------------------------------------
+
+    def set_document(self, pdf: bytes | None) -> None:
+        """Show *pdf* (or nothing), dropping every previously rendered page."""
+        self._close_document()
+        self._generation += 1
+        self._shown_first = False
+        self._worker.schedule([])
+        self._load_requested.emit(self._generation, pdf)
+        if pdf:
+            self._buffer = QBuffer(self)
+            self._buffer.setData(pdf)
+            self._buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            self._doc = QPdfDocument(self)
+            self._doc.load(self._buffer)
+            logger.debug("Preview document loaded: %d page(s)", self._doc.pageCount())
+        self.verticalScrollBar().setValue(0)
+        self._relayout()
+        self.viewport().update()
+
+    def set_dark(self, dark: bool) -> None:
+        """Switch the background and page border colours."""
+        self._dark = dark
+        self.viewport().update()
+
+    def page_count(self) -> int:
+        return self._doc.pageCount() if self._doc else 0
+
+    def visible_pages(self) -> range:
+        """Return the indices of pages intersecting the viewport."""
+        if not self._page_rects:
+            return range(0)
+        top = self.verticalScrollBar().value()
+        bottom = top + self.viewport().height()
+        first = max(0, bisect.bisect_right(self._page_tops, top) - 1)
+        last = first
+        while last + 1 < len(self._page_rects) and self._page_rects[last + 1].top() < bottom:
+            last += 1
+        return range(first, last + 1)
+
+    # -- Qt events ------------------------------------------------------------
+
+    def paintEvent(self, event: Any) -> None:
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), QColor("#121212" if self._dark else "#E0E0E0"))
+        if not self._doc:
+            return
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        offset = self.verticalScrollBar().value()
+        border = QColor("#333333" if self._dark else "#CCCCCC")
+        blank = QColor("#1E1E1E" if self._dark else "#FFFFFF")
+        for page in self.visible_pages():
+            target = self._page_rects[page].translated(0, -offset)
+            painter.setPen(border)
+            painter.drawRect(target.adjusted(-3, -3, 2, 2))
+            pixmap = self._cache.get(page)
+            if pixmap is not None:
+                # May be a placeholder or a pre-resize render; drawn scaled
+                painter.drawPixmap(target, pixmap)
+            else:
+                painter.fillRect(target, blank)
+        painter.end()
+        self._schedule_timer.start()
+
+    def resizeEvent(self, event: Any) -> None:
+        super().resizeEvent(event)
+        if not self._doc:
+            return
+        # Re-layout right away (cheap); re-rendering waits until resizing stops
+        self._resizing = True
+        self._relayout()
+        self._resize_timer.start()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        self.viewport().update()
+
+    # -- layout & rendering ---------------------------------------------------
+
+    def _relayout(self) -> None:
+        self._page_rects.clear()
+        self._page_tops.clear()
+        if not self._doc:
+            self.verticalScrollBar().setRange(0, 0)
+            return
+
+        available = max(1, self.viewport().width() - 2 * _SIDE_MARGIN)
+        y = _SPACING
+        for page in range(self._doc.pageCount()):
+            size = self._doc.pagePointSize(page)
+            scale = available / size.width() if size.width() > 0 else 1.5
+            scale = max(_MIN_SCALE, min(scale, _MAX_SCALE))
+            w, h = int(size.width() * scale), int(size.height() * scale)
+            x = max(_SIDE_MARGIN, (self.viewport().width() - w) // 2)
+            self._page_rects.append(QRect(x, y, w, h))
+            self._page_tops.append(y)
+            y += h + _SPACING
+
+        bar = self.verticalScrollBar()
+        bar.setPageStep(self.viewport().height())
+        bar.setRange(0, max(0, y - self.viewport().height()))
+
+    def _fits(self, pixmap: QPixmap, page: int) -> bool:
+        """Whether *pixmap* is a sharp render of *page* at the current size."""
+        return pixmap.size() == self._job(page, preview=False).size
+
+    def _schedule_renders(self) -> None:
+        """Queue renders for what is on screen: placeholders, then sharp pages.
+
+        Replaces the worker's queue, so pages that scrolled away are dropped.
+        """
+        visible = self.visible_pages()
+        if self._resizing or not visible:
+            return
+        before = range(max(0, visible.start - _PREFETCH_PAGES), visible.start)
+        after = range(visible.stop, min(len(self._page_rects), visible.stop + _PREFETCH_PAGES))
+
+        jobs: list[_Job] = []
+        for page in visible:
+            if page not in self._cache:
+                jobs.append(self._job(page, preview=True))
+        for page in (*visible, *after, *before):
+            pixmap = self._cache.get(page)
+            if pixmap is None or not self._fits(pixmap, page):
+                jobs.append(self._job(page, preview=False))
+        self._worker.schedule(jobs)
+        if jobs:
+            self._jobs_ready.emit()
+
+    def _job(self, page: int, *, preview: bool) -> _Job:
+        dpr = self.devicePixelRatioF() or 1.0
+        size = self._page_rects[page].size()
+        if preview:
+            dpr /= _PREVIEW_DIVISOR
+        return _Job(
+            self._generation, page,
+            QSize(max(1, int(size.width() * dpr)), max(1, int(size.height() * dpr))),
+            preview,
+        )
+
+    def _on_rendered(self, generation: int, page: int, image: QImage, preview: bool) -> None:
+        if generation != self._generation or page >= len(self._page_rects):
+            return
+        if preview and page in self._cache:
+            return  # never replace a sharper image with a placeholder
+        self._cache.put(page, QPixmap.fromImage(image))
+        if page in self.visible_pages():
+            self.viewport().update(self._page_rects[page].translated(0, -self.verticalScrollBar().value()))
+            if not preview and not self._shown_first:
+                self._shown_first = True
+                self.first_page_shown.emit()
+
+    def _on_resize_settled(self) -> None:
+        self._resizing = False
+        self.viewport().update()
+
+    def _stop_renderer(self) -> None:
+        _stop_render_thread(self._thread, self._worker)
+
+    def _close_document(self) -> None:
+        self._cache.clear()
+        if self._doc is not None:
+            self._doc.close()
+            self._doc.deleteLater()
+            self._doc = None
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer.deleteLater()
+            self._buffer = None
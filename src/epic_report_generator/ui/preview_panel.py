@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
 from PySide6.QtCore import QObject, QThread, Signal, Qt
-from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -15,58 +15,85 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
 
-from epic_report_generator.core.data_models import EpicData, EpicMetrics, ReportConfig, ReportData
+from epic_report_generator.core import timing
+from epic_report_generator.core.data_models import ReportConfig, ReportData
 from epic_report_generator.core.jira_client import JiraClient
-from epic_report_generator.core.metrics import calculate_metrics
-from epic_report_generator.core.pdf_generator import generate_pdf
+from epic_report_generator.services.chart_cache import ChartCache
 
 logger = logging.getLogger(__name__)
 
 
+_FETCH_PCT = 60  # progress bar share of the Jira fetch
+_CHARTS_PCT = 30  # … of chart rendering; page layout takes the rest
+
+
 class _GenerateWorker(QObject):
     """Fetch Jira data and build PDF in a background thread."""
 
     progress = Signal(str, int)  # message, percent
-    finished = Signal(object)  # ReportData | None
+    timed = Signal(object)  # timing.Trace, emitted just before finished
+    finished = Signal(object, object)  # ReportData | None, PDF bytes | None
+    pdf_failed = Signal(str)  # error message
 
-    def __init__(self, jira: JiraClient, config: ReportConfig) -> None:
+    def __init__(
+        self, jira: JiraClient, config: ReportConfig, chart_cache: ChartCache | None = None,
+    ) -> None:
         super().__init__()
         self._jira = jira
         self._config = config
+        self._chart_cache = chart_cache
 
     def run(self) -> None:
         """Execute the data fetch and PDF generation."""
-        report = ReportData(config=self._config)
+        # Imported here, off the GUI thread: reportlab and numpy are slow to load
+        from epic_report_generator.core.pdf_generator import generate_pdf
+        from epic_report_generator.core.report_builder import build_report
+
         total = len(self._config.epic_keys)
         logger.info("Worker started: fetching %d epic(s)", total)
-
-        for i, key in enumerate(self._config.epic_keys, 1):
-            self.progress.emit(f"Fetching {key}\u2026", int(i / total * 70))
-            logger.debug("Fetching epic %d/%d: %s", i, total, key)
-            epic = self._jira.fetch_epic(
-                key,
-                sp_field=self._config.story_points_field,
-                epic_link_field=self._config.epic_link_field,
-            )
-            if epic is None:
-                logger.warning("Epic %s not found or inaccessible", key)
-                report.errors.append(f"Epic {key} not found. Check the key and try again.")
-                continue
-            metrics = calculate_metrics(epic)
-            report.epics.append(epic)
-            report.metrics.append(metrics)
-            logger.debug("Epic %s: %d children, progress=%.1f%%", key, metrics.total_issues, metrics.progress)
-
-        if report.epics:
-            self.progress.emit("Generating PDF\u2026", 85)
-
-        logger.info("Worker finished: %d epic(s) fetched, %d error(s)", len(report.epics), len(report.errors))
-        self.finished.emit(report)
+        if self._config.chart_backend == "raster":
+            # Let the chart processes start while Jira is being queried
+            from epic_report_generator.core.chart_generator import warm_up_pool
+
+            warm_up_pool()
+
+        trace = timing.Trace()
+        with timing.recording(trace):
+            report = build_report(self._jira, self._config, on_epic_fetched=self._on_epic_fetched)
+
+            pdf: bytes | None = None
+            if report.epics:
+                logger.info("Building PDF from %d epic(s)", len(report.epics))
+                self.progress.emit("Building PDF\u2026", _FETCH_PCT)
+                try:
+                    pdf = generate_pdf(
+                        report, on_progress=self._on_pdf_progress, chart_cache=self._chart_cache,
+                    )
+                except Exception as exc:
+                    logger.exception("PDF generation failed")
+                    self.pdf_failed.emit(str(exc))
+
+        self.timed.emit(trace)
+        self.finished.emit(report, pdf)
+
+    def _on_epic_fetched(self, key: str, done: int, total: int) -> None:
+        """Relay per-epic completion from the fetch pool as progress."""
+        logger.debug("Fetched epic %d/%d: %s", done, total, key)
+        self.progress.emit(f"Fetched {key} ({done}/{total})\u2026", int(done / total * _FETCH_PCT))
+
+    def _on_pdf_progress(self, stage: str, done: int, total: int) -> None:
+        """Relay chart rendering and page layout from :func:`generate_pdf`."""
+        if stage == "charts":
+            pct = _FETCH_PCT + done / total * _CHARTS_PCT
+            message = f"Rendering charts ({done}/{total})\u2026"
+        else:
+            pct = _FETCH_PCT + _CHARTS_PCT + done / total * (99 - _FETCH_PCT - _CHARTS_PCT)
+            message = f"Laying out page {done}/{total}\u2026"
+        self.progress.emit(message, int(pct))
 
 
 class PreviewPanel(QWidget):
@@ -76,10 +103,22 @@ class PreviewPanel(QWidget):
     """
 
     def __init__(
-        self, jira: JiraClient, parent: QWidget | None = None
+        self,
+        jira: JiraClient,
+        parent: QWidget | None = None,
+        *,
+        chart_cache: ChartCache | None = None,
+        trace_dir: Path | None = None,
     ) -> None:
         super().__init__(parent)
         self._jira = jira
+        # Reused across runs, so regenerating or re-theming skips matplotlib
+        self._chart_cache = chart_cache or ChartCache()
+        # Each run's timing trace is also written here as JSON, if set
+        self._trace_dir = trace_dir
+        self._trace: timing.Trace | None = None
+        # A finished run's trace, its preview start and status, until the first page shows
+        self._preview_trace: tuple[timing.Trace, float, str] | None = None
         self._pdf_bytes: bytes | None = None
         self._thread: QThread | None = None
         self._worker: _GenerateWorker | None = None
@@ -111,16 +150,21 @@ class PreviewPanel(QWidget):
         self._status_label = QLabel("")
         root.addWidget(self._status_label)
 
-        # Scrollable preview area (vertical only)
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._preview_container = QWidget()
-        self._preview_layout = QVBoxLayout(self._preview_container)
-        self._preview_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        self._preview_layout.setContentsMargins(0, 0, 0, 0)
-        self._preview_layout.setSpacing(8)
-        self._scroll.setWidget(self._preview_container)
+        # Virtualized preview (vertical scrolling, pages rendered on demand)
+        try:
+            from epic_report_generator.ui.page_view import PdfPageView
+        except ImportError:
+            # QtPdf not available — show a simple message
+            self._page_view = None
+            self._scroll = QLabel(
+                "PDF preview requires PySide6-QtPdf.\n"
+                "Use 'Export as PDF' to view the report."
+            )
+            self._scroll.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        else:
+            self._page_view = PdfPageView()
+            self._page_view.first_page_shown.connect(self._on_first_page_shown)
+            self._scroll = self._page_view
         root.addWidget(self._scroll, 1)
 
     # -- public API -----------------------------------------------------------
@@ -128,9 +172,8 @@ class PreviewPanel(QWidget):
     def set_dark(self, dark: bool) -> None:
         """Update the theme flag for preview rendering."""
         self._dark = dark
-        # Re-render if we already have PDF content
-        if self._pdf_bytes:
-            self._render_preview()
+        if self._page_view is not None:
+            self._page_view.set_dark(dark)
 
     def generate(self, config: ReportConfig) -> None:
         """Start report generation with the given config."""
@@ -146,10 +189,12 @@ class PreviewPanel(QWidget):
         self._clear_preview()
 
         self._thread = QThread()
-        self._worker = _GenerateWorker(self._jira, config)
+        self._worker = _GenerateWorker(self._jira, config, self._chart_cache)
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)
         self._worker.progress.connect(self._on_progress)
+        self._worker.timed.connect(self._on_timed)
+        self._worker.pdf_failed.connect(self._on_pdf_failed)
         self._worker.finished.connect(self._on_generate_finished)
         self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._cleanup_worker)
@@ -162,6 +207,7 @@ class PreviewPanel(QWidget):
         self._pdf_bytes = None
         self._export_btn.setEnabled(False)
         self._status_label.clear()
+        self._status_label.setToolTip("")
         self._progress_bar.hide()
 
     # -- slots ----------------------------------------------------------------
@@ -176,13 +222,21 @@ class PreviewPanel(QWidget):
         self._progress_bar.setValue(pct)
         self._status_label.setText(message)
 
-    def _on_generate_finished(self, report: ReportData | None) -> None:
+    def _on_timed(self, trace: timing.Trace) -> None:
+        self._trace = trace
+
+    def _on_pdf_failed(self, message: str) -> None:
+        QMessageBox.critical(self, "PDF Error", f"Failed to generate PDF: {message}")
+
+    def _on_generate_finished(self, report: ReportData | None, pdf: bytes | None) -> None:
         self._progress_bar.setValue(100)
+        trace, self._trace = self._trace, None
 
         if report is None or not report.epics:
             self._progress_bar.hide()
             logger.warning("No epics returned — nothing to generate")
             self._status_label.setText("No data to generate a report.")
+            self._finish_trace(trace)
             if report and report.errors:
                 QMessageBox.warning(
                     self, "Errors",
@@ -196,25 +250,47 @@ class PreviewPanel(QWidget):
                 "The following errors occurred:\n" + "\n".join(report.errors),
             )
 
-        logger.info("Building PDF from %d epic(s)", len(report.epics))
-        self._status_label.setText("Building PDF\u2026")
-        try:
-            self._pdf_bytes = generate_pdf(report)
-        except Exception as exc:
-            logger.exception("PDF generation failed")
-            QMessageBox.critical(self, "PDF Error", f"Failed to generate PDF: {exc}")
-            self._progress_bar.hide()
+        self._progress_bar.hide()
+        if pdf is None:
             self._status_label.setText("PDF generation failed.")
+            self._finish_trace(trace)
             return
 
-        self._progress_bar.hide()
-        logger.info("PDF generated: %d epic(s), %s bytes", len(report.epics), f"{len(self._pdf_bytes):,}")
-        self._status_label.setText(
-            f"Report ready \u2014 {len(report.epics)} epic(s), "
-            f"{len(self._pdf_bytes):,} bytes"
-        )
+        self._pdf_bytes = pdf
+        logger.info("PDF generated: %d epic(s), %s bytes", len(report.epics), f"{len(pdf):,}")
         self._export_btn.setEnabled(True)
-        self._render_preview()
+        status = f"Report ready \u2014 {len(report.epics)} epic(s), {len(pdf):,} bytes"
+        self._status_label.setText(status)
+        if trace is not None and self._page_view is not None:
+            # Pages render asynchronously; the trace is finished once the first one is on screen
+            self._preview_trace = (trace, time.perf_counter(), status)
+            self._render_preview()
+        else:
+            self._render_preview()
+            self._finish_trace(trace, status)
+
+    def _on_first_page_shown(self) -> None:
+        if self._preview_trace is None:
+            return
+        trace, start, status = self._preview_trace
+        self._preview_trace = None
+        trace.add("preview", start, time.perf_counter() - start)
+        self._finish_trace(trace, status)
+
+    def _finish_trace(self, trace: timing.Trace | None, status: str | None = None) -> None:
+        """Log *trace*, add its summary to the status label and write it out if configured."""
+        if trace is None:
+            return
+        trace.finish()
+        logger.info("%s", trace.report())
+        if status is not None:
+            self._status_label.setText(f"{status} in {trace.summary()}")
+        self._status_label.setToolTip(trace.report())
+        if self._trace_dir is not None:
+            try:
+                trace.write(self._trace_dir / trace.filename)
+            except OSError as exc:
+                logger.warning("Could not write timing trace to %s: %s", self._trace_dir, exc)
 
     def _export_pdf(self) -> None:
         if not self._pdf_bytes:
@@ -230,88 +306,21 @@ class PreviewPanel(QWidget):
     # -- preview rendering ----------------------------------------------------
 
     def resizeEvent(self, event: Any) -> None:
-        """Re-render preview when panel is resized so pages scale to fit."""
+        """Keep the preview area at least one 16:9 page tall."""
         super().resizeEvent(event)
-        # Keep the preview area at least one 16:9 page tall
-        w = self._scroll.viewport().width()
+        w = self._scroll.width()
         if w > 0:
             self._scroll.setMinimumHeight(int(w * 9 / 16))
-        if self._pdf_bytes:
-            self._render_preview()
 
     def _clear_preview(self) -> None:
-        while self._preview_layout.count():
-            item = self._preview_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if self._preview_trace is not None:
+            # Superseded before a page was shown: keep the trace, without a preview stage
+            trace, self._preview_trace = self._preview_trace[0], None
+            self._finish_trace(trace)
+        if self._page_view is not None:
+            self._page_view.set_document(None)
 
     def _render_preview(self) -> None:
-        """Render PDF pages as QPixmap images scaled to fit the panel width."""
-        self._clear_preview()
-        if not self._pdf_bytes:
-            return
-
-        # Set preview container background based on theme
-        if self._dark:
-            self._preview_container.setStyleSheet("background: #121212;")
-        else:
-            self._preview_container.setStyleSheet("background: #E0E0E0;")
-
-        try:
-            from PySide6.QtCore import QBuffer, QIODevice, QSize
-            from PySide6.QtPdf import QPdfDocument
-
-            buf = QBuffer(self)
-            buf.setData(self._pdf_bytes)
-            buf.open(QIODevice.OpenModeFlag.ReadOnly)
-
-            doc = QPdfDocument(self)
-            doc.load(buf)
-
-            # Available width for rendering (scroll area viewport minus small margin)
-            available_width = self._scroll.viewport().width() - 16
-            dpr = self.devicePixelRatio() or 1.0
-
-            for i in range(doc.pageCount()):
-                page_size = doc.pagePointSize(i)
-                # Scale page to fit available width
-                if page_size.width() > 0:
-                    scale = available_width / page_size.width()
-                else:
-                    scale = 1.5
-                # Ensure minimum reasonable scale and cap at 3x
-                scale = max(0.5, min(scale, 3.0))
-                # Render at device-pixel-ratio resolution for sharp HiDPI output
-                render_size = QSize(
-                    int(page_size.width() * scale * dpr),
-                    int(page_size.height() * scale * dpr),
-                )
-                image = doc.render(i, render_size)
-
-                pixmap = QPixmap.fromImage(image)
-                pixmap.setDevicePixelRatio(dpr)
-
-                label = QLabel()
-                label.setPixmap(pixmap)
-                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Add subtle shadow/border around each page
-                if self._dark:
-                    label.setStyleSheet(
-                        "border: 1px solid #333; background: transparent; padding: 2px;"
-                    )
-                else:
-                    label.setStyleSheet(
-                        "border: 1px solid #ccc; background: transparent; padding: 2px;"
-                    )
-                self._preview_layout.addWidget(label)
-
-            doc.close()
-            buf.close()
-        except ImportError:
-            # QtPdf not available — show a simple message
-            lbl = QLabel(
-                "PDF preview requires PySide6-QtPdf.\n"
-                "Use 'Export as PDF' to view the report."
-            )
-            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._preview_layout.addWidget(lbl)
+        """Hand the PDF to the page view, which renders pages as they are seen."""
+        if self._page_view is not None:
+            self._page_view.set_document(self._pdf_bytes)
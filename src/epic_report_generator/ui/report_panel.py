@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -80,7 +81,8 @@ class ReportPanel(QWidget):
 
         # Step 2: Preview & Export
         self._step2 = CollapsibleSection("Step 2: Preview & Export", expanded=False)
-        self._preview_panel = PreviewPanel(self._jira)
+        trace_dir = self._config_mgr.get("timing_trace_dir", "")
+        self._preview_panel = PreviewPanel(self._jira, trace_dir=Path(trace_dir) if trace_dir else None)
         self._step2.body_layout.addWidget(self._preview_panel)
         root.addWidget(self._step2)
 
@@ -214,6 +214,13 @@ QDateEdit {
     background: #DE350B;
 }
 
+/* Log view */
+#logView {
+    border: 1px solid #DFE1E6;
+    border-radius: 4px;
+    background: #FAFBFC;
+}
+
 /* Status indicator */
 QLabel[status="connected"] {
     color: #36B37E;
@@ -510,6 +517,13 @@ QDateEdit {
     background: #FF5630;
 }
 
+/* Log view */
+#logView {
+    border: 1px solid #2C3E5D;
+    border-radius: 4px;
+    background: #0D1424;
+}
+
 QLabel[status="connected"] {
     color: #36B37E;
     font-weight: 600;
@@ -21,6 +21,8 @@ from PySide6.QtWidgets import (
     QWidgetItem,
 )
 
+from epic_report_generator.core.data_models import RE_EPIC_KEY
+
 
 class StatusIndicator(QWidget):
     """Green/red dot with a text label showing connection state."""
@@ -373,9 +375,6 @@ class CollapsibleSection(QWidget):
 # EpicKeyTagInput — tag/chip input for epic keys
 # ---------------------------------------------------------------------------
 
-RE_EPIC_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
-
-
 class _EpicKeyChip(QWidget):
     """A single removable chip representing an epic key."""
 
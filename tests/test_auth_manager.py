@@ -46,6 +46,11 @@ class TestProperties:
         auth = AuthManager(cfg)
         assert auth.cloud_id == "abc123"
 
+    def test_api_endpoint_persisted(self, tmp_path: Path) -> None:
+        cfg = _make_config(tmp_path)
+        AuthManager(cfg).set_api_endpoint("cloud")
+        assert AuthManager(cfg).api_endpoint == "cloud"
+
     def test_auth_method(self, tmp_path: Path) -> None:
         cfg = _make_config(tmp_path)
         cfg.set("auth_method", "oauth")
@@ -123,12 +128,12 @@ class TestGetAccessToken:
         auth = AuthManager(_make_config(tmp_path))
         assert auth.get_access_token() == "restored"
 
-    @patch("epic_report_generator.services.auth_manager.requests")
+    @patch("requests.post")
     @patch("epic_report_generator.services.auth_manager.keyring")
     def test_refreshes_expired_token(
         self,
         mock_keyring: MagicMock,
-        mock_requests: MagicMock,
+        mock_post: MagicMock,
         tmp_path: Path,
     ) -> None:
         stored = {
@@ -144,7 +149,7 @@ class TestGetAccessToken:
             "refresh_token": "new-rt",
             "expires_in": 3600,
         }
-        mock_requests.post.return_value = resp
+        mock_post.return_value = resp
 
         cfg = _make_config(tmp_path)
         cfg.update({"client_id": "cid", "client_secret": "csec"})
@@ -170,7 +175,9 @@ class TestLogout:
         self, mock_keyring: MagicMock, tmp_path: Path,
     ) -> None:
         cfg = _make_config(tmp_path)
-        cfg.update({"auth_method": "oauth", "cloud_id": "cid", "site_name": "x"})
+        cfg.update({
+            "auth_method": "oauth", "cloud_id": "cid", "site_name": "x", "api_endpoint": "cloud",
+        })
         auth = AuthManager(cfg)
         auth._access_token = "tok"
         auth._token_expiry = time.time() + 3600
@@ -181,6 +188,7 @@ class TestLogout:
         assert auth._token_expiry == 0.0
         assert cfg.get("auth_method") == ""
         assert cfg.get("cloud_id") == ""
+        assert auth.api_endpoint == ""
         assert cfg.get("site_name") == ""
         # keyring.delete_password called for both keys
         assert mock_keyring.delete_password.call_count == 2
@@ -0,0 +1,67 @@
+"""Tests for epic_report_generator.services.chart_cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from epic_report_generator.services.chart_cache import ChartCache
+
+
+def _make_cache(tmp_path: Path, **kwargs: int) -> ChartCache:
+    return ChartCache(tmp_path / "charts", **kwargs)
+
+
+class TestGetPut:
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        assert _make_cache(tmp_path).get("abc") is None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.put("abc", b"png-bytes")
+        assert cache.get("abc") == b"png-bytes"
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        _make_cache(tmp_path).put("abc", b"png-bytes")
+        assert _make_cache(tmp_path).get("abc") == b"png-bytes"
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.put("abc", b"png-bytes")
+        cache.clear()
+        assert cache.get("abc") is None
+
+
+class TestEviction:
+    def _age(self, cache: ChartCache, key: str, mtime: float) -> None:
+        os.utime(cache._dir / f"{key}.png", (mtime, mtime))
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path, max_bytes=25)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        self._age(cache, "a", 1000)
+        self._age(cache, "b", 2000)
+        cache.get("a")  # refreshes "a", leaving "b" the oldest
+
+        cache.put("c", b"x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_overwrite_does_not_double_count(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path, max_bytes=25)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        assert cache.get("a") is not None
+        assert cache.get("b") is not None
+
+    def test_existing_files_count_towards_cap(self, tmp_path: Path) -> None:
+        _make_cache(tmp_path).put("old", b"x" * 20)
+        cache = _make_cache(tmp_path, max_bytes=25)
+        self._age(cache, "old", 1000)
+        cache.put("new", b"x" * 10)
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+from epic_report_generator.core import chart_generator
 from epic_report_generator.core.data_models import EpicMetrics
-from epic_report_generator.core.chart_generator import generate_epic_chart
+from epic_report_generator.core.chart_generator import chart_key, generate_epic_chart, render_charts
+from epic_report_generator.services.chart_cache import ChartCache
 
 
 def _make_metrics(days: int = 10) -> EpicMetrics:
@@ -66,3 +71,73 @@ class TestGenerateEpicChart:
         )
         result = generate_epic_chart(m)
         assert result is not None
+
+
+class TestRenderCharts:
+    """render_charts should match generate_epic_chart, serially or in a pool."""
+
+    def test_serial_matches_single_render(self) -> None:
+        metrics = [_make_metrics(5), EpicMetrics(), _make_metrics(8)]
+        events: list[tuple[int, int]] = []
+        with patch.object(chart_generator, "_POOL_WORKERS", 1):
+            charts = render_charts(metrics, dpi=72, on_progress=lambda *e: events.append(e))
+        assert charts[1] is None
+        assert charts[0] == generate_epic_chart(metrics[0], dpi=72)
+        assert charts[2] == generate_epic_chart(metrics[2], dpi=72)
+        assert events[-1] == (3, 3)
+
+    def test_pool_preserves_order(self) -> None:
+        metrics = [_make_metrics(days) for days in (4, 6, 9)]
+        try:
+            with patch.object(chart_generator, "_POOL_WORKERS", 2):
+                charts = render_charts(metrics, dpi=72, dark=True)
+        finally:
+            chart_generator.shutdown_pool()
+        assert charts == [generate_epic_chart(m, dpi=72, dark=True) for m in metrics]
+
+    def test_broken_pool_falls_back_to_serial(self) -> None:
+        pool = MagicMock()
+        pool.submit.side_effect = BrokenProcessPool("gone")
+        metrics = [_make_metrics(4), _make_metrics(6)]
+        with patch.object(chart_generator, "_POOL_WORKERS", 2), \
+                patch.object(chart_generator, "_get_pool", return_value=pool):
+            charts = render_charts(metrics, dpi=72)
+        assert charts == [generate_epic_chart(m, dpi=72) for m in metrics]
+
+
+class TestChartCaching:
+    def test_key_depends_on_series_theme_and_dpi(self) -> None:
+        m = _make_metrics()
+        key = chart_key(m, dpi=150, dark=False)
+        assert chart_key(_make_metrics(), dpi=150, dark=False) == key
+        assert chart_key(m, dpi=150, dark=True) != key
+        assert chart_key(m, dpi=72, dark=False) != key
+        changed = _make_metrics()
+        changed.completed_sp_over_time[-1] += 1
+        assert chart_key(changed, dpi=150, dark=False) != key
+
+    def test_key_depends_on_chart_version(self) -> None:
+        m = _make_metrics()
+        key = chart_key(m, dpi=150, dark=False)
+        with patch.object(chart_generator, "CHART_VERSION", chart_generator.CHART_VERSION + 1):
+            assert chart_key(m, dpi=150, dark=False) != key
+
+    def test_regeneration_reuses_cached_png(self, tmp_path: Path) -> None:
+        cache = ChartCache(tmp_path)
+        metrics = [_make_metrics(5), _make_metrics(7)]
+        with patch.object(chart_generator, "_POOL_WORKERS", 1):
+            first = render_charts(metrics, dpi=72, cache=cache)
+            with patch.object(chart_generator, "generate_epic_chart") as render:
+                second = render_charts(metrics, dpi=72, cache=cache)
+        render.assert_not_called()
+        assert second == first
+
+    def test_theme_toggle_renders_again(self, tmp_path: Path) -> None:
+        cache = ChartCache(tmp_path)
+        with patch.object(chart_generator, "_POOL_WORKERS", 1):
+            render_charts([_make_metrics()], dpi=72, cache=cache)
+            with patch.object(
+                chart_generator, "generate_epic_chart", return_value=b"png",
+            ) as render:
+                render_charts([_make_metrics()], dpi=72, dark=True, cache=cache)
+        render.assert_called_once()
@@ -0,0 +1,121 @@
+"""Tests for epic_report_generator.cli."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from epic_report_generator.cli import (
+    EXIT_FAILED,
+    EXIT_NOT_CONNECTED,
+    EXIT_OK,
+    EXIT_USAGE,
+    generate,
+    parse_epic_keys,
+)
+from epic_report_generator.core.data_models import EpicData, JiraIssue
+
+
+def _make_epic(key: str) -> EpicData:
+    now = datetime.now(tz=timezone.utc)
+    child = JiraIssue(
+        key=f"{key}-C", summary="Child", status="Done", status_category="Done",
+        resolution="Done", issue_type="Story", story_points=3.0,
+        created=now - timedelta(days=5), resolved=now, assignee=None,
+    )
+    return EpicData(
+        key=key, summary=f"Epic {key}", status="In Progress", priority="High",
+        assignee=None, reporter=None, created=now - timedelta(days=10), updated=now,
+        children=[child],
+    )
+
+
+@pytest.fixture
+def jira() -> Iterator[MagicMock]:
+    settings: dict[str, Any] = {"chart_backend": "vector", "default_title": "Nightly"}
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: settings.get(key, default)
+    auth = MagicMock(auth_method="api_token", jira_url="https://x.atlassian.net", jira_email="a@b.c")
+    auth.get_api_token.return_value = "token"
+    client = MagicMock()
+    client.connect_basic.return_value = True
+    client.get_project_name.return_value = "Project"
+    client.fetch_epics.side_effect = lambda keys, **_: [_make_epic(k) for k in keys]
+    with (
+        patch("epic_report_generator.cli.ConfigManager", return_value=config),
+        patch("epic_report_generator.cli.AuthManager", return_value=auth),
+        patch("epic_report_generator.cli.JiraClient", return_value=client),
+        patch("epic_report_generator.cli.IssueCache"),
+        patch("epic_report_generator.cli.ChartCache"),
+    ):
+        yield client
+
+
+class TestParseEpicKeys:
+    def test_splits_normalises_and_dedupes(self) -> None:
+        assert parse_epic_keys(" proj-1, PROJ-2 proj-1,,") == ["PROJ-1", "PROJ-2"]
+
+
+class TestGenerate:
+    def test_writes_pdf(self, jira: MagicMock, tmp_path: Path) -> None:
+        out = tmp_path / "nested" / "report.pdf"
+        assert generate(["--epics", "PROJ-1,PROJ-2", "--out", str(out)]) == EXIT_OK
+        assert out.read_bytes().startswith(b"%PDF")
+        assert jira.fetch_epics.call_args.args[0] == ["PROJ-1", "PROJ-2"]
+        jira.connect_basic.assert_called_once_with("https://x.atlassian.net", "a@b.c", "token")
+
+    def test_missing_epic_still_writes_pdf_but_fails(self, jira: MagicMock, tmp_path: Path) -> None:
+        jira.fetch_epics.side_effect = lambda keys, **_: [_make_epic(keys[0]), None]
+        out = tmp_path / "report.pdf"
+        assert generate(["--epics", "PROJ-1,PROJ-2", "--out", str(out)]) == EXIT_FAILED
+        assert out.exists()
+
+    def test_no_epics_found(self, jira: MagicMock, tmp_path: Path) -> None:
+        jira.fetch_epics.side_effect = lambda keys, **_: [None for _ in keys]
+        out = tmp_path / "report.pdf"
+        assert generate(["--epics", "PROJ-1", "--out", str(out)]) == EXIT_FAILED
+        assert not out.exists()
+
+    def test_writes_timing_trace(self, jira: MagicMock, tmp_path: Path) -> None:
+        trace = tmp_path / "trace.json"
+        out = tmp_path / "report.pdf"
+        assert generate(["--epics", "PROJ-1", "--out", str(out), "--trace", str(trace)]) == EXIT_OK
+        stages = json.loads(trace.read_text())["stages"]
+        assert {"fetch", "metrics", "story", "charts", "layout"} <= set(stages)
+
+    def test_not_connected(self, jira: MagicMock, tmp_path: Path) -> None:
+        jira.connect_basic.return_value = False
+        assert generate(["--epics", "PROJ-1", "--out", str(tmp_path / "r.pdf")]) == EXIT_NOT_CONNECTED
+        jira.fetch_epics.assert_not_called()
+
+    @pytest.mark.parametrize("epics", ["PROJ-1,OTHER-2", "not-a-key", ","])
+    def test_rejects_bad_keys(self, jira: MagicMock, tmp_path: Path, epics: str) -> None:
+        with pytest.raises(SystemExit) as exc:
+            generate(["--epics", epics, "--out", str(tmp_path / "r.pdf")])
+        assert exc.value.code == EXIT_USAGE
+        jira.connect_basic.assert_not_called()
+
+
+def test_does_not_import_qt() -> None:
+    code = (
+        "import sys\n"
+        "sys.argv = ['epic-report-generator', 'generate', '--help']\n"
+        "from epic_report_generator.__main__ import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert not any(m.startswith('PySide6') for m in sys.modules), 'PySide6 imported'\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent,
+        stdout=subprocess.DEVNULL,
+    )
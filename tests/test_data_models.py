@@ -43,6 +43,14 @@ class TestJiraIssue:
         assert issue.assignee is None
         assert issue.created is None
 
+    def test_slotted(self) -> None:
+        issue = JiraIssue(
+            key="X-1", summary="", status="", status_category="To Do",
+            resolution=None, issue_type="Bug", story_points=None,
+            created=None, resolved=None, assignee=None,
+        )
+        assert not hasattr(issue, "__dict__")
+
 
 class TestEpicData:
     """Verify EpicData defaults and children list."""
@@ -0,0 +1,52 @@
+"""Cold-start regression tests: heavy libraries stay off the startup path."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Loaded on first use (or by the post-startup warm-up thread), never at startup
+_DEFERRED = ("matplotlib", "reportlab", "numpy", "jira", "requests", "dateutil")
+
+# Generous, so that slow CI machines pass; eagerly importing any of the
+# above costs ~0.5 s to over 1 s on top of Qt itself
+_BUDGET_MS = int(os.environ.get("EPIC_IMPORT_BUDGET_MS", "1500"))
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """Import *module* in a fresh interpreter; return cumulative µs per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            profile[match.group(4)] = int(match.group(2))
+    return profile
+
+
+@pytest.fixture(scope="module")
+def app_profile() -> dict[str, int]:
+    pytest.importorskip("PySide6.QtWidgets")
+    return _import_profile("epic_report_generator.app")
+
+
+def test_gui_startup_defers_heavy_libraries(app_profile: dict[str, int]) -> None:
+    loaded = sorted({name.split(".")[0] for name in app_profile} & set(_DEFERRED))
+    assert not loaded, f"imported at startup: {', '.join(loaded)}"
+
+
+def test_gui_startup_within_budget(app_profile: dict[str, int]) -> None:
+    elapsed_ms = app_profile["epic_report_generator.app"] / 1000
+    assert elapsed_ms < _BUDGET_MS, f"importing the app took {elapsed_ms:.0f} ms (budget {_BUDGET_MS} ms)"
+
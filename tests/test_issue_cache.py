@@ -0,0 +1,135 @@
+"""Tests for epic_report_generator.services.issue_cache."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from epic_report_generator.services.issue_cache import IssueCache, SyncState, minutes_since
+
+SITE = "https://example.atlassian.net"
+
+
+def _raw(key: str, created: str = "2024-01-10T10:00:00.000+0000") -> dict[str, Any]:
+    return {"key": key, "fields": {"created": created, "updated": created, "summary": key}}
+
+
+def _make_cache(tmp_path: Path, **kwargs: float) -> IssueCache:
+    return IssueCache(tmp_path / "issues.sqlite3", **kwargs)
+
+
+class TestSyncState:
+    def test_unknown_epic_has_no_state(self, tmp_path: Path) -> None:
+        assert _make_cache(tmp_path).sync_state(SITE, "PROJ-1") is None
+
+    def test_full_store_records_state(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2")]}, "sig", 100.0, full=True)
+        assert cache.sync_state(SITE, "PROJ-1") == SyncState("sig", 100.0, 100.0)
+
+    def test_delta_store_only_advances_last_sync(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": []}, "sig", 100.0, full=True)
+        cache.store(SITE, {"PROJ-1": []}, "sig", 200.0, full=False)
+        assert cache.sync_state(SITE, "PROJ-1") == SyncState("sig", 200.0, 100.0)
+
+    def test_sites_are_isolated(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2")]}, "sig", 100.0, full=True)
+        assert cache.sync_state("https://other.atlassian.net", "PROJ-1") is None
+        assert cache.load_children("https://other.atlassian.net", "PROJ-1") == []
+
+
+class TestNeedsFullSync:
+    def test_never_synced(self, tmp_path: Path) -> None:
+        assert _make_cache(tmp_path).needs_full_sync(None, "sig", 0.0)
+
+    def test_field_change_forces_full_sync(self, tmp_path: Path) -> None:
+        state = SyncState("old", 100.0, 100.0)
+        assert _make_cache(tmp_path).needs_full_sync(state, "new", 101.0)
+
+    def test_interval_elapsed(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path, full_sync_interval=60)
+        state = SyncState("sig", 100.0, 100.0)
+        assert not cache.needs_full_sync(state, "sig", 159.0)
+        assert cache.needs_full_sync(state, "sig", 160.0)
+
+
+class TestStoreAndLoad:
+    def test_children_ordered_by_created(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [
+            _raw("PROJ-3", "2024-03-01T00:00:00.000+0000"),
+            _raw("PROJ-2", "2024-01-01T00:00:00.000+0000"),
+        ]}, "sig", 100.0, full=True)
+        assert [r["key"] for r in cache.load_children(SITE, "PROJ-1")] == ["PROJ-2", "PROJ-3"]
+
+    def test_children_ordered_by_utc_created(self, tmp_path: Path) -> None:
+        """``+0300`` sorts after ``+0000`` as text but happened earlier."""
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [
+            _raw("PROJ-2", "2024-01-01T10:00:00.000+0000"),
+            _raw("PROJ-3", "2024-01-01T11:00:00.000+0300"),
+            _raw("PROJ-4", "2024-01-01T12:00:00.000-0100"),
+        ]}, "sig", 100.0, full=True)
+        assert [r["key"] for r in cache.load_children(SITE, "PROJ-1")] == ["PROJ-3", "PROJ-2", "PROJ-4"]
+
+    def test_full_store_drops_missing_issues(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2"), _raw("PROJ-3")]}, "sig", 100.0, full=True)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-3")]}, "sig", 200.0, full=True)
+        assert [r["key"] for r in cache.load_children(SITE, "PROJ-1")] == ["PROJ-3"]
+
+    def test_delta_merges_and_reparents(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(
+            SITE, {"A-1": [_raw("X-1"), _raw("X-2")], "B-1": []}, "sig", 100.0, full=True,
+        )
+        updated = _raw("X-1")
+        updated["fields"]["summary"] = "renamed"
+        cache.store(SITE, {"A-1": [updated], "B-1": [_raw("X-2")]}, "sig", 200.0, full=False)
+
+        assert [r["key"] for r in cache.load_children(SITE, "A-1")] == ["X-1"]
+        assert cache.load_children(SITE, "A-1")[0]["fields"]["summary"] == "renamed"
+        assert [r["key"] for r in cache.load_children(SITE, "B-1")] == ["X-2"]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2")]}, "sig", 100.0, full=True)
+        cache.close()
+        assert [r["key"] for r in _make_cache(tmp_path).load_children(SITE, "PROJ-1")] == ["PROJ-2"]
+
+    def test_outdated_schema_is_rebuilt(self, tmp_path: Path) -> None:
+        path = tmp_path / "issues.sqlite3"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE issues (site TEXT, key TEXT, epic_key TEXT, created TEXT,"
+                " updated TEXT, payload TEXT, PRIMARY KEY (site, key))"
+            )
+            conn.execute(
+                "INSERT INTO issues VALUES (?, 'PROJ-2', 'PROJ-1', '2024-01-01T00:00:00.000+0000', NULL, '{}')",
+                (SITE,),
+            )
+        conn.close()
+        cache = _make_cache(tmp_path)
+        assert cache.load_children(SITE, "PROJ-1") == []
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2")]}, "sig", 100.0, full=True)
+        assert [r["key"] for r in cache.load_children(SITE, "PROJ-1")] == ["PROJ-2"]
+        cache.close()
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = _make_cache(tmp_path)
+        cache.store(SITE, {"PROJ-1": [_raw("PROJ-2")]}, "sig", 100.0, full=True)
+        cache.clear()
+        assert cache.sync_state(SITE, "PROJ-1") is None
+        assert cache.load_children(SITE, "PROJ-1") == []
+
+
+class TestMinutesSince:
+    def test_includes_margin(self) -> None:
+        assert minutes_since(time.time(), margin=5) == 6
+
+    def test_rounds_up_elapsed_minutes(self) -> None:
+        assert minutes_since(time.time() - 125, margin=0) == 3
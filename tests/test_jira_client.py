@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
+from collections.abc import Iterator
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from jira import JIRAError
 
-from epic_report_generator.core.jira_client import JiraClient
+from epic_report_generator.core.jira_client import (
+    CHILD_FIELDS,
+    EPIC_FIELDS,
+    JiraClient,
+    _chunk_keys,
+    _IssueDecoder,
+)
 from epic_report_generator.services.auth_manager import AuthManager
 from epic_report_generator.services.config_manager import ConfigManager
+from epic_report_generator.services.issue_cache import IssueCache
 
 
 # ---------------------------------------------------------------------------
@@ -41,30 +52,34 @@ def _make_raw_issue(
     status: str = "Open",
     status_cat: str = "To Do",
     sp: float | None = 5.0,
-) -> SimpleNamespace:
-    """Build a mock Jira raw issue matching the attrs used by JiraClient."""
-    status_obj = SimpleNamespace(
-        statusCategory=SimpleNamespace(name=status_cat),
-    )
-    status_obj.__str__ = lambda self: status  # type: ignore[assignment]
-    fields = SimpleNamespace(
-        summary=summary,
-        status=status_obj,
-        priority=SimpleNamespace(name="Medium"),
-        assignee=SimpleNamespace(displayName="Alice"),
-        reporter=SimpleNamespace(displayName="Bob"),
-        created="2024-01-10T10:00:00.000+0000",
-        updated="2024-06-01T12:00:00.000+0000",
-        labels=["backend"],
-        fixVersions=[],
-        issuetype=SimpleNamespace(name="Story"),
-        resolution=None,
-        resolutiondate=None,
-        story_points=sp,
-        customfield_10014=None,
-        customfield_10016=None,
-    )
-    return SimpleNamespace(key=key, fields=fields)
+    epic_link: str | None = None,
+) -> dict[str, Any]:
+    """Build raw issue JSON as returned by a Jira search."""
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "status": {"name": status, "statusCategory": {"name": status_cat}},
+            "priority": {"name": "Medium"},
+            "assignee": {"displayName": "Alice"},
+            "reporter": {"displayName": "Bob"},
+            "created": "2024-01-10T10:00:00.000+0000",
+            "updated": "2024-06-01T12:00:00.000+0000",
+            "labels": ["backend"],
+            "fixVersions": [],
+            "issuetype": {"name": "Story"},
+            "resolution": None,
+            "resolutiondate": None,
+            "story_points": sp,
+            "customfield_10014": epic_link,
+            "customfield_10016": None,
+        },
+    }
+
+
+def _page(*issues: dict[str, Any]) -> dict[str, Any]:
+    """Wrap raw issues in a search response page."""
+    return {"issues": list(issues)}
 
 
 # ---------------------------------------------------------------------------
@@ -103,6 +118,71 @@ class TestConnectOAuth:
         assert client.connect() is False
 
 
+class TestConnectBasic:
+    """connect_basic should probe as little as possible."""
+
+    URL = "https://company.atlassian.net"
+    CLOUD_URL = "https://api.atlassian.com/ex/jira/cid"
+
+    @staticmethod
+    def _fake_jira(accepts: set[str], servers: list[str]) -> Any:
+        def factory(server: str, **kwargs: Any) -> MagicMock:
+            servers.append(server)
+            jira = MagicMock()
+            if server in accepts:
+                jira.myself.return_value = {"displayName": "Ada"}
+            else:
+                jira.myself.side_effect = JIRAError(status_code=401)
+            return jira
+        return factory
+
+    def _connect(self, tmp_path: Path, accepts: set[str], **config: str) -> tuple[JiraClient, list[str]]:
+        client = JiraClient(_make_auth(tmp_path, **config))
+        servers: list[str] = []
+        with patch.object(client, "_new_jira", self._fake_jira(accepts, servers)), \
+                patch.object(JiraClient, "_resolve_cloud_id", return_value="cid"):
+            assert client.connect_basic(self.URL, "a@b.com", "tok")
+        return client, servers
+
+    def test_classic_token_remembered(self, tmp_path: Path) -> None:
+        client, servers = self._connect(tmp_path, {self.URL})
+        assert servers == [self.URL]
+        assert client._auth.api_endpoint == "instance"
+
+    def test_scoped_token_falls_back_and_is_remembered(self, tmp_path: Path) -> None:
+        client, servers = self._connect(tmp_path, {self.CLOUD_URL})
+        assert servers == [self.URL, self.CLOUD_URL]
+        assert client._auth.cloud_id == "cid"
+        assert client._auth.api_endpoint == "cloud"
+
+    def test_reconnect_tries_remembered_endpoint_first(self, tmp_path: Path) -> None:
+        _, servers = self._connect(
+            tmp_path, {self.CLOUD_URL}, cloud_id="cid", api_endpoint="cloud",
+        )
+        assert servers == [self.CLOUD_URL]
+
+    def test_validation_response_reused_by_get_myself(self, tmp_path: Path) -> None:
+        client, _ = self._connect(tmp_path, {self.URL})
+        assert client.get_myself()["displayName"] == "Ada"
+        client._jira.myself.assert_called_once()
+
+    def test_fails_when_every_endpoint_rejects(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        servers: list[str] = []
+        with patch.object(client, "_new_jira", self._fake_jira(set(), servers)), \
+                patch.object(JiraClient, "_resolve_cloud_id", return_value="cid"):
+            assert client.connect_basic(self.URL, "a@b.com", "tok") is False
+        assert client.connected is False
+        assert client._auth.api_endpoint == ""
+
+    def test_client_skips_server_info_probe(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        with patch("jira.JIRA") as jira_cls:
+            jira = client._new_jira(self.URL, basic_auth=("a", "b"))
+        assert jira_cls.call_args.kwargs["get_server_info"] is False
+        assert jira.deploymentType == "Cloud"
+
+
 # ---------------------------------------------------------------------------
 # static helpers
 # ---------------------------------------------------------------------------
@@ -118,8 +198,10 @@ class TestStaticHelpers:
         assert JiraClient._name("Alice") == "Alice"
 
     def test_name_extracts_displayName(self) -> None:
-        obj = SimpleNamespace(displayName="Bob")
-        assert JiraClient._name(obj) == "Bob"
+        assert JiraClient._name({"displayName": "Bob", "name": "bob"}) == "Bob"
+
+    def test_name_falls_back_to_name(self) -> None:
+        assert JiraClient._name({"name": "High"}) == "High"
 
     def test_parse_dt_none(self) -> None:
         assert JiraClient._parse_dt(None) is None
@@ -134,17 +216,77 @@ class TestStaticHelpers:
     def test_parse_dt_invalid(self) -> None:
         assert JiraClient._parse_dt("not-a-date") is None
 
-    def test_status_category_none_fields(self) -> None:
-        fields = SimpleNamespace()
-        assert JiraClient._status_category(fields) == "To Do"
+    def test_parse_dt_jira_format_keeps_offset(self) -> None:
+        result = JiraClient._parse_dt("2024-01-15T10:30:00.123-0530")
+        assert result == datetime(2024, 1, 15, 16, 0, 0, 123000, tzinfo=timezone.utc)
+        assert result.utcoffset().total_seconds() == -(5 * 3600 + 30 * 60)
 
-    def test_status_category_extracts_name(self) -> None:
-        fields = SimpleNamespace(
-            status=SimpleNamespace(
-                statusCategory=SimpleNamespace(name="In Progress"),
-            )
+    def test_parse_dt_utc_offset(self) -> None:
+        result = JiraClient._parse_dt("2024-01-15T10:30:00.000+0000")
+        assert result == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+    def test_parse_dt_falls_back_for_other_layouts(self) -> None:
+        assert JiraClient._parse_dt("2024-01-15T10:30:00Z") == datetime(
+            2024, 1, 15, 10, 30, tzinfo=timezone.utc,
         )
-        assert JiraClient._status_category(fields) == "In Progress"
+        assert JiraClient._parse_dt("2024-01-15") == datetime(2024, 1, 15)
+
+    def test_parse_dt_rejects_bad_fixed_width_values(self) -> None:
+        assert JiraClient._parse_dt("2024-13-15T10:30:00.000+0000") is None
+
+
+class TestIssueDecoder:
+    """Raw issue JSON should map straight onto JiraIssue."""
+
+    def test_decodes_all_fields(self) -> None:
+        raw = _make_raw_issue("PROJ-7", "Child", status="Done", status_cat="Done", sp=8.0)
+        raw["fields"]["resolution"] = {"name": "Fixed"}
+        raw["fields"]["resolutiondate"] = "2024-02-01T09:30:00.000+0000"
+
+        issue = _IssueDecoder("story_points", "customfield_10014")(raw)
+
+        assert issue.key == "PROJ-7"
+        assert issue.summary == "Child"
+        assert issue.status == "Done"
+        assert issue.status_category == "Done"
+        assert issue.resolution == "Fixed"
+        assert issue.issue_type == "Story"
+        assert issue.story_points == 8.0
+        assert issue.created == datetime(2024, 1, 10, 10, 0, tzinfo=timezone.utc)
+        assert issue.resolved == datetime(2024, 2, 1, 9, 30, tzinfo=timezone.utc)
+        assert issue.assignee == "Alice"
+
+    def test_missing_fields_use_defaults(self) -> None:
+        issue = _IssueDecoder("story_points", "customfield_10014")({"key": "X-1", "fields": {}})
+        assert issue.status_category == "To Do"
+        assert issue.resolution is None
+        assert issue.story_points is None
+        assert issue.created is None
+        assert issue.assignee is None
+
+    def test_story_points_fallback_field(self) -> None:
+        raw = _make_raw_issue(sp=None)
+        raw["fields"]["customfield_10016"] = 2
+        assert _IssueDecoder("story_points", "customfield_10014")(raw).story_points == 2.0
+
+    def test_categorical_strings_are_shared(self) -> None:
+        # Parsed JSON gives every issue its own copy of each string
+        raws = [_make_raw_issue(f"PROJ-{i}") for i in range(2)]
+        for raw in raws:
+            raw["fields"]["resolution"] = {"name": "Fixed"}
+        raws = json.loads(json.dumps(raws))
+        decode = _IssueDecoder("story_points", "customfield_10014")
+        first, second = (decode(raw) for raw in raws)
+        for attr in ("status", "status_category", "resolution", "issue_type", "assignee"):
+            assert getattr(first, attr) is getattr(second, attr), attr
+
+    def test_epic_link_from_field_or_parent(self) -> None:
+        decode = _IssueDecoder("story_points", "customfield_10014")
+        assert decode.epic_link(_make_raw_issue(epic_link="PROJ-1")) == "PROJ-1"
+        raw = _make_raw_issue()
+        raw["fields"]["parent"] = {"key": "PROJ-2"}
+        assert decode.epic_link(raw) == "PROJ-2"
+        assert decode.epic_link({"key": "X-1", "fields": {}}) is None
 
 
 # ---------------------------------------------------------------------------
@@ -189,7 +331,7 @@ class TestFetchEpic:
         raw_child = _make_raw_issue("PROJ-2", "Child Issue", sp=3.0)
 
         # First call returns the epic, second returns one child, third returns empty
-        client._jira.search_issues.side_effect = [[raw_epic], [raw_child], []]
+        client._jira.enhanced_search_issues.side_effect = [_page(raw_epic), _page(raw_child), _page()]
 
         epic = client.fetch_epic("PROJ-1")
         assert epic is not None
@@ -200,11 +342,277 @@ class TestFetchEpic:
     def test_fetch_epic_returns_none_for_missing_key(self, tmp_path: Path) -> None:
         client = JiraClient(_make_auth(tmp_path))
         client._jira = MagicMock()
-        client._jira.search_issues.return_value = []
+        client._jira.enhanced_search_issues.return_value = _page()
 
         assert client.fetch_epic("MISSING-1") is None
 
 
+class TestFetchEpics:
+    @staticmethod
+    def _keys_in(jql: str) -> list[str]:
+        return [k.strip() for k in jql.split("(", 1)[1].split(")", 1)[0].split(",")]
+
+    def _search(self, jql: str, **_: object) -> dict[str, Any]:
+        """Fake search: epic headers by ``key in``, one child per epic."""
+        if jql.startswith("key in"):
+            return _page(*(
+                _make_raw_issue(key, f"Epic {key}")
+                for key in self._keys_in(jql)
+                if not key.startswith("MISSING")
+            ))
+        return _page(*(
+            _make_raw_issue(f"{key}-C", "Child", sp=1.0, epic_link=key)
+            for key in self._keys_in(jql)
+        ))
+
+    def test_returns_empty_slots_when_disconnected(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        assert client.fetch_epics(["A-1", "B-1"]) == [None, None]
+
+    def test_preserves_input_order(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = self._search
+
+        keys = [f"PROJ-{i}" for i in range(10)]
+        epics = client.fetch_epics(keys, max_workers=4)
+
+        assert [e.key for e in epics if e is not None] == keys
+        assert all(e is not None and e.children[0].key == f"{e.key}-C" for e in epics)
+
+    def test_missing_epic_is_none_and_progress_reported(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = self._search
+        seen: list[tuple[str, int, int]] = []
+
+        epics = client.fetch_epics(
+            ["PROJ-1", "MISSING-1", "PROJ-2"],
+            on_progress=lambda key, done, total: seen.append((key, done, total)),
+        )
+
+        assert epics[1] is None
+        assert epics[0] is not None and epics[2] is not None
+        assert sorted(k for k, _, _ in seen) == ["MISSING-1", "PROJ-1", "PROJ-2"]
+        assert [d for _, d, _ in seen] == [1, 2, 3]
+        assert all(t == 3 for _, _, t in seen)
+
+    def test_rejected_key_only_drops_itself(self, tmp_path: Path) -> None:
+        """A 400 for one unknown key splits the header search instead of losing the chunk."""
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+
+        def _search(jql: str, **kwargs: object) -> dict[str, Any]:
+            if jql.startswith("key in") and "BAD-1" in self._keys_in(jql):
+                raise JIRAError(status_code=400, text="An issue with key 'BAD-1' does not exist for field 'key'.")
+            return self._search(jql, **kwargs)
+
+        client._jira.enhanced_search_issues.side_effect = _search
+        keys = [f"PROJ-{i}" for i in range(7)]
+        keys.insert(3, "BAD-1")
+
+        epics = client.fetch_epics(keys, max_workers=2)
+
+        assert [e.key if e else None for e in epics] == [*keys[:3], None, *keys[4:]]
+        header_searches = [
+            c.args[0] for c in client._jira.enhanced_search_issues.call_args_list
+            if c.args[0].startswith("key in")
+        ]
+        assert len(header_searches) == 7  # 8 → 4 + 4 → 2 + 2 → 1 + 1
+
+    def test_failed_chunk_only_fails_its_epics(self, tmp_path: Path, clock: _FakeClock) -> None:
+        """A dropped connection in one chunk leaves the other chunks' Epics intact."""
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+
+        def _search(jql: str, **kwargs: object) -> dict[str, Any]:
+            header = jql.startswith("key in")
+            if ("PROJ-3" if header else "PROJ-1") in self._keys_in(jql):
+                raise requests.ConnectionError("reset by peer")
+            return self._search(jql, **kwargs)
+
+        client._jira.enhanced_search_issues.side_effect = _search
+        seen: list[str] = []
+
+        with patch("epic_report_generator.core.jira_client._MAX_JQL_KEYS", 2):
+            epics = client.fetch_epics(
+                ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"], max_workers=2,
+                on_progress=lambda key, done, total: seen.append(key),
+            )
+
+        # PROJ-1 fails with its children chunk, PROJ-3 with its header chunk
+        assert [e.key if e else None for e in epics] == [None, "PROJ-2", None, None]
+        assert sorted(seen) == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+
+    def test_batches_searches(self, tmp_path: Path) -> None:
+        """Headers come from one ``key in`` search, children from one per worker."""
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = self._search
+
+        keys = [f"PROJ-{i}" for i in range(40)]
+        epics = client.fetch_epics(keys, max_workers=4)
+
+        assert all(e is not None and len(e.children) == 1 for e in epics)
+        jqls = [c.args[0] for c in client._jira.enhanced_search_issues.call_args_list]
+        assert sum(j.startswith("key in") for j in jqls) == 1
+        assert sum('"customfield_10014" in' in j for j in jqls) == 4
+
+    def test_children_partitioned_by_epic_link(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = [
+            _page(_make_raw_issue("A-1", "Epic A"), _make_raw_issue("B-1", "Epic B")),
+            _page(
+                _make_raw_issue("A-2", epic_link="A-1"),
+                _make_raw_issue("B-2", epic_link="B-1"),
+                _make_raw_issue("A-3", epic_link="A-1"),
+                _make_raw_issue("Z-9", epic_link="Z-1"),
+            ),
+        ]
+
+        epic_a, epic_b = client.fetch_epics(["A-1", "B-1"], max_workers=1)
+
+        assert epic_a is not None and epic_b is not None
+        assert [c.key for c in epic_a.children] == ["A-2", "A-3"]
+        assert [c.key for c in epic_b.children] == ["B-2"]
+
+    def test_chunk_keys_respects_size_and_length(self) -> None:
+        keys = [f"PROJECT-{i:05d}" for i in range(500)]
+        chunks = _chunk_keys(keys, 100)
+        assert [k for c in chunks for k in c] == keys
+        assert all(len(c) <= 100 for c in chunks)
+        assert all(len(", ".join(c)) <= 2000 for c in chunks)
+
+
+class TestFieldProjection:
+    def test_child_fields_include_configured_fields(self) -> None:
+        fields = JiraClient.child_fields("customfield_10028", "customfield_10014")
+        assert fields[: len(CHILD_FIELDS)] == list(CHILD_FIELDS)
+        assert "customfield_10028" in fields
+        assert "customfield_10014" in fields
+
+    def test_child_fields_deduplicated(self) -> None:
+        fields = JiraClient.child_fields("customfield_10016", "parent")
+        assert len(fields) == len(set(fields))
+
+    def test_searches_request_raw_json(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.return_value = _page(_make_raw_issue("PROJ-1"))
+        client.validate_epic_key("PROJ-1")
+        assert client._jira.enhanced_search_issues.call_args.kwargs["json_result"] is True
+
+    def test_every_search_is_projected(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = [
+            _page(_make_raw_issue("PROJ-1", "My Epic")),
+            _page(_make_raw_issue("PROJ-2", sp=3.0)),
+        ]
+
+        client.fetch_epic("PROJ-1", sp_field="customfield_10028")
+
+        epic_call, child_call = client._jira.enhanced_search_issues.call_args_list
+        assert epic_call.kwargs["fields"] == list(EPIC_FIELDS)
+        assert "customfield_10028" in child_call.kwargs["fields"]
+        assert "customfield_10014" in child_call.kwargs["fields"]
+
+
+class TestPagination:
+    """Searches follow ``nextPageToken`` until the last page."""
+
+    @staticmethod
+    def _pages() -> list[dict[str, Any]]:
+        return [
+            {**_page(_make_raw_issue("PROJ-2")), "nextPageToken": "t1", "isLast": False},
+            {**_page(_make_raw_issue("PROJ-3")), "nextPageToken": "t2", "isLast": False},
+            {**_page(_make_raw_issue("PROJ-4")), "isLast": True},
+        ]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_follows_next_page_token(self, tmp_path: Path, prefetch: bool) -> None:
+        client = JiraClient(_make_auth(tmp_path), prefetch_pages=prefetch)
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = self._pages()
+
+        children = client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        assert [c.key for c in children] == ["PROJ-2", "PROJ-3", "PROJ-4"]
+        tokens = [
+            c.kwargs["nextPageToken"]
+            for c in client._jira.enhanced_search_issues.call_args_list
+        ]
+        assert tokens == [None, "t1", "t2"]
+
+    def test_requests_largest_page_size(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.return_value = _page()
+
+        client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        assert client._jira.enhanced_search_issues.call_args.kwargs["maxResults"] == 5000
+
+    def test_stops_on_is_last_even_with_token(self, tmp_path: Path) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.return_value = {
+            **_page(_make_raw_issue("PROJ-2")), "nextPageToken": "stale", "isLast": True,
+        }
+
+        children = client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        assert len(children) == 1
+        assert client._jira.enhanced_search_issues.call_count == 1
+
+
+class TestIssueCacheSync:
+    """With an IssueCache, repeat fetches only download recent updates."""
+
+    def _client(self, tmp_path: Path, **kwargs: float) -> JiraClient:
+        cache = IssueCache(tmp_path / "issues.sqlite3", **kwargs)
+        client = JiraClient(_make_auth(tmp_path), cache=cache)
+        client._jira = MagicMock()
+        client._jira.server_url = "https://example.atlassian.net"
+        return client
+
+    def test_first_fetch_is_full_then_delta(self, tmp_path: Path) -> None:
+        client = self._client(tmp_path)
+        search = client._jira.enhanced_search_issues
+        search.return_value = _page(_make_raw_issue("PROJ-2", epic_link="PROJ-1"))
+        first = client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        search.return_value = _page(_make_raw_issue("PROJ-3", epic_link="PROJ-1"))
+        second = client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        first_jql, second_jql = (c.args[0] for c in search.call_args_list)
+        assert "updated" not in first_jql
+        assert "updated >= -" in second_jql
+        assert [c.key for c in first] == ["PROJ-2"]
+        assert sorted(c.key for c in second) == ["PROJ-2", "PROJ-3"]
+
+    def test_full_sync_after_interval(self, tmp_path: Path) -> None:
+        client = self._client(tmp_path, full_sync_interval=0)
+        search = client._jira.enhanced_search_issues
+        search.return_value = _page(_make_raw_issue("PROJ-2", epic_link="PROJ-1"))
+        client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        search.return_value = _page()
+        children = client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+
+        assert "updated" not in search.call_args.args[0]
+        assert children == []
+
+    def test_changed_field_mapping_forces_full_sync(self, tmp_path: Path) -> None:
+        client = self._client(tmp_path)
+        search = client._jira.enhanced_search_issues
+        search.return_value = _page()
+        client._fetch_children("PROJ-1", "story_points", "customfield_10014")
+        client._fetch_children("PROJ-1", "customfield_10028", "customfield_10014")
+        assert "updated" not in search.call_args.args[0]
+
+
 # ---------------------------------------------------------------------------
 # validate_epic_key
 # ---------------------------------------------------------------------------
@@ -214,13 +622,13 @@ class TestValidateEpicKey:
     def test_valid_key(self, tmp_path: Path) -> None:
         client = JiraClient(_make_auth(tmp_path))
         client._jira = MagicMock()
-        client._jira.search_issues.return_value = [_make_raw_issue("PROJ-1")]
+        client._jira.enhanced_search_issues.return_value = _page(_make_raw_issue("PROJ-1"))
         assert client.validate_epic_key("PROJ-1") is True
 
     def test_invalid_key(self, tmp_path: Path) -> None:
         client = JiraClient(_make_auth(tmp_path))
         client._jira = MagicMock()
-        client._jira.search_issues.return_value = []
+        client._jira.enhanced_search_issues.return_value = _page()
         assert client.validate_epic_key("NOPE-1") is False
 
     def test_returns_false_when_disconnected(self, tmp_path: Path) -> None:
@@ -233,20 +641,98 @@ class TestValidateEpicKey:
 # ---------------------------------------------------------------------------
 
 
+class _FakeClock:
+    """Stand-in for the ``time`` module used by the rate limiter."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Iterator[_FakeClock]:
+    fake = _FakeClock()
+    with patch("epic_report_generator.core.rate_limiter.time", fake):
+        yield fake
+
+
 class TestRetryLogic:
-    def test_retries_on_429(self, tmp_path: Path) -> None:
+    def test_retries_on_429(self, tmp_path: Path, clock: _FakeClock) -> None:
         """_search_with_retry should retry after a 429 status."""
         client = JiraClient(_make_auth(tmp_path))
         client._jira = MagicMock()
 
         exc = JIRAError(status_code=429, text="Rate limited")
-        client._jira.search_issues.side_effect = [exc, [_make_raw_issue()]]
+        client._jira.enhanced_search_issues.side_effect = [exc, _page(_make_raw_issue())]
+
+        results = client._search_with_retry("key = X-1")
+
+        assert len(results["issues"]) == 1
+        assert client._jira.enhanced_search_issues.call_count == 2
+
+    def test_retries_on_503_after_retry_after(self, tmp_path: Path, clock: _FakeClock) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        exc = JIRAError(
+            status_code=503, text="Unavailable",
+            response=SimpleNamespace(headers={"Retry-After": "7"}),
+        )
+        client._jira.enhanced_search_issues.side_effect = [exc, _page()]
 
-        with patch("epic_report_generator.core.jira_client.time.sleep"):
-            results = client._search_with_retry("key = X-1")
+        client._search_with_retry("key = X-1")
 
-        assert len(results) == 1
-        assert client._jira.search_issues.call_count == 2
+        assert client._jira.enhanced_search_issues.call_count == 2
+        assert sum(clock.slept) >= 7
+
+    def test_backoff_is_shared_between_searches(self, tmp_path: Path, clock: _FakeClock) -> None:
+        """A throttled request on one thread delays searches from every thread."""
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.return_value = _page()
+
+        client._limiter.backoff(0, retry_after=5)
+        client._search_with_retry("key = X-2")
+
+        assert sum(clock.slept) >= 5
+
+    def test_gives_up_after_max_retries(self, tmp_path: Path, clock: _FakeClock) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = JIRAError(status_code=429)
+
+        with pytest.raises(JIRAError):
+            client._search_with_retry("key = X-1")
+        assert client._jira.enhanced_search_issues.call_count == 4
+
+    def test_retries_dropped_connection(self, tmp_path: Path, clock: _FakeClock) -> None:
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.enhanced_search_issues.side_effect = [requests.ConnectionError("reset"), _page()]
+
+        client._search_with_retry("key = X-1")
+
+        assert client._jira.enhanced_search_issues.call_count == 2
+
+    def test_other_api_calls_are_retried(self, tmp_path: Path, clock: _FakeClock) -> None:
+        """Calls outside searches go through the same retries (the library's are off)."""
+        client = JiraClient(_make_auth(tmp_path))
+        client._jira = MagicMock()
+        client._jira.myself.side_effect = [JIRAError(status_code=503), {"displayName": "Me"}]
+        client._jira.fields.side_effect = [requests.Timeout("slow"), []]
+        client._jira.project.side_effect = [JIRAError(status_code=429), SimpleNamespace(name="My Project")]
+
+        me = client.get_myself()
+
+        assert me is not None and me["displayName"] == "Me"
+        assert client.fetch_fields() == []
+        assert client.get_project_name("PROJ") == "My Project"
 
     def test_raises_non_429_errors(self, tmp_path: Path) -> None:
         """Non-429 JIRAErrors should propagate immediately."""
@@ -254,7 +740,7 @@ class TestRetryLogic:
         client._jira = MagicMock()
 
         exc = JIRAError(status_code=404, text="Not found")
-        client._jira.search_issues.side_effect = exc
+        client._jira.enhanced_search_issues.side_effect = exc
 
         with pytest.raises(JIRAError):
             client._search_with_retry("key = X-1")
@@ -0,0 +1,137 @@
+"""Tests for epic_report_generator.ui.log_panel."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from PySide6.QtGui import QFont
+
+from epic_report_generator.ui.log_panel import LogPanel, _LogModel, _QtLogHandler
+
+logger = logging.getLogger("tests.log_panel")
+
+
+@pytest.fixture
+def panel(qtbot) -> Iterator[LogPanel]:  # type: ignore[no-untyped-def]
+    widget = LogPanel()
+    qtbot.addWidget(widget)
+    yield widget
+    logging.getLogger().removeHandler(widget._handler)
+
+
+def _lines(panel: LogPanel) -> list[str]:
+    return _texts(panel._model)
+
+
+def _texts(model: _LogModel) -> list[str]:
+    return [model.line(row)[0] for row in range(model.rowCount())]
+
+
+class TestQtLogHandler:
+    def test_drain_returns_queued_lines_in_order(self) -> None:
+        handler = _QtLogHandler(capacity=10)
+        for i in range(3):
+            handler.emit(logger.makeRecord(logger.name, logging.INFO, __file__, 0, "line %d", (i,), None))
+        lines = handler.drain()
+        assert [text.endswith(f"line {i}") for i, (text, _) in enumerate(lines)] == [True] * 3
+        assert {level for _, level in lines} == {logging.INFO}
+        assert handler.drain() == []
+
+    def test_formats_on_emit(self) -> None:
+        """Arguments are rendered before the caller can mutate them, with the traceback."""
+        handler = _QtLogHandler(capacity=10)
+        keys = ["A-1"]
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logger.makeRecord(logger.name, logging.ERROR, __file__, 0, "keys %s", (keys,), sys.exc_info())
+        handler.emit(record)
+        keys.append("B-1")
+        ((text, level),) = handler.drain()
+        assert text.splitlines()[0].endswith("keys ['A-1']")
+        assert "ValueError: boom" in text
+        assert level == logging.ERROR
+
+    def test_keeps_only_newest_records_when_full(self) -> None:
+        handler = _QtLogHandler(capacity=2)
+        for i in range(5):
+            handler.emit(logger.makeRecord(logger.name, logging.INFO, __file__, 0, "line %d", (i,), None))
+        assert [text[-6:] for text, _ in handler.drain()] == ["line 3", "line 4"]
+
+
+class TestLogPanel:
+    def test_records_from_worker_thread_are_shown_in_batches(self, panel: LogPanel, qtbot) -> None:  # type: ignore[no-untyped-def]
+        worker = threading.Thread(target=lambda: [logger.warning("fetched %d", i) for i in range(200)])
+        worker.start()
+        worker.join()
+        with patch.object(panel._model, "append", wraps=panel._model.append) as append:
+            panel._flush()
+        assert append.call_count == 1
+        lines = [line for line in _lines(panel) if "fetched" in line]
+        assert len(lines) == 200
+        assert lines[-1].endswith("fetched 199")
+
+    def test_timer_drains_queue(self, panel: LogPanel, qtbot) -> None:  # type: ignore[no-untyped-def]
+        logger.warning("hello from the timer")
+        qtbot.waitUntil(lambda: any("hello from the timer" in line for line in _lines(panel)))
+
+    def test_filter_hides_and_restores_levels(self, panel: LogPanel, qtbot) -> None:  # type: ignore[no-untyped-def]
+        logger.warning("a warning")
+        logger.error("an error")
+        panel._flush()
+        panel._on_filter_toggled(logging.WARNING, False)
+        assert not any("a warning" in line for line in _lines(panel))
+        assert any("an error" in line for line in _lines(panel))
+        panel._on_filter_toggled(logging.WARNING, True)
+        assert any("a warning" in line for line in _lines(panel))
+
+    def test_search_matches_case_insensitively(self, panel: LogPanel, qtbot) -> None:  # type: ignore[no-untyped-def]
+        logger.warning("Fetched PROJ-1")
+        logger.warning("Fetched PROJ-2")
+        panel._flush()
+        panel._search.setText("proj-2")
+        qtbot.waitUntil(lambda: len(_lines(panel)) == 1)
+        assert _lines(panel)[-1].endswith("Fetched PROJ-2")
+        assert not any("PROJ-1" in line for line in _lines(panel))
+
+
+class TestLogModel:
+    @pytest.fixture
+    def model(self, qtbot) -> _LogModel:  # type: ignore[no-untyped-def]
+        return _LogModel(capacity=5, font=QFont())
+
+    def test_level_filter_keeps_arrival_order(self, model: _LogModel) -> None:
+        model.append([("d1", logging.DEBUG), ("i1", logging.INFO), ("d2", logging.DEBUG), ("w1", logging.WARNING)])
+        model.set_filter({logging.DEBUG, logging.WARNING})
+        assert _texts(model) == ["d1", "d2", "w1"]
+        model.append([("d3", logging.DEBUG), ("i2", logging.INFO)])
+        assert _texts(model)[-1] == "d3"
+        model.set_filter({logging.DEBUG, logging.INFO, logging.WARNING})
+        assert _texts(model) == ["i1", "d2", "w1", "d3", "i2"]
+
+    def test_oldest_lines_evicted_at_capacity(self, model: _LogModel) -> None:
+        model.set_filter({logging.INFO})
+        model.append([(f"i{i}", logging.INFO) for i in range(3)])
+        model.append([("d", logging.DEBUG)] + [(f"i{i}", logging.INFO) for i in range(3, 6)])
+        assert _texts(model) == ["i2", "i3", "i4", "i5"]
+        model.set_filter({logging.INFO, logging.DEBUG})
+        assert _texts(model) == ["i2", "d", "i3", "i4", "i5"]
+
+    def test_search_combines_with_level_filter(self, model: _LogModel) -> None:
+        model.append([("alpha", logging.INFO), ("ALPHA", logging.DEBUG), ("beta", logging.INFO)])
+        model.set_filter({logging.INFO}, "Alpha")
+        assert _texts(model) == ["alpha"]
+        model.append([("alphabet", logging.INFO), ("gamma", logging.INFO)])
+        assert _texts(model) == ["alpha", "alphabet"]
+
+    def test_clear_empties_model(self, model: _LogModel) -> None:
+        model.append([("a", logging.INFO)])
+        model.clear()
+        model.append([("b", logging.INFO)])
+        assert _texts(model) == ["b"]
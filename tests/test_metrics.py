@@ -131,3 +131,85 @@ class TestMetrics:
         assert len(m.dates) > 0
         assert len(m.total_sp_over_time) == len(m.dates)
         assert len(m.completed_sp_over_time) == len(m.dates)
+
+    def test_time_series_values(self) -> None:
+        now = datetime.now().astimezone()
+        children = [
+            _make_issue("T-1", "Done", 3, created=now - timedelta(days=4), resolved=now - timedelta(days=1)),
+            _make_issue("T-2", "To Do", None, created=now - timedelta(days=2)),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.dates[0] == (now - timedelta(days=4)).date()
+        assert m.total_sp_over_time == [3, 3, 3, 3, 3]
+        assert m.completed_sp_over_time == [0, 0, 0, 3, 3]
+        assert m.cumulative_issues == [1, 1, 2, 2, 2]
+        assert m.cumulative_unestimated == [0, 0, 1, 1, 1]
+
+    def test_time_series_done_not_before_created(self) -> None:
+        now = datetime.now().astimezone()
+        children = [
+            _make_issue("T-1", "To Do", 1, created=now - timedelta(days=4)),
+            _make_issue("T-2", "Done", 2, created=now - timedelta(days=2), resolved=now - timedelta(days=3)),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.completed_sp_over_time == [0, 0, 2, 2, 2]
+
+    def test_time_series_resolution_after_day_end_counts_next_day(self) -> None:
+        now = datetime.now().astimezone()
+        day = (now - timedelta(days=2)).date()
+        late = datetime(day.year, day.month, day.day, 23, 59, 59, 500_000).astimezone()
+        children = [
+            _make_issue("T-1", "Done", 5, created=now - timedelta(days=4), resolved=late),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.completed_sp_over_time == [0, 0, 0, 5, 5]
+
+    def test_time_series_starts_on_earliest_instant_with_mixed_offsets(self) -> None:
+        """An earlier local date in another offset does not move the start back."""
+        first = datetime(2025, 1, 2, 0, 30, tzinfo=timezone(timedelta(hours=2)))  # 2025-01-01 22:30 UTC
+        second = datetime(2025, 1, 1, 20, 0, tzinfo=timezone(timedelta(hours=-5)))  # 2025-01-02 01:00 UTC
+        children = [
+            _make_issue("T-1", "To Do", 1, created=second),
+            _make_issue("T-2", "To Do", 2, created=first),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.dates[0] == first.date()
+        assert m.cumulative_issues[:2] == [2, 2]
+        assert m.total_sp_over_time[:2] == [3, 3]
+
+    def test_time_series_ignores_future_issues(self) -> None:
+        now = datetime.now().astimezone()
+        children = [
+            _make_issue("T-1", "To Do", 1, created=now - timedelta(days=2)),
+            _make_issue("T-2", "To Do", 4, created=now + timedelta(days=3)),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.total_sp_over_time == [1, 1, 1]
+        assert m.cumulative_issues == [1, 1, 1]
+
+    def test_blocked_counts_only_open_issues(self) -> None:
+        children = [_make_issue("T-1"), _make_issue("T-2"), _make_issue("T-3", "Done")]
+        children[0].status = "Blocked"
+        children[2].status = "Blocked by vendor"
+        assert calculate_metrics(_make_epic(children)).blocked_issues == 1
+
+    def test_scope_change_boundary_is_exact(self) -> None:
+        first = datetime(2025, 3, 1, 9, 0, 0, 123_456, tzinfo=timezone.utc)
+        children = [
+            _make_issue("T-1", created=first),
+            _make_issue("T-2", created=first + timedelta(days=7)),
+            _make_issue("T-3", created=first + timedelta(days=7, microseconds=1)),
+            _make_issue("T-4", created=first + timedelta(days=1)),
+        ]
+        assert calculate_metrics(_make_epic(children)).scope_change_pct == 25.0
+
+    def test_velocity_counts_recent_done_sp(self) -> None:
+        now = datetime.now(tz=timezone.utc)
+        children = [
+            _make_issue("T-1", "Done", 5, created=now - timedelta(days=60), resolved=now - timedelta(days=3)),
+            _make_issue("T-2", "Done", 8, created=now - timedelta(days=60), resolved=now - timedelta(days=40)),
+            _make_issue("T-3", "To Do", 13, created=now - timedelta(days=60)),
+        ]
+        m = calculate_metrics(_make_epic(children))
+        assert m.velocity_sp_per_week == 5 / 4
+        assert m.forecast_date is not None
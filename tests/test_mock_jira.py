@@ -0,0 +1,98 @@
+"""End-to-end tests of JiraClient against the local mock Jira server."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from jira import JIRAError
+from mock_jira import MockJiraServer
+from synthetic import EPIC_LINK_FIELD, SP_FIELD
+
+from epic_report_generator.core.jira_client import JiraClient
+from epic_report_generator.core.rate_limiter import RateLimiter
+from epic_report_generator.services.auth_manager import AuthManager
+from epic_report_generator.services.config_manager import ConfigManager
+
+_EPICS = {"MOCK-1": 120, "MOCK-2": 35, "OTHER-7": 0}
+
+
+def _make_auth(tmp_path: Path) -> AuthManager:
+    mgr = ConfigManager()
+    mgr._dir = tmp_path
+    mgr._path = tmp_path / "config.json"
+    mgr.reset()
+    return AuthManager(mgr)
+
+
+@pytest.fixture
+def server() -> Iterator[MockJiraServer]:
+    with MockJiraServer(_EPICS, max_page_size=50) as srv:
+        yield srv
+
+
+@pytest.fixture
+def client(server: MockJiraServer, tmp_path: Path) -> JiraClient:
+    jira = JiraClient(_make_auth(tmp_path), limiter=RateLimiter(1000.0, burst=1000.0, max_rate=1000.0))
+    assert jira.connect_basic(server.url, "user@example.com", "token")
+    return jira
+
+
+class TestConnection:
+    def test_connect_and_myself(self, client: JiraClient, server: MockJiraServer) -> None:
+        assert client.get_myself()["displayName"] == "Mock User"
+        assert server.requests["myself"] == 1
+
+    def test_project_and_fields(self, client: JiraClient) -> None:
+        assert client.get_project_name("MOCK") == "Mock Project"
+        assert client.get_project_name("NOPE") is None
+        assert {f["id"] for f in client.fetch_fields()} >= {SP_FIELD, EPIC_LINK_FIELD}
+
+    def test_resolves_cloud_id(self, server: MockJiraServer) -> None:
+        assert JiraClient._resolve_cloud_id(server.url) == server.cloud_id
+
+
+class TestFetch:
+    def test_fetch_epic_follows_pages(self, client: JiraClient, server: MockJiraServer) -> None:
+        epic = client.fetch_epic("MOCK-1", SP_FIELD, EPIC_LINK_FIELD)
+        assert epic is not None
+        assert len(epic.children) == 120
+        assert len({c.key for c in epic.children}) == 120
+        # one header search plus three pages of at most 50 children
+        assert server.requests["search"] == 4
+
+    def test_fetch_epics_partitions_children(self, client: JiraClient) -> None:
+        # NOPE-1 makes the server reject the batched header search outright
+        epics = client.fetch_epics(["MOCK-1", "MOCK-2", "OTHER-7", "NOPE-1"], SP_FIELD, EPIC_LINK_FIELD)
+        assert [len(e.children) if e else None for e in epics] == [120, 35, 0, None]
+        assert all(e.summary for e in epics[:3])
+
+    def test_progress_counts_repeated_keys_once(self, client: JiraClient) -> None:
+        seen: list[tuple[str, int, int]] = []
+        epics = client.fetch_epics(
+            ["MOCK-1", "NOPE-9", "mock-2", "OTHER-7", "MOCK-1"], SP_FIELD, EPIC_LINK_FIELD,
+            on_progress=lambda key, done, total: seen.append((key, done, total)),
+        )
+        assert [e.key if e else None for e in epics] == ["MOCK-1", None, "MOCK-2", "OTHER-7", "MOCK-1"]
+        assert sorted(k for k, _, _ in seen) == ["MOCK-1", "MOCK-2", "NOPE-9", "OTHER-7"]
+        assert seen[-1][1:] == (4, 4)
+
+    def test_retries_after_429(self, client: JiraClient, server: MockJiraServer) -> None:
+        server.throttle_every, server.retry_after = 2, 0.01
+        epic = client.fetch_epic("MOCK-2", SP_FIELD, EPIC_LINK_FIELD)
+        assert epic is not None and len(epic.children) == 35
+        assert server.throttled > 0
+
+    def test_unknown_key_is_rejected(self, client: JiraClient) -> None:
+        with pytest.raises(JIRAError) as exc:
+            client._search_with_retry("key in (MOCK-1, NOPE-1)")
+        assert exc.value.status_code == 400
+        assert "NOPE-1" in str(exc.value)
+        assert client.validate_epic_key("MOCK-1")
+        assert not client.validate_epic_key("NOPE-1")
+
+    def test_unsupported_jql_is_rejected(self, client: JiraClient) -> None:
+        with pytest.raises(JIRAError) as exc:
+            client._search_with_retry("assignee = currentUser()")
+        assert exc.value.status_code == 400
@@ -0,0 +1,142 @@
+"""Tests for epic_report_generator.ui.page_view."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import patch
+
+import pytest
+from reportlab.pdfgen import canvas
+
+pytest.importorskip("PySide6.QtPdf")
+
+from PySide6.QtGui import QImage, QPixmap  # noqa: E402
+
+from epic_report_generator.ui.page_view import PdfPageView, _PixmapCache  # noqa: E402
+
+
+def _make_pdf(pages: int) -> bytes:
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=(1152, 648))
+    for i in range(pages):
+        pdf.drawString(100, 500, f"Page {i + 1}")
+        pdf.showPage()
+    pdf.save()
+    return buf.getvalue()
+
+
+@pytest.fixture
+def view(qtbot) -> PdfPageView:  # type: ignore[no-untyped-def]
+    widget = PdfPageView()
+    qtbot.addWidget(widget)
+    widget.resize(400, 300)
+    widget.show()
+    qtbot.waitExposed(widget)
+    return widget
+
+
+class TestPixmapCache:
+    def test_evicts_least_recently_used_over_budget(self, qtbot) -> None:  # type: ignore[no-untyped-def]
+        page_bytes = 10 * 10 * QPixmap(10, 10).depth() // 8
+        cache = _PixmapCache(max_bytes=page_bytes * 2)
+        for page in range(3):
+            cache.put(page, QPixmap(10, 10))
+            if page == 1:
+                cache.get(0)
+        assert 0 in cache and 2 in cache and 1 not in cache
+        assert cache.size_bytes <= cache.max_bytes
+
+
+def _paint(view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+    """Repaint the view and let queued paint and scheduling events run."""
+    view.viewport().update()
+    qtbot.wait(50)
+
+
+def _sharp(view: PdfPageView, page: int) -> bool:
+    pixmap = view._cache.get(page)
+    return pixmap is not None and view._fits(pixmap, page)
+
+
+class TestPdfPageView:
+    def test_only_renders_pages_near_viewport(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(60))
+        _paint(view, qtbot)
+        assert view.page_count() == 60
+        assert list(view.visible_pages()) == [0]
+        # the visible page plus its prefetched neighbour
+        qtbot.waitUntil(lambda: _sharp(view, 0) and _sharp(view, 1))
+        qtbot.wait(50)
+        assert sorted(view._cache._items) == [0, 1]
+
+    def test_scrolling_renders_new_pages(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(60))
+        bar = view.verticalScrollBar()
+        bar.setValue(bar.maximum())
+        _paint(view, qtbot)
+        assert 59 in view.visible_pages()
+        qtbot.waitUntil(lambda: _sharp(view, 59))
+        assert 0 not in view._cache
+
+    def test_placeholder_shown_before_sharp_page(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(3))
+        sizes: list[tuple[int, bool]] = []
+        view._worker.rendered.connect(
+            lambda _gen, page, image, preview: sizes.append((image.width(), preview)) if page == 0 else None
+        )
+        _paint(view, qtbot)
+        qtbot.waitUntil(lambda: _sharp(view, 0))
+        (low, first_preview), (high, _) = sizes[0], sizes[-1]
+        assert first_preview
+        assert low * 2 < high
+
+    def test_first_page_shown_once_per_document(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        shown: list[bool] = []
+        view.first_page_shown.connect(lambda: shown.append(_sharp(view, 0)))
+        for _ in range(2):
+            view.set_document(_make_pdf(3))
+            with qtbot.waitSignal(view.first_page_shown):
+                _paint(view, qtbot)
+            view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+            _paint(view, qtbot)
+            qtbot.waitUntil(lambda: _sharp(view, 2))
+        assert shown == [True, True]
+
+    def test_results_for_previous_document_are_ignored(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(3))
+        stale = view._generation
+        view.set_document(_make_pdf(3))
+        view._on_rendered(stale, 0, QImage(10, 10, QImage.Format.Format_RGB32), False)
+        assert 0 not in view._cache
+
+    def test_cache_bounded_by_memory(self, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view = PdfPageView(cache_bytes=1)
+        qtbot.addWidget(view)
+        view.resize(400, 300)
+        view.show()
+        qtbot.waitExposed(view)
+        view.set_document(_make_pdf(10))
+        _paint(view, qtbot)
+        qtbot.waitUntil(lambda: _sharp(view, 0) or _sharp(view, 1))
+        assert len(view._cache) == 1
+
+    def test_resize_is_debounced(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(5))
+        _paint(view, qtbot)
+        qtbot.waitUntil(lambda: _sharp(view, 0))
+        with patch.object(view._worker, "schedule", wraps=view._worker.schedule) as schedule:
+            for width in (420, 440, 460):
+                view.resize(width, 300)
+                view.viewport().update()
+                qtbot.wait(10)
+            assert schedule.call_count == 0
+            qtbot.waitUntil(lambda: schedule.call_count >= 1)
+        assert not view._resizing
+        qtbot.waitUntil(lambda: _sharp(view, 0))
+
+    def test_clearing_document_frees_pages(self, view: PdfPageView, qtbot) -> None:  # type: ignore[no-untyped-def]
+        view.set_document(_make_pdf(3))
+        _paint(view, qtbot)
+        view.set_document(None)
+        assert view.page_count() == 0
+        assert len(view._cache) == 0
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
 
 from epic_report_generator.core.data_models import (
     EpicData,
@@ -112,3 +116,50 @@ class TestGeneratePdf:
         report = ReportData(config=cfg, epics=[epic], metrics=[metrics])
         pdf = generate_pdf(report)
         assert pdf[:5] == b"%PDF-"
+
+    def test_progress_reported_per_chart_and_page(self) -> None:
+        events: list[tuple[str, int, int]] = []
+        generate_pdf(_make_report(num_epics=3), on_progress=lambda *e: events.append(e))
+
+        charts = [e for e in events if e[0] == "charts"]
+        pages = [e for e in events if e[0] == "pages"]
+        assert charts == [("charts", 1, 3), ("charts", 2, 3), ("charts", 3, 3)]
+        assert [done for _, done, _ in pages] == list(range(1, len(pages) + 1))
+        assert len(pages) >= 5
+        assert all(done <= total for _, done, total in pages)
+        assert events.index(charts[-1]) < events.index(pages[0])
+
+
+class TestVectorCharts:
+    """The vector chart backend should replace matplotlib images."""
+
+    def _report(self, backend: str) -> ReportData:
+        report = _make_report(num_epics=2)
+        report.config.chart_backend = backend
+        return report
+
+    def test_vector_pdf_is_valid_and_smaller(self) -> None:
+        vector = generate_pdf(self._report("vector"))
+        raster = generate_pdf(self._report("raster"))
+        assert vector[:5] == b"%PDF-"
+        assert len(vector) < len(raster) / 2
+
+    def test_vector_backend_does_not_render_pngs(self) -> None:
+        with patch(
+            "epic_report_generator.core.chart_generator.render_charts",
+        ) as render:
+            generate_pdf(self._report("vector"))
+        render.assert_not_called()
+
+    def test_vector_path_never_imports_matplotlib(self) -> None:
+        code = (
+            "import sys\n"
+            "sys.path.insert(0, 'tests')\n"
+            "from test_pdf_generator import _make_report\n"
+            "from epic_report_generator.core.pdf_generator import generate_pdf\n"
+            "r = _make_report(num_epics=1)\n"
+            "r.config.chart_backend = 'vector'\n"
+            "generate_pdf(r)\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib imported'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
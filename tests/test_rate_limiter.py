@@ -0,0 +1,117 @@
+"""Tests for epic_report_generator.core.rate_limiter."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from epic_report_generator.core.rate_limiter import RateLimiter, retry_after_seconds
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Iterator[_FakeClock]:
+    fake = _FakeClock()
+    with patch("epic_report_generator.core.rate_limiter.time", fake):
+        yield fake
+
+
+def _response(status: int = 200, **headers: str) -> SimpleNamespace:
+    return SimpleNamespace(status_code=status, headers=headers)
+
+
+class TestPacing:
+    def test_burst_is_free(self, clock: _FakeClock) -> None:
+        limiter = RateLimiter(rate=5, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.slept == []
+
+    def test_waits_for_refill_after_burst(self, clock: _FakeClock) -> None:
+        limiter = RateLimiter(rate=5, burst=1)
+        limiter.acquire()
+        limiter.acquire()
+        assert sum(clock.slept) == pytest.approx(0.2)
+
+    def test_backoff_pauses_acquire(self, clock: _FakeClock) -> None:
+        limiter = RateLimiter()
+        delay = limiter.backoff(0, retry_after=3)
+        limiter.acquire()
+        assert 3 <= delay <= 4
+        assert sum(clock.slept) == pytest.approx(delay)
+
+    def test_backoff_without_retry_after_grows(self, clock: _FakeClock) -> None:
+        limiter = RateLimiter()
+        with patch("epic_report_generator.core.rate_limiter.random.uniform", lambda a, b: b):
+            assert limiter.backoff(0) == 2
+            assert limiter.backoff(2) == 8
+            assert limiter.backoff(10) == 60
+
+
+class TestObserve:
+    def test_success_increases_rate(self) -> None:
+        limiter = RateLimiter(rate=10)
+        limiter.observe(_response(200))
+        assert limiter.rate > 10
+
+    def test_throttling_halves_rate(self) -> None:
+        for status in (429, 503):
+            limiter = RateLimiter(rate=10)
+            limiter.observe(_response(status))
+            assert limiter.rate == 5
+
+    def test_near_limit_slows_down(self) -> None:
+        limiter = RateLimiter(rate=10)
+        limiter.observe(_response(200, **{"X-RateLimit-NearLimit": "true"}))
+        assert limiter.rate < 10
+
+    def test_rate_capped_by_remaining_quota(self) -> None:
+        limiter = RateLimiter(rate=10)
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=10)).isoformat()
+        limiter.observe(_response(
+            200, **{"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": reset},
+        ))
+        assert limiter.rate == pytest.approx(2, rel=0.05)
+
+    def test_rate_stays_within_bounds(self) -> None:
+        limiter = RateLimiter(rate=1, min_rate=0.5, max_rate=2)
+        for _ in range(5):
+            limiter.observe(_response(429))
+        assert limiter.rate == 0.5
+        for _ in range(10):
+            limiter.observe(_response(200))
+        assert limiter.rate == 2
+
+
+class TestRetryAfterSeconds:
+    def test_missing(self) -> None:
+        assert retry_after_seconds(None) is None
+        assert retry_after_seconds({}) is None
+
+    def test_seconds(self) -> None:
+        assert retry_after_seconds({"Retry-After": "12"}) == 12
+
+    def test_http_date(self) -> None:
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        value = retry_after_seconds({"Retry-After": format_datetime(when, usegmt=True)})
+        assert value is not None and 28 <= value <= 30
+
+    def test_garbage(self) -> None:
+        assert retry_after_seconds({"Retry-After": "soon"}) is None
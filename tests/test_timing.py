@@ -0,0 +1,126 @@
+"""Tests for epic_report_generator.core.timing."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from mock_jira import MockJiraServer
+from synthetic import EPIC_LINK_FIELD, SP_FIELD
+
+from epic_report_generator.core import timing
+from epic_report_generator.core.data_models import ReportConfig, ReportData
+from epic_report_generator.core.jira_client import JiraClient
+from epic_report_generator.core.pdf_generator import generate_pdf
+from epic_report_generator.core.rate_limiter import RateLimiter
+from epic_report_generator.core.report_builder import build_report
+
+
+class TestTrace:
+    def test_nothing_recorded_without_active_trace(self) -> None:
+        trace = timing.Trace()
+        with timing.span("fetch"):
+            pass
+        timing.count("requests")
+        timing.record("charts.render", 0.5)
+        assert not trace.spans and not trace.counters
+
+    def test_breakdown_per_stage_and_epic(self) -> None:
+        trace = timing.Trace()
+        with timing.recording(trace):
+            with timing.span("fetch"):
+                timing.count("requests", 3)
+                timing.count("bytes", 2048)
+            with timing.span("metrics", epic="PROJ-1"):
+                pass
+            timing.record("charts.render", 0.25, epic="PROJ-1")
+            timing.record("charts.render", 0.5, epic="PROJ-2")
+        trace.finish()
+
+        stages = trace.stages()
+        assert list(stages) == ["fetch", "metrics", "charts.render"]
+        assert stages["charts.render"] == {"calls": 2, "seconds": 0.75}
+        assert trace.epics()["PROJ-1"]["charts.render"] == 0.25
+        assert set(trace.epics()) == {"PROJ-1", "PROJ-2"}
+
+        summary = trace.summary()
+        assert "fetch" in summary and "metrics" in summary
+        assert "charts.render" not in summary  # nested stages only in the full report
+        assert "3 request(s), 2.0 KB" in summary
+        assert "charts.render" in trace.report()
+
+    def test_recording_restores_previous_trace(self) -> None:
+        outer, inner = timing.Trace(), timing.Trace()
+        with timing.recording(outer):
+            with timing.recording(inner):
+                timing.count("retries")
+            timing.count("retries", 2)
+        assert inner.counters["retries"] == 1
+        assert outer.counters["retries"] == 2
+
+    def test_write_json(self, tmp_path: Path) -> None:
+        trace = timing.Trace()
+        with timing.recording(trace), timing.span("layout"):
+            pass
+        trace.finish()
+        path = tmp_path / "traces" / trace.filename
+        trace.write(path)
+        data = json.loads(path.read_text())
+        assert data["stages"]["layout"]["calls"] == 1
+        assert data["elapsed"] is not None
+        assert {"python", "platform", "cpus"} <= set(data["machine"])
+
+
+def test_report_run_against_mock_jira() -> None:
+    """Every pipeline stage, request and retry shows up in the trace."""
+    with MockJiraServer({"MOCK-1": 60, "MOCK-2": 10}, max_page_size=25,
+                        throttle_every=3, retry_after=0.01) as server:
+        jira = JiraClient(
+            SimpleNamespace(api_endpoint="instance", cloud_id=None),  # type: ignore[arg-type]
+            limiter=RateLimiter(1000.0, burst=1000.0, max_rate=1000.0),
+        )
+        assert jira.connect_basic(server.url, "user@example.com", "token")
+        config = ReportConfig(
+            project_key="MOCK", epic_keys=["MOCK-1", "MOCK-2"], chart_backend="vector",
+            story_points_field=SP_FIELD, epic_link_field=EPIC_LINK_FIELD,
+        )
+        trace = timing.Trace()
+        with timing.recording(trace):
+            generate_pdf(build_report(jira, config))
+
+    stages = trace.stages()
+    assert {"fetch", "fetch.page", "fetch.request", "metrics", "story", "charts", "charts.render",
+            "layout"} <= set(stages)
+    assert trace.counters["requests"] == sum(
+        n for endpoint, n in server.requests.items() if endpoint != "myself"
+    )
+    assert trace.counters["bytes"] > 0
+    assert trace.counters["retries"] == server.throttled > 0
+    assert set(trace.epics()) == {"MOCK-1", "MOCK-2"}
+
+
+def test_preview_stage_ends_when_first_page_is_shown(qtbot, tmp_path: Path) -> None:  # type: ignore[no-untyped-def]
+    """The panel finishes the trace only once the page view has drawn a page."""
+    pytest.importorskip("PySide6.QtPdf")
+    from epic_report_generator.ui.preview_panel import PreviewPanel
+
+    panel = PreviewPanel(MagicMock(), trace_dir=tmp_path)
+    qtbot.addWidget(panel)
+    panel.resize(600, 500)
+    panel.show()
+    qtbot.waitExposed(panel)
+    report = SimpleNamespace(epics=[object()], errors=[])
+    pdf = generate_pdf(ReportData(config=ReportConfig()))
+
+    trace = timing.Trace()
+    panel._on_timed(trace)
+    panel._on_generate_finished(report, pdf)
+    assert trace.elapsed is None
+    qtbot.waitUntil(lambda: trace.elapsed is not None)
+
+    assert trace.stages()["preview"]["calls"] == 1
+    assert "preview" in panel._status_label.text()
+    assert (tmp_path / trace.filename).exists()
@@ -0,0 +1,65 @@
+"""Tests for epic_report_generator.core.vector_chart."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from reportlab.graphics.shapes import Drawing, PolyLine, Polygon, String
+
+from epic_report_generator.core.data_models import EpicMetrics
+from epic_report_generator.core.vector_chart import _nice_ticks, _step_points, build_epic_drawing
+
+
+def _make_metrics(days: int = 30) -> EpicMetrics:
+    start = date.today() - timedelta(days=days)
+    return EpicMetrics(
+        dates=[start + timedelta(days=i) for i in range(days)],
+        total_sp_over_time=[float(i + 10) for i in range(days)],
+        completed_sp_over_time=[float(i) for i in range(days)],
+        cumulative_issues=list(range(1, days + 1)),
+        cumulative_unestimated=[1] * days,
+    )
+
+
+def _shapes(drawing: Drawing, kind: type) -> list:
+    return [s for s in drawing.getContents() if isinstance(s, kind)]
+
+
+class TestBuildEpicDrawing:
+    def test_returns_none_without_data(self) -> None:
+        assert build_epic_drawing(EpicMetrics(), width=400, height=200) is None
+
+    def test_draws_areas_lines_and_legend(self) -> None:
+        drawing = build_epic_drawing(_make_metrics(), width=400, height=200)
+        assert drawing is not None
+        assert (drawing.width, drawing.height) == (400, 200)
+        assert len(_shapes(drawing, Polygon)) == 2
+        lines = _shapes(drawing, PolyLine)
+        assert len(lines) == 2
+        assert lines[1].strokeDashArray
+        labels = {s.text for s in _shapes(drawing, String)}
+        assert {"Total Story Points", "Completed Story Points",
+                "Cumulative Issues", "Unestimated Issues"} <= labels
+
+    def test_dark_mode_uses_dark_face(self) -> None:
+        light = build_epic_drawing(_make_metrics(), width=400, height=200)
+        dark = build_epic_drawing(_make_metrics(), width=400, height=200, dark=True)
+        assert light.contents[0].fillColor != dark.contents[0].fillColor
+
+    def test_single_day_series(self) -> None:
+        m = _make_metrics(1)
+        assert build_epic_drawing(m, width=400, height=200) is not None
+
+
+class TestHelpers:
+    def test_step_points_hold_value_until_next_x(self) -> None:
+        assert _step_points([0, 1, 2], [5, 6, 7]) == [0, 5, 1, 5, 1, 6, 2, 6, 2, 7]
+
+    def test_nice_ticks_cover_max(self) -> None:
+        assert _nice_ticks(71) == [0, 20, 40, 60, 80]
+        assert _nice_ticks(0) == [0, 1]
+
+    def test_integer_ticks(self) -> None:
+        ticks = _nice_ticks(3, integer=True)
+        assert all(float(t).is_integer() for t in ticks)
+        assert ticks[-1] >= 3